@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import io
+import os
+import threading
+import zipfile
+from collections import OrderedDict
+from typing import BinaryIO, Callable, List, Optional, Tuple, TypeVar, Union
+
+from constants import ARCHIVE_EXTENSIONS, ARCHIVE_POOL_SIZE
+from utils import is_image_file, natural_sort_key
+
+_T = TypeVar("_T")
+
+# 압축 파일 안의 이미지는 "archive.zip!/폴더/이미지.jpg" 형태의 가상 경로로 다룬다.
+# 나머지 코드(캐시 키, 목록, 썸네일)는 이 경로를 일반 파일 경로처럼 문자열로만 쓴다.
+MEMBER_SEPARATOR = "!/"
+
+
+def is_archive_file(path: str) -> bool:
+    return os.path.splitext(path)[1].lower() in ARCHIVE_EXTENSIONS
+
+
+def member_path(archive_path: str, member: str) -> str:
+    return f"{archive_path}{MEMBER_SEPARATOR}{member}"
+
+
+def split_member_path(path: str) -> Optional[Tuple[str, str]]:
+    """가상 경로를 (압축 파일 경로, 멤버 이름)으로 나눈다. 일반 파일이면 None."""
+    index = path.find(MEMBER_SEPARATOR)
+    while index != -1:
+        archive_path = path[:index]
+        if is_archive_file(archive_path):
+            return archive_path, path[index + len(MEMBER_SEPARATOR):]
+        index = path.find(MEMBER_SEPARATOR, index + 1)
+    return None
+
+
+class _PooledArchive:
+    __slots__ = ("zip_file", "signature", "lock")
+
+    def __init__(self, zip_file: zipfile.ZipFile, signature: Tuple[int, int]):
+        self.zip_file = zip_file
+        self.signature = signature
+        self.lock = threading.Lock()
+
+
+class ArchivePool:
+    """열린 ZipFile 핸들 풀.
+
+    중앙 디렉토리는 열 때 한 번만 읽으므로, 핸들을 열어 둔 채 재사용하면 멤버
+    하나를 읽는 비용이 해당 로컬 헤더로의 seek + 읽기뿐이다. 압축 파일이 바뀌면
+    (mtime/크기) 핸들을 다시 연다.
+    """
+
+    def __init__(self, max_open: int = ARCHIVE_POOL_SIZE):
+        self._max_open = max_open
+        self._archives: "OrderedDict[str, _PooledArchive]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, archive_path: str) -> _PooledArchive:
+        st = os.stat(archive_path)
+        signature = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            pooled = self._archives.get(archive_path)
+            if pooled is not None and pooled.signature == signature:
+                self._archives.move_to_end(archive_path)
+                return pooled
+            if pooled is not None:
+                self._archives.pop(archive_path)
+                pooled.zip_file.close()
+            pooled = _PooledArchive(zipfile.ZipFile(archive_path), signature)
+            self._archives[archive_path] = pooled
+            while len(self._archives) > self._max_open:
+                _, oldest = self._archives.popitem(last=False)
+                # 다른 스레드가 읽는 중일 수 있으므로 그 읽기가 끝난 뒤 닫는다
+                with oldest.lock:
+                    oldest.zip_file.close()
+            return pooled
+
+    def _use(self, archive_path: str, action: Callable[[zipfile.ZipFile], _T]) -> _T:
+        for attempt in range(2):
+            pooled = self._get(archive_path)
+            with pooled.lock:
+                try:
+                    return action(pooled.zip_file)
+                except ValueError:
+                    # 꺼내 온 직후 풀에서 밀려나 닫힌 핸들: 한 번만 다시 연다
+                    if attempt:
+                        raise
+        raise AssertionError("unreachable")
+
+    def list_images(self, archive_path: str) -> List[str]:
+        """이미지 멤버의 가상 경로를 폴더 단위 자연 정렬 순서로 반환."""
+        names = [
+            info.filename for info in self._use(archive_path, zipfile.ZipFile.infolist)
+            if not info.is_dir() and is_image_file(info.filename)
+            and not os.path.basename(info.filename).startswith(".")  # macOS의 ._ 리소스 포크 등
+        ]
+        names.sort(key=lambda name: tuple(natural_sort_key(part) for part in name.split("/")))
+        return [member_path(archive_path, name) for name in names]
+
+    def member_signature(self, archive_path: str, member: str) -> Optional[Tuple[int, int]]:
+        """(압축 파일 mtime, 멤버 원본 크기): 압축 파일이 바뀌면 멤버 캐시도 무효화된다."""
+        try:
+            info = self._use(archive_path, lambda zip_file: zip_file.getinfo(member))
+            return os.stat(archive_path).st_mtime_ns, info.file_size
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            return None
+
+    def read(self, archive_path: str, member: str) -> bytes:
+        """멤버 하나를 압축 해제 없이 임의 접근으로 읽는다 (디스크에 풀지 않음)."""
+        try:
+            return self._use(archive_path, lambda zip_file: zip_file.read(member))
+        except (KeyError, ValueError, zipfile.BadZipFile) as e:
+            raise OSError(f"압축 파일에서 읽을 수 없습니다: {member_path(archive_path, member)} ({e})") from e
+
+    def close(self) -> None:
+        with self._lock:
+            for pooled in self._archives.values():
+                pooled.zip_file.close()
+            self._archives.clear()
+
+
+archive_pool = ArchivePool()
+
+
+def read_image_bytes(file_path: str) -> bytes:
+    """일반 파일이든 압축 파일 멤버든 인코딩된 바이트 전체를 읽는다."""
+    member = split_member_path(file_path)
+    if member is not None:
+        return archive_pool.read(*member)
+    with open(file_path, "rb") as f:
+        return f.read()
+
+
+def open_image_source(file_path: str) -> Union[str, BinaryIO]:
+    """Image.open에 넘길 대상: 일반 파일은 경로 그대로, 멤버는 메모리 버퍼."""
+    if split_member_path(file_path) is None:
+        return file_path
+    return io.BytesIO(read_image_bytes(file_path))
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from PIL import Image
+
+from constants import COLOR_MANAGEMENT, DISPLAY_COLOR_PROFILE, ICC_TRANSFORM_CACHE_SIZE
+
+try:
+    from PIL import ImageCms
+except ImportError:  # littleCMS 없이 빌드된 Pillow: 색 관리 없이 그대로 표시
+    ImageCms = None
+
+# 이 모듈은 Qt에 의존하지 않는다: 디코더 프로세스에서도 같은 변환을 쓴다 (캐시는 프로세스마다 따로).
+
+# 임베디드 프로파일 색 공간 → 변환할 수 있는 이미지 모드
+_PROFILE_MODES = {"RGB": ("RGB", "RGBA"), "CMYK": ("CMYK",)}
+
+_lock = threading.Lock()
+# (프로파일 해시, 입력 모드) → 변환 객체. None은 "변환 불필요/불가"를 기억해 둔 것
+_transforms: "OrderedDict[Tuple[bytes, str], Optional[object]]" = OrderedDict()
+_stats: Dict[str, int] = {"hits": 0, "builds": 0}
+_display_profile = None
+
+
+def _target_profile():
+    """표시 장치 프로파일: "system"이면 OS에 설정된 모니터 프로파일(Windows), 없으면 sRGB."""
+    global _display_profile
+    if _display_profile is None:
+        profile = None
+        if DISPLAY_COLOR_PROFILE == "system":
+            try:
+                profile = ImageCms.get_display_profile()
+            except (OSError, ImageCms.PyCMSError):
+                profile = None
+        _display_profile = profile or ImageCms.createProfile("sRGB")
+    return _display_profile
+
+
+def _build_transform(icc_profile: bytes, mode: str) -> Optional[object]:
+    try:
+        source = ImageCms.ImageCmsProfile(io.BytesIO(icc_profile))
+        color_space = source.profile.xcolor_space.strip()
+        if mode not in _PROFILE_MODES.get(color_space, ()):
+            return None
+        if color_space == "RGB" and DISPLAY_COLOR_PROFILE != "system" and (
+            source.profile.profile_description or ""
+        ).startswith("sRGB"):
+            return None  # 대부분의 사진: 이미 sRGB라 변환해도 결과가 같다
+        output_mode = "RGB" if mode == "CMYK" else mode
+        return ImageCms.buildTransform(
+            source, _target_profile(), mode, output_mode, renderingIntent=ImageCms.Intent.PERCEPTUAL
+        )
+    except (OSError, ValueError, ImageCms.PyCMSError):
+        return None  # 손상된 프로파일은 무시하고 그대로 표시
+
+
+def _get_transform(icc_profile: bytes, mode: str) -> Optional[object]:
+    key = (hashlib.sha1(icc_profile).digest(), mode)
+    with _lock:
+        if key in _transforms:
+            _transforms.move_to_end(key)
+            _stats["hits"] += 1
+            return _transforms[key]
+    # 변환 생성(수 ms~수십 ms)은 락 밖에서: 다른 스레드가 같은 키를 동시에 만들어도 결과는 같다
+    transform = _build_transform(icc_profile, mode)
+    with _lock:
+        _stats["builds"] += 1
+        _transforms[key] = transform
+        while len(_transforms) > ICC_TRANSFORM_CACHE_SIZE:
+            _transforms.popitem(last=False)
+    return transform
+
+
+def to_display_colors(image: Image.Image, icc_profile: Optional[bytes] = None) -> Image.Image:
+    """임베디드 ICC 프로파일에서 표시 프로파일(sRGB 또는 모니터)로 색을 변환.
+
+    축소가 끝난 렌디션에 적용해 비용이 원본이 아니라 화면 픽셀 수에 비례하게 한다.
+    변환 객체는 프로파일 해시로 LRU에 보관해, 같은 카메라 프로파일을 쓰는 폴더에서는
+    한 번만 만든다. 프로파일이 없거나 이미 sRGB면 이미지를 그대로 돌려준다.
+    """
+    icc_profile = icc_profile or image.info.get("icc_profile")
+    if not COLOR_MANAGEMENT or ImageCms is None or not icc_profile:
+        return image
+    transform = _get_transform(icc_profile, image.mode)
+    if transform is None:
+        return image
+    return ImageCms.applyTransform(image, transform)
+
+
+def transform_cache_summary() -> str:
+    with _lock:
+        return f"{len(_transforms)}/{ICC_TRANSFORM_CACHE_SIZE}개, 재사용 {_stats['hits']}회, 생성 {_stats['builds']}회"
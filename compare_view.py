@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+
+from PySide6.QtCore import QPointF, QRectF, Qt, QTimer, Signal
+from PySide6.QtGui import QColor, QPainter, QPixmap
+from PySide6.QtWidgets import QHBoxLayout, QWidget
+
+from constants import COMPARE_DETAIL_DELAY_MS, COMPARE_MAX_ZOOM, COMPARE_ZOOM_STEP, FRAME_RESIZE_MARGIN
+
+# 표시 방향 기준 정규화 영역 (left, top, right, bottom): 확대 보기에서 칸에 보이는 부분
+Region = Tuple[float, float, float, float]
+
+_LABEL_COLOR = QColor(255, 255, 255, 170)
+_LABEL_BACKGROUND = QColor(0, 0, 0, 120)
+
+
+class ComparePane(QWidget):
+    """비교 모드의 칸 하나.
+
+    칸 크기에 맞춘 렌디션(공유 리사이즈 캐시의 것)을 기본으로 그리고, 확대 중에는
+    보이는 영역만 원본에서 다시 리샘플링한 렌디션(detail)이 오면 그것으로 바꿔
+    그린다. 그 전까지는 기본 렌디션을 늘려 그려 확대/이동이 끊기지 않게 한다.
+    """
+
+    def __init__(self, view: "CompareView"):
+        super().__init__(view)
+        self._view = view
+        self.file_path: Optional[str] = None
+        self.pixmap: Optional[QPixmap] = None
+        self.detail: Optional[QPixmap] = None
+        self.detail_region: Optional[Region] = None
+        self.message = ""
+        self._drag_from: Optional[QPointF] = None
+        self.setMouseTracking(True)
+        self.setMinimumSize(1, 1)
+
+    def set_image(self, file_path: Optional[str], pixmap: Optional[QPixmap]) -> None:
+        if file_path != self.file_path:
+            self.detail = None
+            self.detail_region = None
+        self.file_path = file_path
+        self.pixmap = pixmap
+        self.message = "로딩 중..." if file_path else ""
+        self.update()
+
+    def show_message(self, message: str) -> None:
+        self.message = message
+        self.update()
+
+    def set_detail(self, file_path: str, region: Region, pixmap: QPixmap) -> None:
+        if file_path != self.file_path:
+            return
+        self.detail = pixmap
+        self.detail_region = region
+        self.update()
+
+    def fitted_size(self) -> Tuple[float, float]:
+        """확대 배율 1(칸에 맞춤)일 때 이미지가 차지하는 논리 픽셀 크기."""
+        dpr = self.pixmap.devicePixelRatio() or 1.0
+        return self.pixmap.width() / dpr, self.pixmap.height() / dpr
+
+    def visible_region(self) -> Optional[Tuple[Region, QRectF]]:
+        """현재 배율/위치에서 보이는 이미지 영역과, 그 영역을 칸 안에 그릴 사각형."""
+        if self.pixmap is None or self.pixmap.isNull():
+            return None
+        fitted_width, fitted_height = self.fitted_size()
+        zoom = self._view.zoom
+        center_x, center_y = self._view.center
+        box_width = min(1.0, self.width() / (fitted_width * zoom))
+        box_height = min(1.0, self.height() / (fitted_height * zoom))
+        left = min(max(center_x - box_width / 2, 0.0), 1.0 - box_width)
+        top = min(max(center_y - box_height / 2, 0.0), 1.0 - box_height)
+        draw_width = box_width * fitted_width * zoom
+        draw_height = box_height * fitted_height * zoom
+        target = QRectF((self.width() - draw_width) / 2, (self.height() - draw_height) / 2, draw_width, draw_height)
+        return (left, top, left + box_width, top + box_height), target
+
+    def paintEvent(self, event) -> None:
+        painter = QPainter(self)
+        visible = self.visible_region()
+        if visible is None:
+            painter.setPen(_LABEL_COLOR)
+            painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, self.message)
+            return
+        region, target = visible
+        if self.detail is not None and self.detail_region == region:
+            painter.drawPixmap(target, self.detail, QRectF(self.detail.rect()))
+        else:
+            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+            width, height = self.pixmap.width(), self.pixmap.height()
+            source = QRectF(
+                region[0] * width, region[1] * height,
+                (region[2] - region[0]) * width, (region[3] - region[1]) * height,
+            )
+            painter.drawPixmap(target, self.pixmap, source)
+        if self.file_path:
+            label = self.file_path.replace("\\", "/").rsplit("/", 1)[-1]
+            metrics = painter.fontMetrics()
+            label_rect = QRectF(8, self.height() - metrics.height() - 12, metrics.horizontalAdvance(label) + 12, metrics.height() + 4)
+            painter.fillRect(label_rect, _LABEL_BACKGROUND)
+            painter.setPen(_LABEL_COLOR)
+            painter.drawText(label_rect, Qt.AlignmentFlag.AlignCenter, label)
+
+    def _near_window_edge(self, position: QPointF) -> bool:
+        # 프레임리스 창의 가장자리 크기 조절은 창이 처리하도록 이벤트를 넘긴다
+        window = self.window()
+        point = self.mapTo(window, position.toPoint())
+        return (
+            point.x() < FRAME_RESIZE_MARGIN or point.y() < FRAME_RESIZE_MARGIN
+            or point.x() > window.width() - FRAME_RESIZE_MARGIN or point.y() > window.height() - FRAME_RESIZE_MARGIN
+        )
+
+    def wheelEvent(self, event) -> None:
+        steps = event.angleDelta().y() / 120
+        if steps:
+            self._view.zoom_at(self, event.position(), steps)
+        event.accept()
+
+    def mousePressEvent(self, event) -> None:
+        if event.button() == Qt.MouseButton.LeftButton and self._view.zoom > 1.0 and not self._near_window_edge(event.position()):
+            self._drag_from = event.position()
+            event.accept()
+            return
+        event.ignore()  # 확대하지 않았으면 평소처럼 창 이동/크기 조절
+
+    def mouseMoveEvent(self, event) -> None:
+        if self._drag_from is None:
+            event.ignore()
+            return
+        delta = event.position() - self._drag_from
+        self._drag_from = event.position()
+        self._view.pan_by(self, delta.x(), delta.y())
+        event.accept()
+
+    def mouseReleaseEvent(self, event) -> None:
+        if self._drag_from is None:
+            event.ignore()
+            return
+        self._drag_from = None
+        event.accept()
+
+    def mouseDoubleClickEvent(self, event) -> None:
+        if self._view.zoom > 1.0:
+            self._view.reset_zoom()
+            event.accept()
+            return
+        event.ignore()  # 배율 1에서는 창의 전체 화면 전환
+
+
+class CompareView(QWidget):
+    """N칸 나란히 비교 보기. 모든 칸이 확대 배율과 보는 위치를 공유한다.
+
+    보는 위치는 이미지별 픽셀이 아니라 정규화 좌표(0~1)라서, 해상도가 조금 다른
+    연속 촬영 사진도 같은 부분을 나란히 보게 된다. 확대/이동이 COMPARE_DETAIL_DELAY_MS
+    동안 멈추면 detail_wanted를 보내, 창이 칸마다 보이는 영역을 원본 품질로 렌더링한다.
+    """
+
+    detail_wanted = Signal()
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self.panes: List[ComparePane] = []
+        self.zoom = 1.0
+        self.center = (0.5, 0.5)
+        self._layout = QHBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+        self._layout.setSpacing(2)
+        self._detail_timer = QTimer(self)
+        self._detail_timer.setSingleShot(True)
+        self._detail_timer.timeout.connect(self.detail_wanted)
+
+    def set_pane_count(self, count: int) -> None:
+        while len(self.panes) < count:
+            pane = ComparePane(self)
+            self._layout.addWidget(pane, 1)
+            self.panes.append(pane)
+        while len(self.panes) > count:
+            pane = self.panes.pop()
+            self._layout.removeWidget(pane)
+            pane.deleteLater()
+
+    def pane_size(self) -> Tuple[int, int]:
+        """칸 하나의 논리 픽셀 크기 (아직 배치 전이면 칸 수로 나눈 추정치)."""
+        spacing = self._layout.spacing() * max(0, len(self.panes) - 1)
+        return max(1, (self.width() - spacing) // max(1, len(self.panes))), max(1, self.height())
+
+    def reset_zoom(self) -> None:
+        self.zoom = 1.0
+        self.center = (0.5, 0.5)
+        self._detail_timer.stop()
+        for pane in self.panes:
+            pane.update()
+
+    def zoom_at(self, pane: ComparePane, position: QPointF, steps: float) -> None:
+        """pane 위 position에 있는 이미지 지점이 그 자리에 머물도록 확대/축소."""
+        visible = pane.visible_region()
+        if visible is None:
+            return
+        zoom = min(max(self.zoom * COMPARE_ZOOM_STEP ** steps, 1.0), COMPARE_MAX_ZOOM)
+        if zoom == self.zoom:
+            return
+        if zoom == 1.0:
+            self.reset_zoom()
+            return
+        (left, top, right, bottom), target = visible
+        point_x = left + min(max((position.x() - target.x()) / target.width(), 0.0), 1.0) * (right - left)
+        point_y = top + min(max((position.y() - target.y()) / target.height(), 0.0), 1.0) * (bottom - top)
+        ratio = self.zoom / zoom
+        self.zoom = zoom
+        self._set_center(pane, point_x + (self.center[0] - point_x) * ratio, point_y + (self.center[1] - point_y) * ratio)
+
+    def pan_by(self, pane: ComparePane, dx: float, dy: float) -> None:
+        fitted_width, fitted_height = pane.fitted_size()
+        self._set_center(
+            pane, self.center[0] - dx / (fitted_width * self.zoom), self.center[1] - dy / (fitted_height * self.zoom)
+        )
+
+    def _set_center(self, pane: ComparePane, center_x: float, center_y: float) -> None:
+        # 조작한 칸 기준으로 보이는 영역이 이미지 밖으로 나가지 않게 묶는다
+        fitted_width, fitted_height = pane.fitted_size()
+        half_width = min(1.0, pane.width() / (fitted_width * self.zoom)) / 2
+        half_height = min(1.0, pane.height() / (fitted_height * self.zoom)) / 2
+        self.center = (
+            min(max(center_x, half_width), 1.0 - half_width),
+            min(max(center_y, half_height), 1.0 - half_height),
+        )
+        for each in self.panes:
+            each.update()
+        self._detail_timer.start(COMPARE_DETAIL_DELAY_MS)
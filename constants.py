@@ -3,6 +3,8 @@ APP_DISPLAY_NAME = "Minimal Image Viewer"
 ORG_NAME = "ImageViewer"
 
 SUPPORTED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp", ".tiff", ".tif"}
+ARCHIVE_EXTENSIONS = {".zip", ".cbz"}  # 안의 이미지를 풀지 않고 바로 탐색할 수 있는 압축 형식
+ARCHIVE_POOL_SIZE = 4         # 열어 둔 채 재사용할 압축 파일 핸들 수
 
 DEFAULT_WINDOW_WIDTH = 1000
 DEFAULT_WINDOW_HEIGHT = 700
@@ -12,7 +14,85 @@ MIN_WINDOW_HEIGHT = 300
 
 MAX_CACHE_SIZE = 15          # 원본 이미지 캐시 최대 개수
 MAX_MEMORY_MB = 200          # 원본 이미지 캐시 최대 메모리(MB)
+MAX_BYTES_CACHE_SIZE = 80     # 인코딩된 파일 바이트 캐시 최대 개수
+MAX_BYTES_CACHE_MB = 256      # 인코딩된 파일 바이트 캐시 최대 메모리(MB)
+BYTES_PREFETCH_WINDOW = 8     # 이동 방향으로 파일 바이트를 미리 읽어 둘 개수
+IO_READAHEAD_BEHIND = 2       # 이동 반대 방향으로 미리 읽어 둘 개수
+IO_READAHEAD_HORIZON_S = 3.0  # 한 번의 미리 읽기 양: 측정 처리량으로 이 시간 안에 읽을 수 있는 만큼
+IO_READ_CHUNK_BYTES = 1024 * 1024  # 미리 읽기 청크 크기 (이 단위로 취소 여부 확인)
+IO_SLOW_STAT_MS = 5.0         # stat 평균 지연이 이 이상이면 느린 저장소(NAS/SMB 등)로 판단
+IO_SLOW_THROUGHPUT_MBPS = 40  # 읽기 처리량이 이보다 낮아도 느린 저장소로 판단
+IO_SLOW_FS_WINDOW_FACTOR = 3  # 느린 저장소에서 미리 읽기 창/시간을 늘리는 배수
+SIGNATURE_TTL_S = 2.0         # 파일 자체를 감시하지 않는 파일 서명(stat 결과)을 재사용할 시간 (제자리 수정은 폴더 감시에 안 잡힌다)
+SIGNATURE_WATCHED_TTL_S = 30.0  # 파일 감시 중인 파일(현재 이미지, 프리페치 범위)의 서명 재사용 시간 (감시가 놓친 경우의 안전망)
+STREAM_DECODE_BAND_MB = 16    # 원본 캐시 예산을 넘는 거대 이미지를 띠 단위로 축소 디코딩할 때 띠 하나의 크기(MB)
 MAX_RESIZE_CACHE_SIZE = 20   # 창 크기별 리사이즈 결과 캐시 최대 개수
+MAX_PIXMAP_CACHE_MB = 128    # 바로 표시할 수 있게 변환해 둔 QPixmap 계층 최대 메모리(MB)
+PIXMAP_CACHE_NEIGHBORS = 1   # 현재 이미지 앞뒤로 미리 디코딩·픽스맵 변환해 둘 이미지 수
+
+TONE_MAP_MODE = "percentile"     # 16비트/실수 이미지 정규화: "percentile" 또는 "auto_levels"(최소~최대)
+TONE_MAP_LOW_PERCENTILE = 0.5    # percentile 모드에서 검게 처리할 하위 백분위
+TONE_MAP_HIGH_PERCENTILE = 99.5  # percentile 모드에서 희게 처리할 상위 백분위
+
+COLOR_MANAGEMENT = True          # 임베디드 ICC 프로파일(Display P3, AdobeRGB 등)을 표시 프로파일로 변환
+DISPLAY_COLOR_PROFILE = "srgb"   # 변환 대상: "srgb" 또는 "system"(OS 모니터 프로파일, 현재 Windows만)
+ICC_TRANSFORM_CACHE_SIZE = 8     # 프로파일 해시별로 재사용할 ICC 변환 객체 수
+
+SLIDESHOW_INTERVAL_MS = 5000       # 슬라이드쇼 기본 전환 간격
+SLIDESHOW_LOOKAHEAD = 2            # 마감 시각에 맞춰 미리 디코딩할 다음 슬라이드 수
+SLIDESHOW_SAFETY_FACTOR = 1.5      # 디코드 시간 추정치에 곱하는 여유 배수
+SLIDESHOW_SAFETY_MARGIN_MS = 200   # 추정치와 별도로 마감 전에 확보할 여유 시간
+SLIDESHOW_DEFAULT_MS_PER_MB = 60   # 측정값이 없을 때 가정하는 MB당 디코드 시간
+
+THUMBNAIL_SIZE = 160          # 썸네일 격자 셀의 이미지 최대 변 길이(px)
+THUMBNAIL_CELL_PADDING = 16   # 썸네일 셀 여백(px)
+THUMBNAIL_BATCH_SIZE = 8      # 백그라운드 작업 하나가 처리할 썸네일 수
+THUMBNAIL_WORKERS = 2         # 썸네일 전용 스레드 수 (메인 디코드와 경쟁하지 않도록 작게)
+THUMBNAIL_CACHE_MIN = 64      # 썸네일 캐시 최소 개수
+THUMBNAIL_CACHE_PAGES = 3     # 보이는 셀 수의 몇 배까지 썸네일을 캐시할지
+
+SCRUBBER_SETTLE_MS = 150        # 스크러버 핸들이 이 시간 동안 멈추면 원본 품질 로드를 확정
+SCRUBBER_PREVIEW_NEIGHBORS = 8  # 드래그 중 핸들 주변으로 미리 만들어 둘 썸네일 수(한쪽 기준)
+
+RECURSIVE_DEFAULT = False     # 하위 폴더까지 한 목록으로 탐색할지 기본값
+SCAN_WORKERS = 4              # 하위 폴더 병렬 스캔 스레드 수
+SCAN_FLUSH_MS = 200           # 스캔 결과를 목록에 합치는 주기(ms)
+
+DEFAULT_SORT_MODE = "name"    # "name" | "date_taken" | "mtime" | "size" | "dimensions"
+METADATA_WORKERS = 4          # 메타데이터(헤더) 색인 스레드 수
+METADATA_BATCH_SIZE = 64      # 색인 작업 하나가 처리할 파일 수
+
+DECODE_BACKEND = "thread"    # "thread": QThreadPool에서 디코딩, "process": 디코더 프로세스 풀 사용
+DECODE_PROCESS_WORKERS = 0   # 디코더 프로세스 수 (0이면 CPU 코어 수 - 1)
+DECODER_ENGINE = "auto"      # 스레드 디코딩 엔진: "auto"(형식·크기별 측정으로 선택) | "pillow" | "qt" | "turbojpeg"(설치 시)
+DECODER_CALIBRATION_SAMPLES = 3  # 자동 선택 전에 형식·크기 등급마다 각 엔진을 측정할 횟수
+
+RESAMPLE_RAPID_NAV_PER_S = 4.0   # 초당 이만큼 이상 넘기면 빠른 탐색으로 보고 빠른 리샘플링 필터를 허용
+RESAMPLE_RAPID_BUDGET_MS = 40    # 빠른 탐색 중 한 장의 디코드+리샘플링에 쓸 목표 시간
+RESAMPLE_DWELL_MS = 250          # 마지막 이동 후 이만큼 머물면 빠른 렌디션을 LANCZOS로 다시 렌더링
+
+COMPARE_PANES = 2              # 비교 모드(C 키) 기본 칸 수
+COMPARE_MAX_PANES = 4          # 비교 모드 최대 칸 수
+COMPARE_MAX_ZOOM = 16.0        # 비교 모드에서 칸에 맞춘 크기 대비 최대 확대 배율
+COMPARE_ZOOM_STEP = 1.25       # 마우스 휠 한 칸당 확대 배율
+COMPARE_DETAIL_DELAY_MS = 120  # 확대/이동이 이만큼 멈추면 보이는 영역을 원본에서 다시 렌더링
+
+SIMILAR_WORKERS = 4            # 비슷한 이미지 찾기(dHash) 스레드 수
+SIMILAR_BATCH_SIZE = 32        # 해시 작업 하나가 축소 디코딩해 한꺼번에 해시할 파일 수
+SIMILAR_DECODE_SIZE = 64       # 해시 입력을 만들 축소 디코딩 크기(px, 썸네일과 같은 경로)
+SIMILAR_MAX_DISTANCE = 6       # 64비트 dHash 해밍 거리가 이 이하면 비슷한 이미지로 묶음
+
+MEMORY_AUDIT_ENABLED = False     # 디버그용: True면 실행 중에도 주기적으로 RSS 증가를 계층 예산과 비교 (기본은 Memory Info를 열 때만)
+MEMORY_AUDIT_INTERVAL_MS = 5000  # 캐시 계층 사용량 표본 주기 (탐색 통계의 최대 사용량, 감사를 켰으면 RSS 비교도)
+MEMORY_AUDIT_OVERHEAD_MB = 160   # 계층 예산 합 외에 허용할 고정 여유(Qt 백버퍼, 디코드 작업 메모리, 스레드 스택 등)
+MEMORY_AUDIT_TRACE_PYTHON = False  # True면 tracemalloc으로 파이썬 할당 증가 위치도 메모리 정보에 표시 (느려짐)
+
+TELEMETRY_LATENCY_SAMPLES = 2000  # 형식별로 보관할 최근 탐색 지연 측정값 수 (백분위수 계산용)
+TELEMETRY_PANEL_REFRESH_MS = 500  # 통계 패널(I 키) 갱신 주기
+TELEMETRY_KEEP_FILES = 20         # 종료 시 저장하는 세션 통계 JSON을 최근 몇 개까지 남길지
+
+SESSION_RESTORE = True       # 파일 없이 실행하면 지난 세션의 파일/위치로 돌아가기 (창 위치/크기는 항상 복원)
+SESSION_WARM_RENDITIONS = 8  # 종료 시 기억했다가 다음 실행에서 미리 렌더링할 최근 렌디션 수
 
 RESIZE_DEBOUNCE_MS = 150     # 창 크기 변경 시 리사이즈를 재실행하기까지의 디바운스 간격
 CONTROL_FADE_DURATION_MS = 210
@@ -0,0 +1,421 @@
+from __future__ import annotations
+
+import bisect
+import io
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from PIL import Image
+from PIL.ImageQt import ImageQt
+from PySide6.QtCore import QBuffer, QByteArray, QIODevice, QSize, QStandardPaths
+from PySide6.QtGui import QColorSpace, QImage, QImageIOHandler, QImageReader
+
+from constants import (
+    APP_NAME,
+    COLOR_MANAGEMENT,
+    DECODER_CALIBRATION_SAMPLES,
+    DECODER_ENGINE,
+    DISPLAY_COLOR_PROFILE,
+    MAX_MEMORY_MB,
+    ORG_NAME,
+)
+from image_cache import BytesCache, ImageCache
+from orientation import jpeg_orientation, set_exif_orientation, swaps_axes
+from rendering import FULL_QUALITY, crop_region, decode_image, decode_reduced, fit_size, render_image
+from resample_policy import ResamplePolicy
+from signature_cache import Signature
+
+try:
+    from turbojpeg import TJPF_RGB, TurboJPEG
+except ImportError:  # 선택 의존성: 설치되어 있을 때만 엔진 후보가 된다
+    TurboJPEG = None
+
+_EWMA_ALPHA = 0.3
+_SIZE_CLASSES_MB = (1, 4, 16)  # 파일 크기 등급 경계: ~1MB, ~4MB, ~16MB, 그 이상
+_CALIBRATION_VERSION = 1
+_JPEG_EXTENSIONS = (".jpg", ".jpeg")
+
+
+class RenderJob:
+    """엔진 하나가 처리할 렌디션 요청. 파일 바이트는 필요할 때 한 번만 읽는다."""
+
+    def __init__(
+        self,
+        file_path: str,
+        signature: Signature,
+        target_size: Tuple[int, int],
+        bytes_cache: BytesCache,
+        draft: bool = False,
+        rapid: bool = False,
+        region: Optional[Tuple[float, float, float, float]] = None,
+    ):
+        self.file_path = file_path
+        self.signature = signature
+        self.target_size = target_size  # 물리 픽셀 기준
+        self.draft = draft
+        self.rapid = rapid
+        self.region = region
+        self.extension = os.path.splitext(file_path)[1].lower()
+        self._bytes_cache = bytes_cache
+        self._data: Optional[bytes] = None
+
+    def data(self) -> bytes:
+        if self._data is None:
+            self._data = self._bytes_cache.load(self.file_path, self.signature)
+        return self._data
+
+
+class EngineResult:
+    def __init__(self, qimage: QImage, resample: str, decoded: bool):
+        self.qimage = qimage
+        self.resample = resample  # 쓰인 리샘플링 필터 이름: FULL_QUALITY면 원본 품질 렌디션
+        self.decoded = decoded    # 실제로 파일을 디코딩했는지 (원본 캐시 적중이면 False: 보정에 쓰지 않는다)
+
+
+class DecoderEngine:
+    """파일 바이트 → 화면 크기 렌디션(QImage)을 만드는 디코드 엔진.
+
+    render가 None을 반환하면 이 파일은 처리할 수 없다는 뜻이고, 호출자는 Pillow
+    엔진으로 다시 시도한다. 워커 스레드에서 호출되므로 스레드 세이프해야 한다.
+    """
+
+    name = ""
+    label = ""
+
+    def supports(self, job: RenderJob) -> bool:
+        raise NotImplementedError
+
+    def render(self, job: RenderJob) -> Optional[EngineResult]:
+        raise NotImplementedError
+
+
+class PillowEngine(DecoderEngine):
+    """기본 엔진: 원본 캐시 + Pillow 디코드 + render_image (LANCZOS, ICC, EXIF 방향).
+
+    모든 형식과 확대 영역 렌더링, 거대 이미지 띠 디코딩을 처리하는 유일한 엔진이다.
+    같은 원본을 여러 스레드가 동시에 디코딩하지 않도록(예: 로드 중 창 크기 변경으로 다른
+    크기의 렌디션이 함께 요청될 때) 원본 디코드는 파일·서명마다 한 스레드만 맡고,
+    나머지는 그 디코드가 원본 캐시에 들어오기를 기다렸다가 리샘플링만 한다.
+    """
+
+    name = "pillow"
+    label = "Pillow"
+
+    def __init__(self, raw_cache: ImageCache, resample_policy: ResamplePolicy):
+        self._raw_cache = raw_cache
+        self._resample_policy = resample_policy
+        self._decoding: Dict[str, threading.Event] = {}  # 원본 캐시 키 → 디코드가 끝나면 set
+        self._decoding_lock = threading.Lock()
+
+    def supports(self, job: RenderJob) -> bool:
+        return True
+
+    def render(self, job: RenderJob) -> EngineResult:
+        cache_key = f"{job.file_path}::{job.signature}"
+        decode_ms = 0.0
+        image = self._raw_cache.get(cache_key)
+        claim = None
+        if image is None and not job.draft:
+            image, claim = self._wait_or_claim(cache_key)
+        decoded = image is None
+        if image is None:
+            try:
+                image, decode_ms = self._decode(job, cache_key)
+            finally:
+                if claim is not None:
+                    with self._decoding_lock:
+                        del self._decoding[cache_key]
+                    claim.set()
+        if job.region is not None:
+            image = crop_region(image, job.region)
+
+        if job.draft:
+            return EngineResult(ImageQt(render_image(image, job.target_size, draft=True)).copy(), "bilinear", decoded)
+        resample = self._resample_policy.choose(image.size, job.target_size, job.rapid, decode_ms)
+        started = time.perf_counter()
+        rendered = render_image(image, job.target_size, resample=resample)
+        self._resample_policy.record(resample, image.size, job.target_size, (time.perf_counter() - started) * 1000)
+        return EngineResult(ImageQt(rendered).copy(), resample, decoded)  # copy()로 PIL 버퍼에서 완전히 분리
+
+    def is_cached(self, job: RenderJob) -> bool:
+        """원본이 원본 캐시에 있거나 다른 스레드가 지금 디코딩 중이면 True (이 엔진이 맡아야 한다)."""
+        cache_key = f"{job.file_path}::{job.signature}"
+        with self._decoding_lock:
+            if cache_key in self._decoding:
+                return True
+        return self._raw_cache.contains(cache_key)
+
+    def _wait_or_claim(self, cache_key: str) -> Tuple[Optional[Image.Image], Optional[threading.Event]]:
+        """다른 스레드가 같은 원본을 디코딩 중이면 끝날 때까지 기다려 원본 캐시에서 꺼낸다.
+
+        아무도 디코딩하지 않으면 이 스레드가 맡는다는 표시(이벤트)를 돌려준다. 기다린
+        디코드가 원본 캐시에 넣지 않는 종류(거대 이미지 축소 디코딩, 예산 초과)였으면
+        (None, None)이 되어 이 스레드가 따로 디코딩한다.
+        """
+        with self._decoding_lock:
+            pending = self._decoding.get(cache_key)
+            if pending is None:
+                claim = threading.Event()
+                self._decoding[cache_key] = claim
+                return None, claim
+        pending.wait()
+        return self._raw_cache.get(cache_key), None
+
+    def _decode(self, job: RenderJob, cache_key: str) -> Tuple[Image.Image, float]:
+        started = time.perf_counter()
+        data = job.data()
+        # 원본 캐시 예산을 넘는 거대 이미지는 띠 단위로 줄여 읽는다 (확대 영역은 원본 해상도가 필요).
+        # 축소 디코딩 결과는 원본이 아니므로 원본 캐시에 넣지 않는다
+        image = None if job.region is not None else decode_reduced(job.file_path, job.target_size, data)
+        if image is None and job.draft:
+            image = decode_image(job.file_path, draft_size=job.target_size, data=data)
+        elif image is None:
+            image = decode_image(job.file_path, data=data)
+            self._raw_cache.put(cache_key, image)
+        return image, (time.perf_counter() - started) * 1000
+
+
+class QtReaderEngine(DecoderEngine):
+    """QImageReader.setScaledSize로 디코드와 축소를 한 번에 해 QImage를 바로 만든다.
+
+    JPEG는 libjpeg의 DCT 단계 축소로 필요한 해상도만 디코딩하고, PIL → ImageQt 변환도
+    없다. 축소는 Qt의 부드러운 축소(LANCZOS보다 약간 무르다)를 이 엔진의 원본 품질로
+    본다. 색은 임베디드 프로파일에서 sRGB로 변환하므로 표시 프로파일이 sRGB일 때만 쓴다.
+    """
+
+    name = "qt"
+    label = "Qt (QImageReader)"
+
+    _EXTENSIONS = {".jpg", ".jpeg", ".png", ".bmp", ".gif", ".webp"}
+    # Pillow 쪽은 톤 매핑/CMYK 변환을 따로 하므로, 이런 픽셀 형식은 Pillow에 맡긴다
+    _DECLINED_FORMATS = {
+        QImage.Format.Format_Grayscale16,
+        QImage.Format.Format_RGBA64,
+        QImage.Format.Format_RGBX64,
+        QImage.Format.Format_RGBA64_Premultiplied,
+    }
+    _DISPLAY_FORMATS = {
+        QImage.Format.Format_RGB32,
+        QImage.Format.Format_ARGB32,
+        QImage.Format.Format_ARGB32_Premultiplied,
+        QImage.Format.Format_RGB888,
+        QImage.Format.Format_RGBA8888,
+        QImage.Format.Format_Grayscale8,
+    }
+
+    def __init__(self):
+        formats = {bytes(name).decode("ascii", "ignore").lower() for name in QImageReader.supportedImageFormats()}
+        self._extensions = {extension for extension in self._EXTENSIONS if extension[1:] in formats}
+        if DISPLAY_COLOR_PROFILE != "srgb":
+            self._extensions = set()
+        self._srgb = QColorSpace(QColorSpace.NamedColorSpace.SRgb)
+
+    def supports(self, job: RenderJob) -> bool:
+        return job.extension in self._extensions and job.region is None
+
+    def _declined(self, image_format: QImage.Format) -> bool:
+        return image_format in self._DECLINED_FORMATS or "CMYK" in image_format.name
+
+    def render(self, job: RenderJob) -> Optional[EngineResult]:
+        buffer = QBuffer()
+        buffer.setData(QByteArray(job.data()))
+        buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+        reader = QImageReader(buffer)
+        reader.setAutoTransform(True)
+        size = reader.size()
+        if not size.isValid() or self._declined(reader.imageFormat()):
+            return None
+        # JPEG 외에는 원본 해상도로 디코딩한 뒤 줄이므로, 원본 캐시 예산을 넘는 거대 이미지는 띠 디코딩 경로로
+        if job.extension not in _JPEG_EXTENSIONS and size.width() * size.height() * 4 > MAX_MEMORY_MB * 1024 * 1024:
+            return None
+        box_width, box_height = job.target_size
+        if reader.transformation() & QImageIOHandler.Transformation.TransformationRotate90:
+            box_width, box_height = box_height, box_width
+        reader.setScaledSize(QSize(*fit_size(size.width(), size.height(), box_width, box_height)))
+        reader.setQuality(0 if job.draft else 100)  # 낮은 품질이면 DCT 빠른 경로와 빠른 축소를 쓴다
+        image = reader.read()
+        if image.isNull():
+            raise OSError(reader.errorString())
+        if self._declined(image.format()):
+            return None
+        if COLOR_MANAGEMENT and image.colorSpace().isValid() and image.colorSpace() != self._srgb:
+            image.convertToColorSpace(self._srgb)
+        if image.format() not in self._DISPLAY_FORMATS:
+            image = image.convertToFormat(
+                QImage.Format.Format_ARGB32 if image.hasAlphaChannel() else QImage.Format.Format_RGB32
+            )
+        return EngineResult(image, "bilinear" if job.draft else FULL_QUALITY, True)
+
+
+class TurboJpegEngine(DecoderEngine):
+    """PyTurboJPEG(libjpeg-turbo 직접 호출)로 JPEG를 DCT 단계 축소 디코딩하는 선택 엔진.
+
+    디코드 뒤의 리사이즈·색 변환·방향 적용은 render_image를 그대로 쓴다.
+    """
+
+    name = "turbojpeg"
+    label = "libjpeg-turbo"
+
+    def __init__(self):
+        self._decoder = None
+        if TurboJPEG is not None:
+            try:
+                self._decoder = TurboJPEG()
+            except (OSError, RuntimeError):
+                self._decoder = None  # 파이썬 패키지는 있지만 공유 라이브러리를 못 찾음
+
+    @property
+    def available(self) -> bool:
+        return self._decoder is not None
+
+    def supports(self, job: RenderJob) -> bool:
+        return self._decoder is not None and job.extension in _JPEG_EXTENSIONS and job.region is None
+
+    def render(self, job: RenderJob) -> Optional[EngineResult]:
+        data = job.data()
+        try:
+            width, height = self._decoder.decode_header(data)[:2]
+            orientation = jpeg_orientation(data)
+            box_width, box_height = job.target_size
+            if swaps_axes(orientation):
+                box_width, box_height = box_height, box_width
+            fitted_width, fitted_height = fit_size(width, height, box_width, box_height)
+            # 결과가 목표 크기 이상이 되는 가장 작은 DCT 축소 배율
+            factors = sorted(self._decoder.scaling_factors, key=lambda factor: factor[0] / factor[1])
+            factor = next(
+                (
+                    (numerator, denominator) for numerator, denominator in factors
+                    if width * numerator / denominator >= fitted_width
+                    and height * numerator / denominator >= fitted_height
+                ),
+                (1, 1),
+            )
+            pixels = self._decoder.decode(data, pixel_format=TJPF_RGB, scaling_factor=factor)
+        except (OSError, ValueError):
+            return None  # CMYK 등 libjpeg-turbo가 RGB로 못 푸는 파일은 Pillow로
+        image = Image.fromarray(pixels, "RGB")
+        with Image.open(io.BytesIO(data)) as opened:  # 헤더만 읽어 ICC 프로파일을 가져온다
+            icc_profile = opened.info.get("icc_profile")
+        if icc_profile:
+            image.info["icc_profile"] = icc_profile
+        set_exif_orientation(image, orientation)
+        if job.draft:
+            return EngineResult(ImageQt(render_image(image, job.target_size, draft=True)).copy(), "bilinear", True)
+        return EngineResult(ImageQt(render_image(image, job.target_size)).copy(), FULL_QUALITY, True)
+
+
+def _calibration_file() -> str:
+    base = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.GenericCacheLocation)
+    return os.path.join(base, ORG_NAME, APP_NAME, "decoder_engines.json")
+
+
+class DecoderEngines:
+    """사용 가능한 디코드 엔진과, 형식·파일 크기 등급별로 가장 빠른 엔진을 고르는 보정 표.
+
+    보정은 실제 탐색 중의 디코드로 한다: 등급마다 각 엔진이 DECODER_CALIBRATION_SAMPLES번
+    측정될 때까지 번갈아 쓰고, 그 뒤로는 MB당 시간(EWMA)이 가장 짧은 엔진을 쓴다.
+    측정값은 캐시 폴더에 저장되어 다음 실행부터는 처음부터 보정된 상태로 시작한다.
+    override가 "auto"가 아니면 그 엔진을 (그 엔진이 처리할 수 있는 파일에) 항상 쓴다.
+    원본 캐시에 이미 있는 이미지와 확대 영역 렌더링은 언제나 Pillow가 처리한다.
+    """
+
+    def __init__(self, raw_cache: ImageCache, resample_policy: ResamplePolicy):
+        self.pillow = PillowEngine(raw_cache, resample_policy)
+        engines: List[DecoderEngine] = [self.pillow, QtReaderEngine()]
+        turbo = TurboJpegEngine()
+        if turbo.available:
+            engines.append(turbo)
+        self.engines: Dict[str, DecoderEngine] = {engine.name: engine for engine in engines}
+        self.override = DECODER_ENGINE if DECODER_ENGINE in self.engines else "auto"
+        self._lock = threading.Lock()
+        # (확장자, 크기 등급, 엔진) → [MB당 ms EWMA, 측정 횟수]
+        self._rates: Dict[str, List[float]] = {}
+        self.uses: Dict[str, int] = {name: 0 for name in self.engines}
+        self.fallbacks = 0
+        self._load()
+
+    @staticmethod
+    def _bucket(job: RenderJob) -> str:
+        size_mb = (job.signature[1] if job.signature else 0) / (1024 * 1024)
+        return f"{job.extension}|{bisect.bisect_left(_SIZE_CLASSES_MB, size_mb)}"
+
+    def choose(self, job: RenderJob) -> DecoderEngine:
+        if job.region is not None or self.pillow.is_cached(job):
+            return self.pillow
+        candidates = [engine for engine in self.engines.values() if engine.supports(job)]
+        if self.override != "auto":
+            chosen = self.engines[self.override]
+            return chosen if chosen in candidates else self.pillow
+        if len(candidates) == 1:
+            return candidates[0]
+        bucket = self._bucket(job)
+        with self._lock:
+            stats = {engine.name: self._rates.get(f"{bucket}|{engine.name}", [0.0, 0]) for engine in candidates}
+        # 덜 측정된 엔진부터 시험하되, 빠듯한 요청(저품질/빠른 탐색)은 측정이 끝난 엔진 중에서 고른다
+        untested = [engine for engine in candidates if stats[engine.name][1] < DECODER_CALIBRATION_SAMPLES]
+        if untested and not (job.draft or job.rapid):
+            return min(untested, key=lambda engine: stats[engine.name][1])
+        measured = [engine for engine in candidates if stats[engine.name][1]] or [self.pillow]
+        return min(measured, key=lambda engine: stats[engine.name][0])
+
+    def render(self, job: RenderJob) -> EngineResult:
+        """고른 엔진으로 렌더링하고 측정값을 보정 표에 기록한다."""
+        engine = self.choose(job)
+        started = time.perf_counter()
+        result = engine.render(job)
+        if result is None:
+            with self._lock:
+                self.fallbacks += 1
+            engine = self.pillow
+            started = time.perf_counter()
+            result = engine.render(job)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._lock:
+            self.uses[engine.name] += 1
+        # 원본 품질 디코드만 보정에 쓴다: 저품질/빠른 필터 렌디션은 비용이 달라 비교할 수 없다
+        if result.decoded and not job.draft and not job.rapid and job.region is None and job.signature:
+            self._record(f"{self._bucket(job)}|{engine.name}", elapsed_ms / max(job.signature[1] / (1024 * 1024), 0.01))
+        return result
+
+    def _record(self, key: str, ms_per_mb: float) -> None:
+        with self._lock:
+            rate = self._rates.setdefault(key, [ms_per_mb, 0])
+            if rate[1]:
+                rate[0] += _EWMA_ALPHA * (ms_per_mb - rate[0])
+            rate[1] += 1
+
+    def summary(self) -> str:
+        with self._lock:
+            uses = ", ".join(f"{self.engines[name].label} {count}회" for name, count in self.uses.items())
+            calibrated = sum(1 for rate in self._rates.values() if rate[1] >= DECODER_CALIBRATION_SAMPLES)
+        mode = "자동" if self.override == "auto" else self.engines[self.override].label
+        return f"{mode} (사용: {uses}, Pillow로 대체 {self.fallbacks}회, 보정된 항목 {calibrated}개)"
+
+    # ------------------------------------------------------------------
+    # 영속화
+    # ------------------------------------------------------------------
+    def _load(self) -> None:
+        try:
+            with open(_calibration_file(), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != _CALIBRATION_VERSION:
+            return
+        self._rates = {key: [float(rate), int(count)] for key, (rate, count) in data.get("rates", {}).items()}
+
+    def save(self) -> None:
+        with self._lock:
+            data = {"version": _CALIBRATION_VERSION, "rates": dict(self._rates)}
+        calibration_file = _calibration_file()
+        try:
+            os.makedirs(os.path.dirname(calibration_file), exist_ok=True)
+            temp_file = f"{calibration_file}.tmp"
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(temp_file, calibration_file)
+        except OSError:
+            pass  # 저장 실패는 다음 실행에서 다시 보정하면 될 뿐이다
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import os
+import threading
+from typing import List, Optional, Set, Tuple
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from constants import SCAN_WORKERS
+from utils import is_image_file
+
+
+class _DirectoryScanTask(QRunnable):
+    """폴더 하나를 읽어 이미지 파일을 보고하고, 하위 폴더마다 새 작업을 건다."""
+
+    def __init__(self, scanner: "FolderScanner", generation: int, directory: str, include_files: bool = True):
+        super().__init__()
+        self._scanner = scanner
+        self._generation = generation
+        self._directory = directory
+        self._include_files = include_files
+
+    def run(self) -> None:
+        try:
+            if self._scanner.is_current(self._generation):
+                self._scan()
+        finally:
+            self._scanner.task_done(self._generation)
+
+    def _scan(self) -> None:
+        images: List[str] = []
+        subdirectories: List[str] = []
+        try:
+            with os.scandir(self._directory) as entries:
+                for entry in entries:
+                    if not self._scanner.is_current(self._generation):
+                        return
+                    try:
+                        if entry.is_dir():
+                            # 숨김 폴더(.thumbnails, .git 등)는 사진 트리의 일부가 아니다
+                            if not entry.name.startswith("."):
+                                subdirectories.append(entry.path)
+                        elif self._include_files and is_image_file(entry.name) and entry.is_file():
+                            images.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            return  # 권한 없는 폴더 등은 건너뛴다
+
+        if images:
+            self._scanner.found.emit(self._generation, images)
+        for subdirectory in subdirectories:
+            self._scanner.enqueue(self._generation, subdirectory)
+
+
+class FolderScanner(QObject):
+    """하위 폴더까지 이미지 파일을 병렬로 찾는다.
+
+    폴더마다 작업 하나를 SCAN_WORKERS 크기의 전용 풀에 넣어 동시에 읽고, 찾은
+    파일은 폴더 단위로 바로 found 시그널로 흘려보낸다. 심볼릭 링크는 따라가되
+    (st_dev, st_ino)로 이미 방문한 폴더를 건너뛰어 링크 순환에 빠지지 않는다.
+    start()를 다시 부르거나 cancel()하면 이전 스캔의 남은 작업은 즉시 끝난다.
+    """
+
+    # 워커 스레드에서 emit되며, GUI 스레드의 수신자에게는 큐 연결로 전달된다
+    found = Signal(int, list)   # (generation, 이미지 경로 목록)
+    finished = Signal(int)
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._pending = 0
+        self._visited: Set[Tuple[int, int]] = set()
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(SCAN_WORKERS)
+
+    @property
+    def scanning(self) -> bool:
+        with self._lock:
+            return self._pending > 0
+
+    def start(self, root: str, include_root_files: bool = True) -> int:
+        """root 아래를 스캔하기 시작하고 이번 스캔의 generation을 반환.
+
+        include_root_files=False면 root 바로 아래 파일은 이미 목록에 있다고 보고
+        하위 폴더만 찾는다.
+        """
+        with self._lock:
+            self._generation += 1
+            self._pending = 0
+            self._visited = set()
+            generation = self._generation
+        self.enqueue(generation, root, include_root_files)
+        return generation
+
+    def cancel(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._pending = 0
+
+    def is_current(self, generation: int) -> bool:
+        return generation == self._generation
+
+    def enqueue(self, generation: int, directory: str, include_files: bool = True) -> None:
+        try:
+            stat = os.stat(directory)
+        except OSError:
+            return
+        with self._lock:
+            if generation != self._generation:
+                return
+            identity = (stat.st_dev, stat.st_ino)
+            if identity in self._visited:
+                return  # 심볼릭 링크 순환 또는 같은 폴더로 가는 다른 경로
+            self._visited.add(identity)
+            self._pending += 1
+        self._pool.start(_DirectoryScanTask(self, generation, directory, include_files))
+
+    def task_done(self, generation: int) -> None:
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._pending -= 1
+            done = self._pending == 0
+        if done:
+            self.finished.emit(generation)
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import threading
 from collections import OrderedDict
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from PIL import Image
 
+from archive import read_image_bytes
+
 
 class ImageCache:
     """원본(디코딩된) 이미지를 위한 스레드 세이프 LRU 캐시.
@@ -20,6 +22,8 @@ class ImageCache:
         self._cache: "OrderedDict[str, Image.Image]" = OrderedDict()
         self._memory_usage = 0
         self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
 
     @staticmethod
     def _estimate_memory_usage(image: Image.Image) -> int:
@@ -31,9 +35,16 @@ class ImageCache:
         with self._lock:
             if key in self._cache:
                 self._cache.move_to_end(key)
+                self.hits += 1
                 return self._cache[key]
+            self.misses += 1
             return None
 
+    def contains(self, key: str) -> bool:
+        """적중률 통계와 LRU 순서에 영향을 주지 않는 확인."""
+        with self._lock:
+            return key in self._cache
+
     def put(self, key: str, image: Image.Image) -> None:
         with self._lock:
             if key in self._cache:
@@ -54,6 +65,115 @@ class ImageCache:
             self._cache[key] = image
             self._memory_usage += new_memory
 
+    def rekey(self, old_key: str, new_key: str) -> Optional[Image.Image]:
+        """항목을 새 키로 옮기고 그 이미지를 반환 (파일이 바뀌었지만 픽셀은 그대로일 때)."""
+        with self._lock:
+            image = self._cache.pop(old_key, None)
+            if image is not None:
+                self._cache[new_key] = image
+            return image
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        """키가 prefix로 시작하는 항목만 제거 (한 파일의 모든 서명 버전)."""
+        with self._lock:
+            for key in [key for key in self._cache if key.startswith(prefix)]:
+                self._memory_usage -= self._estimate_memory_usage(self._cache.pop(key))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._memory_usage = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "size": len(self._cache),
+                "max_size": self.max_size,
+                "memory_usage_mb": self._memory_usage / 1024 / 1024,
+                "max_memory_mb": self.max_memory_mb,
+            }
+
+
+class BytesCache:
+    """인코딩된 파일 바이트를 위한 스레드 세이프 LRU 캐시 (원본 캐시 앞단 계층).
+
+    압축된 JPEG/PNG는 디코딩된 픽셀보다 10~20배 작으므로 같은 메모리로 훨씬
+    넓은 범위의 주변 파일을 보관할 수 있다. 디코딩은 디스크 대신 메모리에서
+    하므로 네트워크 드라이브/USB처럼 I/O가 느린 환경에서 이동이 빨라진다.
+    항목은 경로별로 file_signature와 함께 저장돼 파일이 바뀌면 자동으로 버려진다.
+    """
+
+    def __init__(self, max_size: int = 60, max_memory_mb: int = 256):
+        self.max_size = max_size
+        self.max_memory_mb = max_memory_mb
+        self._cache: "OrderedDict[str, Tuple[Any, bytes]]" = OrderedDict()
+        self._memory_usage = 0
+        self._lock = threading.Lock()
+        self.hits = 0    # load()에서 디스크를 읽지 않고 끝난 횟수
+        self.misses = 0
+
+    @property
+    def max_entry_bytes(self) -> int:
+        # 한 파일이 예산 대부분을 차지해 주변 파일 전체를 밀어내지 않도록 1/4로 제한
+        return self.max_memory_mb * 1024 * 1024 // 4
+
+    def accepts(self, signature: Any) -> bool:
+        """이 서명(mtime, size)의 파일을 캐시에 넣을 수 있는지."""
+        return signature is not None and 0 < signature[1] <= self.max_entry_bytes
+
+    def get(self, file_path: str, signature: Any) -> Optional[bytes]:
+        with self._lock:
+            entry = self._cache.get(file_path)
+            if entry is None:
+                return None
+            if entry[0] != signature:
+                # 외부에서 파일이 수정/교체됨
+                self._memory_usage -= len(self._cache.pop(file_path)[1])
+                return None
+            self._cache.move_to_end(file_path)
+            return entry[1]
+
+    def put(self, file_path: str, signature: Any, data: bytes) -> None:
+        # 서명의 크기와 실제로 읽은 바이트 수가 다를 수 있다 (읽는 사이에 파일이 바뀐 경우)
+        if not self.accepts(signature) or len(data) > self.max_entry_bytes or self.max_size <= 0:
+            return
+        with self._lock:
+            if file_path in self._cache:
+                self._memory_usage -= len(self._cache.pop(file_path)[1])
+            max_memory_bytes = self.max_memory_mb * 1024 * 1024
+            while self._cache and (
+                len(self._cache) >= self.max_size
+                or (self._memory_usage + len(data)) > max_memory_bytes
+            ):
+                _, (_, oldest) = self._cache.popitem(last=False)
+                self._memory_usage -= len(oldest)
+            self._cache[file_path] = (signature, data)
+            self._memory_usage += len(data)
+
+    def contains(self, file_path: str, signature: Any) -> bool:
+        with self._lock:
+            entry = self._cache.get(file_path)
+            return entry is not None and entry[0] == signature
+
+    def load(self, file_path: str, signature: Any) -> bytes:
+        """캐시에 있으면 그 바이트를, 없으면 디스크(또는 압축 파일)에서 한 번에 읽어 캐시에 넣고 반환."""
+        data = self.get(file_path, signature)
+        with self._lock:
+            if data is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if data is None:
+            data = read_image_bytes(file_path)
+            self.put(file_path, signature, data)
+        return data
+
+    def invalidate(self, file_path: str) -> None:
+        with self._lock:
+            entry = self._cache.pop(file_path, None)
+            if entry is not None:
+                self._memory_usage -= len(entry[1])
+
     def clear(self) -> None:
         with self._lock:
             self._cache.clear()
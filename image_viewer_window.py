@@ -1,48 +1,123 @@
 from __future__ import annotations
 
+import heapq
 import os
 import platform
+import shutil
+import struct
 import sys
+import time
+import zipfile
 from collections import OrderedDict
-from typing import List, Optional, Tuple
-
-from PIL import Image, UnidentifiedImageError
-from PIL.ImageQt import ImageQt
-from PySide6.QtCore import QEasingCurve, QEvent, QObject, QPropertyAnimation, QRect, QRunnable, Qt, QThreadPool, QTimer, Signal
-from PySide6.QtGui import QAction, QImage, QPixmap
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from PIL import UnidentifiedImageError
+from PySide6.QtCore import (
+    QEasingCurve,
+    QEvent,
+    QFile,
+    QObject,
+    QPropertyAnimation,
+    QRect,
+    QRunnable,
+    QSettings,
+    QStandardPaths,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
+from PySide6.QtGui import QAction, QActionGroup, QImage, QPixmap, QTransform
 from PySide6.QtWidgets import (
+    QCheckBox,
     QFileDialog,
     QFrame,
     QGraphicsOpacityEffect,
     QHBoxLayout,
+    QInputDialog,
     QLabel,
     QMainWindow,
     QMenu,
     QMessageBox,
     QPushButton,
+    QSlider,
     QVBoxLayout,
     QWidget,
 )
 
+from archive import archive_pool, is_archive_file, member_path, split_member_path
+from color_management import transform_cache_summary
+from compare_view import ComparePane, CompareView
 from constants import (
     APP_DISPLAY_NAME,
     APP_NAME,
+    COMPARE_MAX_PANES,
+    COMPARE_PANES,
     CONTROL_FADE_DURATION_MS,
+    DECODE_BACKEND,
+    DECODE_PROCESS_WORKERS,
+    DEFAULT_SORT_MODE,
     DEFAULT_WINDOW_HEIGHT,
     DEFAULT_WINDOW_WIDTH,
     FRAME_RESIZE_MARGIN,
     FULLSCREEN_IDLE_HIDE_MS,
     INITIAL_WINDOW_SCREEN_RATIO,
+    MAX_BYTES_CACHE_MB,
+    MAX_BYTES_CACHE_SIZE,
     MAX_CACHE_SIZE,
     MAX_MEMORY_MB,
+    MAX_PIXMAP_CACHE_MB,
     MAX_RESIZE_CACHE_SIZE,
+    MEMORY_AUDIT_ENABLED,
+    MEMORY_AUDIT_INTERVAL_MS,
     MIN_WINDOW_HEIGHT,
     MIN_WINDOW_WIDTH,
+    ORG_NAME,
+    PIXMAP_CACHE_NEIGHBORS,
+    RECURSIVE_DEFAULT,
+    RESAMPLE_DWELL_MS,
     RESIZE_DEBOUNCE_MS,
+    SCAN_FLUSH_MS,
+    SCRUBBER_PREVIEW_NEIGHBORS,
+    SCRUBBER_SETTLE_MS,
+    SESSION_RESTORE,
+    SESSION_WARM_RENDITIONS,
+    SLIDESHOW_INTERVAL_MS,
 )
+from decoder_engines import DecoderEngines, RenderJob
 from file_association import register_file_associations
-from image_cache import ImageCache
-from utils import file_signature, get_current_image_index, get_image_files_from_directory, is_image_file
+from folder_scanner import FolderScanner
+from image_cache import BytesCache, ImageCache
+from io_scheduler import IoScheduler
+from memory_audit import MemoryAudit
+from metadata_index import SORT_MODES, MetadataIndex
+from orientation import (
+    compose_orientation,
+    display_region_to_stored,
+    jpeg_orientation,
+    orientation_matrix,
+    set_exif_orientation,
+    swaps_axes,
+    with_jpeg_orientation,
+)
+from process_decoder import ProcessDecoder
+from rendering import FULL_QUALITY, fit_size
+from resample_policy import NavigationVelocity, ResamplePolicy
+from session_state import SessionState
+from signature_cache import Signature, SignatureCache
+from similar_images import SimilarImageFinder
+from slideshow import SlideshowScheduler
+from stats_panel import StatsPanel
+from telemetry import Telemetry
+from thumbnail_grid import ThumbnailGrid, ThumbnailProvider
+from utils import (
+    file_signature,
+    get_current_image_index,
+    get_image_files_from_directory,
+    is_image_file,
+    natural_path_key,
+    natural_sort_key,
+)
 
 IS_WINDOWS = platform.system() == "Windows"
 
@@ -135,6 +210,8 @@ if IS_WINDOWS:
     MONITOR_DEFAULTTONEAREST = 2
 
 DEFAULT_CONTAINER_SIZE = (640, 480)
+_CONFIRM_TRASH_SETTING = "preferences/confirm_trash"
+PREFETCH_PRIORITY = -1  # 현재 이미지 로드(우선순위 0)보다 뒤에 실행
 PLACEHOLDER_TEXT = "이미지를 드래그하거나 Ctrl+O로 열어보세요"
 
 STYLE = (
@@ -149,6 +226,10 @@ STYLE = (
     "QPushButton:focus { background: transparent; }"
     "QPushButton:disabled { color: #555; background: transparent; }"
     "QLabel { color: #aaa; font-size: 12px; }"
+    "QSlider::groove:horizontal { height: 4px; background: #333; border-radius: 2px; }"
+    "QSlider::sub-page:horizontal { background: #3578e5; border-radius: 2px; }"
+    "QSlider::handle:horizontal { background: #eee; width: 12px; margin: -4px 0; border-radius: 6px; }"
+    "QSlider::handle:horizontal:disabled { background: #555; }"
     "#TitleLabel { color: #eee; font-weight: bold; }"
     "#ImagePlaceholder { color: #666; font-size: 14px; }"
     "QMenu { background-color: #1e1e1e; color: #eee; border: 1px solid #333; }"
@@ -165,6 +246,13 @@ STYLE = (
     "QMessageBox QPushButton:default { border: 2px solid #3578e5; }"
 )
 
+# 디코더 프로세스가 공유 메모리에 쓴 픽셀 배치(rendering.DISPLAY_MODES)에 대응하는 QImage 포맷
+_SHARED_QIMAGE_FORMATS = {
+    "RGB": QImage.Format.Format_RGB888,
+    "RGBA": QImage.Format.Format_RGBA8888,
+    "L": QImage.Format.Format_Grayscale8,
+}
+
 _EDGE_CURSORS = {
     "left": Qt.CursorShape.SizeHorCursor,
     "right": Qt.CursorShape.SizeHorCursor,
@@ -178,8 +266,8 @@ _EDGE_CURSORS = {
 
 
 class _ImageLoadSignals(QObject):
-    loaded = Signal(int, str, QImage)
-    error = Signal(int, str)
+    loaded = Signal(str, str, QImage, bool)  # (요청 키, 경로, 렌디션, LANCZOS 원본 품질 여부)
+    error = Signal(str, str)  # (요청 키, 오류 메시지)
 
 
 class _ImageLoadTask(QRunnable):
@@ -187,47 +275,208 @@ class _ImageLoadTask(QRunnable):
 
     QPixmap은 GUI 스레드에서만 안전하게 만들 수 있어, 워커는 스레드 세이프한
     QImage까지만 만들고 QPixmap 변환은 메인 스레드의 슬롯에서 수행한다.
+    process_decoder가 주어지면 디코드+리사이즈를 디코더 프로세스에 맡기고,
+    이 스레드는 결과를 기다렸다가 공유 메모리를 QImage로 감싸기만 한다.
+    스레드에서 처리할 때는 engines가 형식·크기별로 가장 빠른 디코드 엔진을 고른다.
+    rapid(빠른 탐색 중)면 resample_policy가 시간 예산에 맞는 빠른 필터를 고를 수 있다.
+    region(비교 모드 확대 영역)이 주어지면 원본에서 그 영역만 target_size로 렌더링한다.
+    결과는 만들 때 받은 request_key(렌디션 키)와 함께 보내, 완료 시점의 창 크기가
+    아니라 실제로 렌더링한 크기의 키로 캐시에 들어가게 한다.
+    orientation은 파일에 저장하지 않고 화면에만 적용하는 방향(JPEG가 아닌 파일의
+    회전/뒤집기)으로, 평소대로 렌더링한 뒤 결과에 덧붙인다.
     """
 
-    def __init__(self, seq: int, file_path: str, target_size: Tuple[int, int], raw_cache: ImageCache):
+    def __init__(
+        self,
+        request_key: str,
+        file_path: str,
+        signature: Signature,
+        target_size: Tuple[int, int],
+        engines: DecoderEngines,
+        bytes_cache: BytesCache,
+        process_decoder: Optional[ProcessDecoder] = None,
+        device_pixel_ratio: float = 1.0,
+        draft: bool = False,
+        resample_policy: Optional[ResamplePolicy] = None,
+        rapid: bool = False,
+        region: Optional[Tuple[float, float, float, float]] = None,
+        orientation: int = 1,
+    ):
         super().__init__()
         self.signals = _ImageLoadSignals()
-        self._seq = seq
+        if swaps_axes(orientation):
+            target_size = (target_size[1], target_size[0])
+        if region is not None:
+            region = display_region_to_stored(region, orientation)
+        self._request_key = request_key
         self._file_path = file_path
-        self._target_size = target_size
-        self._raw_cache = raw_cache
+        self._signature = signature  # GUI 스레드가 SignatureCache로 얻은 값: 워커는 다시 stat하지 않는다
+        self._target_size = target_size  # 물리 픽셀 기준
+        self._device_pixel_ratio = device_pixel_ratio
+        self._draft = draft
+        self._engines = engines
+        self._bytes_cache = bytes_cache
+        self._process_decoder = process_decoder
+        self._resample_policy = resample_policy or ResamplePolicy()
+        self._rapid = rapid and not draft
+        self._region = region
+        self._orientation = orientation
+        self._resample = FULL_QUALITY
+
+    @property
+    def process_decoder(self) -> Optional[ProcessDecoder]:
+        return self._process_decoder
 
     def run(self) -> None:
         try:
-            signature = file_signature(self._file_path)
-            cache_key = f"{self._file_path}::{signature}"
+            if self._process_decoder is not None:
+                qimage = self._render_in_process()
+            else:
+                qimage = self._render_in_thread()
+            if self._orientation != 1:
+                qimage = qimage.transformed(_orientation_transform(self._orientation))
+            # QPixmap.fromImage가 배율을 물려받아 논리 크기로 선명하게 그려진다
+            qimage.setDevicePixelRatio(self._device_pixel_ratio)
+            full_quality = not self._draft and self._resample == FULL_QUALITY
+            self.signals.loaded.emit(self._request_key, self._file_path, qimage, full_quality)
+        except (UnidentifiedImageError, OSError) as e:
+            self.signals.error.emit(self._request_key, f"이미지를 열 수 없습니다: {self._file_path}\n{e}")
+        except Exception as e:
+            self.signals.error.emit(self._request_key, f"이미지 표시 중 오류 발생: {e}")
 
-            image = self._raw_cache.get(cache_key)
-            if image is None:
-                with Image.open(self._file_path) as opened:
-                    image = opened.copy()
-                self._raw_cache.put(cache_key, image)
+    def _render_in_thread(self) -> QImage:
+        # 디코드 엔진(Pillow/QImageReader 등)은 형식·크기별 측정값으로 고르고, 원본 캐시는 Pillow 엔진이 다룬다
+        job = RenderJob(
+            self._file_path, self._signature, self._target_size, self._bytes_cache, self._draft, self._rapid,
+            self._region,
+        )
+        result = self._engines.render(job)
+        self._resample = result.resample
+        return result.qimage
+
+    def _render_in_process(self) -> QImage:
+        # 디코더 프로세스는 메모리를 공유하지 않으므로 원본 캐시(raw_cache)는 거치지 않고,
+        # 파일 바이트만 넘겨 프로세스가 디스크를 다시 읽지 않게 한다
+        data = self._bytes_cache.load(self._file_path, self._signature)
+        rendition = self._process_decoder.render(
+            self._file_path, self._target_size, self._draft, data, self._rapid, self._resample_policy.snapshot(),
+            self._region,
+        )
+        if not self._draft:
+            self._resample = rendition.resample
+            self._resample_policy.record(rendition.resample, rendition.source_size, self._target_size, rendition.render_ms)
+        qimage = QImage(
+            rendition.buffer,
+            rendition.width,
+            rendition.height,
+            rendition.bytes_per_line,
+            _SHARED_QIMAGE_FORMATS[rendition.mode],
+        )
+        self._process_decoder.retire(rendition)
+        return qimage
 
-            resized = self._resize_to_fit(image, *self._target_size)
-            if resized.mode not in ("RGB", "RGBA", "L"):
-                resized = resized.convert("RGBA")
 
-            qimage = ImageQt(resized).copy()  # copy()로 PIL 버퍼에서 완전히 분리
-            self.signals.loaded.emit(self._seq, self._file_path, qimage)
-        except (UnidentifiedImageError, OSError) as e:
-            self.signals.error.emit(self._seq, f"이미지를 열 수 없습니다: {self._file_path}\n{e}")
-        except Exception as e:
-            self.signals.error.emit(self._seq, f"이미지 표시 중 오류 발생: {e}")
+class _PendingRender:
+    """진행 중인 렌디션 작업 하나와, 그 결과를 기다리는 표시 요청들 (single-flight 항목)."""
+
+    __slots__ = ("task", "priority", "prefetch", "started", "waiters")
+
+    def __init__(self, task: _ImageLoadTask, priority: int, prefetch: bool, started: Optional[float]):
+        self.task = task
+        self.priority = priority
+        self.prefetch = prefetch  # 프리페치로 시작한 작업인지 (탐색 통계의 프리페치 효용)
+        self.started = started  # 원본 품질 디코드 시간 측정 시작 (저품질 렌디션이면 None)
+        self.waiters: List[int] = []  # 결과가 오면 표시할 _load_seq 값들
+
+
+class _FileRemovalSignals(QObject):
+    finished = Signal(str, bool, str)  # (경로, 성공 여부, 오류 메시지)
+
+
+class _FileRemovalTask(QRunnable):
+    """휴지통 이동/영구 삭제를 백그라운드에서 수행 (네트워크 드라이브에서는 수백 ms 걸리기도 한다)."""
+
+    def __init__(self, file_path: str, permanent: bool):
+        super().__init__()
+        self.signals = _FileRemovalSignals()
+        self._file_path = file_path
+        self._permanent = permanent
+
+    def run(self) -> None:
+        try:
+            if self._permanent:
+                os.remove(self._file_path)
+            elif not QFile.moveToTrash(self._file_path):
+                raise OSError("휴지통으로 이동할 수 없습니다. 휴지통을 지원하지 않는 위치라면 Shift+Delete로 영구 삭제할 수 있습니다.")
+        except OSError as e:
+            self.signals.finished.emit(self._file_path, False, str(e))
+            return
+        self.signals.finished.emit(self._file_path, True, "")
+
+
+# 회전/뒤집기 명령 → 표시 중인 렌디션/썸네일에 그대로 적용할 변환.
+# 90도 배수 회전과 반전은 보간 없이 픽셀 위치만 옮기므로 품질이 그대로다.
+_OPERATION_TRANSFORMS = {
+    "rotate_cw": QTransform().rotate(90),
+    "rotate_ccw": QTransform().rotate(-90),
+    "flip_horizontal": QTransform().scale(-1, 1),
+    "flip_vertical": QTransform().scale(1, -1),
+}
+_LOSSLESS_ROTATE_EXTENSIONS = (".jpg", ".jpeg")
 
-    @staticmethod
-    def _resize_to_fit(image: Image.Image, box_width: int, box_height: int) -> Image.Image:
-        image_ratio = image.width / image.height
-        box_ratio = box_width / box_height
-        if image_ratio > box_ratio:
-            new_width, new_height = box_width, max(1, int(box_width / image_ratio))
-        else:
-            new_height, new_width = box_height, max(1, int(box_height * image_ratio))
-        return image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+
+def _orientation_transform(orientation: int) -> QTransform:
+    """Orientation 값 → 렌디션에 적용할 QTransform (QImage.transformed가 위치는 알아서 맞춘다)."""
+    a, b, c, d = orientation_matrix(orientation)
+    return QTransform(a, c, b, d, 0, 0)
+
+
+class _OrientationWriteSignals(QObject):
+    finished = Signal(str, object, object, str, int, str)  # (경로, 이전 서명, 새 서명, 명령, 새 방향, 오류 메시지)
+
+
+class _OrientationWriteTask(QRunnable):
+    """JPEG의 EXIF Orientation 태그만 고쳐 회전/뒤집기를 무손실로 저장.
+
+    대개 파일의 2바이트만 제자리에서 고치므로 큰 파일도 바로 끝난다. 태그를 새로
+    넣어야 하면 임시 파일에 쓴 뒤 교체한다. 고친 바이트는 새 서명으로 바이트 캐시에
+    넣어 다음 디코딩이 디스크를 다시 읽지 않게 한다. 파일 작업 풀(스레드 1개)에서
+    차례로 실행되므로, 연달아 누른 명령도 앞 작업이 끝난 파일을 기준으로 쌓인다.
+    """
+
+    def __init__(self, file_path: str, operation: str, bytes_cache: BytesCache):
+        super().__init__()
+        self.signals = _OrientationWriteSignals()
+        self._file_path = file_path
+        self._operation = operation
+        self._bytes_cache = bytes_cache
+
+    def run(self) -> None:
+        # 앞선 회전 작업이 바꿔 놓은 실제 서명: GUI 스레드의 서명 캐시 값은 이미 낡았을 수 있다
+        old_signature = file_signature(self._file_path)
+        try:
+            data = self._bytes_cache.get(self._file_path, old_signature)
+            if data is None:
+                with open(self._file_path, "rb") as f:
+                    data = f.read()
+            orientation = compose_orientation(jpeg_orientation(data), self._operation)
+            new_data, offset = with_jpeg_orientation(data, orientation)
+            if offset is not None:
+                with open(self._file_path, "r+b") as f:
+                    f.seek(offset)
+                    f.write(new_data[offset:offset + 2])
+            else:
+                temp_path = f"{self._file_path}.tmp"
+                with open(temp_path, "wb") as f:
+                    f.write(new_data)
+                shutil.copymode(self._file_path, temp_path)
+                os.replace(temp_path, self._file_path)
+        except (OSError, ValueError, struct.error) as e:
+            self.signals.finished.emit(self._file_path, old_signature, None, self._operation, 0, str(e))
+            return
+        new_signature = file_signature(self._file_path)
+        self._bytes_cache.put(self._file_path, new_signature, new_data)
+        self.signals.finished.emit(self._file_path, old_signature, new_signature, self._operation, orientation, "")
 
 
 class ImageViewerWindow(QMainWindow):
@@ -239,6 +488,11 @@ class ImageViewerWindow(QMainWindow):
         self.setAcceptDrops(True)
         self.setMinimumSize(MIN_WINDOW_WIDTH, MIN_WINDOW_HEIGHT)
         self.resize(*self._initial_window_size())
+        self.session = SessionState.load()
+        if self.session.geometry is not None:
+            self.restoreGeometry(self.session.geometry)
+        # 지난 세션에서 많이 보던 이미지 중 아직 목록에서 찾지 못한 것 (재귀 스캔 중에 차례로 나타난다)
+        self._session_warm_paths: List[str] = []
 
         self.images: List[str] = []
         self.current_index: int = 0
@@ -246,16 +500,87 @@ class ImageViewerWindow(QMainWindow):
         self.current_path: Optional[str] = None
 
         self.raw_cache = ImageCache(max_size=MAX_CACHE_SIZE, max_memory_mb=MAX_MEMORY_MB)
+        self.bytes_cache = BytesCache(max_size=MAX_BYTES_CACHE_SIZE, max_memory_mb=MAX_BYTES_CACHE_MB)
+        # 모든 캐시 키의 기준이 되는 파일 서명: 탐색 한 번에 같은 파일을 여러 번 stat하지 않도록 공유
+        self.signatures = SignatureCache(self)
+        self.io_scheduler = IoScheduler(self.bytes_cache, self.signatures, self)
+        # 파일 삭제는 요청 순서대로 하나씩 처리
+        self._file_ops_pool = QThreadPool(self)
+        self._file_ops_pool.setMaxThreadCount(1)
+        self._pending_removals: Dict[str, int] = {}  # 경로 → 실패 시 되돌릴 원래 위치
+        self._pending_orientation_writes: Dict[str, int] = {}  # 경로 → 아직 저장 중인 회전/뒤집기 수
+        self._view_orientations: Dict[str, int] = {}  # 경로 → 화면에만 적용한 방향 (JPEG가 아닌 파일, 이번 실행 동안)
+        self.sort_mode = DEFAULT_SORT_MODE
+        # 휴지통 이동 전 확인: 확인 창의 "다시 묻지 않기"나 우클릭 메뉴로 끄면 확인 없이 바로 골라낸다
+        self.confirm_trash = QSettings(ORG_NAME, APP_NAME).value(_CONFIRM_TRASH_SETTING, True, type=bool)
+        self.metadata_index = MetadataIndex(self.signatures, self)
+        self.metadata_index.indexed.connect(self._on_metadata_indexed)
+        self.similar = SimilarImageFinder(self.signatures, self)
+        self.similar.progress.connect(self._on_similar_progress)
+        self.similar.grouped.connect(self._on_similar_grouped)
+        self.similar_groups: List[List[str]] = []
+        self._similar_progress = ""
+
+        self.current_directory: Optional[str] = None
+        self.recursive = RECURSIVE_DEFAULT
+        self.folder_scanner = FolderScanner(self)
+        self.folder_scanner.found.connect(self._on_scan_found)
+        self.folder_scanner.finished.connect(self._on_scan_finished)
+        self._scan_generation = 0
+        self._scan_buffer: List[str] = []
+        # 스캔 중 병합 때마다 수십만 개의 키를 다시 계산하지 않도록 스캔 동안만 보관
+        self._scan_keys: Dict[str, tuple] = {}
+        self._scan_flush_timer = QTimer(self)
+        self._scan_flush_timer.setSingleShot(True)
+        self._scan_flush_timer.setInterval(SCAN_FLUSH_MS)
+        self._scan_flush_timer.timeout.connect(self._flush_scan_results)
         self.resize_cache: "OrderedDict[str, QImage]" = OrderedDict()
         self._resize_cache_memory = 0
+        self.pixmap_cache: "OrderedDict[str, QPixmap]" = OrderedDict()
+        self._pixmap_cache_memory = 0
+        # 렌디션 키(경로, 서명, 렌더링 크기) → 진행 중인 작업: 같은 렌디션은 한 번만 만든다
+        self._in_flight: Dict[str, _PendingRender] = {}
+        # 비교 모드: 칸 수(0이면 한 장 보기)와 진행 중인 확대 영역 렌더링 (요청 키 → 칸 번호, 경로, 영역)
+        self.compare_panes = 0
+        self._compare_detail_in_flight: Dict[str, Tuple[int, str, Tuple[float, float, float, float]]] = {}
         self.thread_pool = QThreadPool.globalInstance()
+        self._process_decoder: Optional[ProcessDecoder] = None
+        # 끈 프로세스 디코더 중 아직 QImage가 공유 메모리 블록을 참조하고 있어 닫지 못한 것
+        self._retired_decoders: List[ProcessDecoder] = []
+        if DECODE_BACKEND == "process":
+            self._process_decoder = ProcessDecoder(DECODE_PROCESS_WORKERS)
 
         self._load_seq = 0
+        # 빠르게 넘기는 동안에는 빠른 필터로 렌더링하고, 한 장에 머물면 LANCZOS로 다시 렌더링
+        self.resample_policy = ResamplePolicy()
+        self.decoder_engines = DecoderEngines(self.raw_cache, self.resample_policy)
+        self.telemetry = Telemetry()
+        self._navigation_started: Optional[Tuple[int, float, str]] = None  # (seq, 시작 시각, 형식)
+        self.navigation = NavigationVelocity()
+        self._refine_timer = QTimer(self)
+        self._refine_timer.setSingleShot(True)
+        self._refine_timer.timeout.connect(self._refine_current)
+        self._screen_signal_connected = False
+        self.slideshow = SlideshowScheduler(self, SLIDESHOW_INTERVAL_MS)
+        self.slideshow.deadline_missed.connect(self._on_slideshow_deadline_missed)
         self._resize_timer = QTimer(self)
         self._resize_timer.setSingleShot(True)
         self._resize_timer.setInterval(RESIZE_DEBOUNCE_MS)
         self._resize_timer.timeout.connect(self._on_resize_settled)
 
+        # 스크러버: 드래그 중에는 썸네일만 보여주고, 핸들이 멈추면 그때 원본을 로드
+        self._scrub_index: Optional[int] = None
+        self._scrub_settle_timer = QTimer(self)
+        self._scrub_settle_timer.setSingleShot(True)
+        self._scrub_settle_timer.setInterval(SCRUBBER_SETTLE_MS)
+        self._scrub_settle_timer.timeout.connect(self._commit_scrub)
+
+        # 0ms 싱글샷: 대기 중인 입력/페인트 이벤트를 먼저 처리한 뒤에 실행된다
+        self._pixmap_warmup_timer = QTimer(self)
+        self._pixmap_warmup_timer.setSingleShot(True)
+        self._pixmap_warmup_timer.setInterval(0)
+        self._pixmap_warmup_timer.timeout.connect(self._warm_pixmap_cache)
+
         self._drag_pos = None
         self._resize_edge: Optional[str] = None
         self._resize_start_geometry: Optional[QRect] = None
@@ -270,14 +595,27 @@ class ImageViewerWindow(QMainWindow):
         self.mouse_timer.timeout.connect(self._hide_controls_on_timeout)
 
         self.setMouseTracking(True)
-        for widget in (self.central_widget, self.image_container, self.image_label, self.title_bar, self.control_bar):
+        for widget in (
+            self.central_widget, self.image_container, self.image_label, self.title_bar, self.control_bar,
+            self.thumbnail_grid.viewport(),
+        ):
             widget.setMouseTracking(True)
             widget.installEventFilter(self)
 
         self.setFocus()
 
+        # 창이 다 만들어진 뒤의 RSS가 메모리 감사의 기준. 주기적인 표본은 탐색 통계용 계층 사용량만 모으고,
+        # RSS 비교는 Memory Info를 열 때 (MEMORY_AUDIT_ENABLED면 표본마다) 한다
+        self.memory_audit = MemoryAudit()
+        self._tier_usage_timer = QTimer(self)
+        self._tier_usage_timer.setInterval(MEMORY_AUDIT_INTERVAL_MS)
+        self._tier_usage_timer.timeout.connect(self._sample_tier_usage)
+        self._tier_usage_timer.start()
+
         if initial_file and os.path.isfile(initial_file):
             QTimer.singleShot(0, self, lambda path=initial_file: self.open_file(path))
+        elif SESSION_RESTORE:
+            QTimer.singleShot(0, self, self._restore_session)
 
     # ------------------------------------------------------------------
     # UI 구성
@@ -335,8 +673,20 @@ class ImageViewerWindow(QMainWindow):
         self.image_label.setObjectName("ImagePlaceholder")
         self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         container_layout.addWidget(self.image_label)
+        self.compare_view = CompareView()
+        self.compare_view.detail_wanted.connect(self._request_compare_details)
+        self.compare_view.hide()
+        container_layout.addWidget(self.compare_view)
+        self.stats_panel = StatsPanel(self._stats_lines, self.image_container)
         self.main_layout.addWidget(self.image_container, 1)
 
+        self.thumbnails = ThumbnailProvider(self.signatures, self)
+        self.thumbnail_grid = ThumbnailGrid(self.thumbnails)
+        self.thumbnail_grid.image_activated.connect(self._on_grid_image_activated)
+        self.thumbnails.thumbnail_ready.connect(self._on_scrub_thumbnail_ready)
+        self.thumbnail_grid.hide()
+        self.main_layout.addWidget(self.thumbnail_grid, 1)
+
         self.control_bar = QFrame()
         self.control_bar.setObjectName("ControlBar")
         self.control_bar.setFixedHeight(60)
@@ -369,10 +719,10 @@ class ImageViewerWindow(QMainWindow):
 
         self.delete_btn = QPushButton("Delete")
         self.delete_btn.setFixedSize(70, 35)
-        self.delete_btn.setToolTip("Delete Current Image (Del)")
+        self.delete_btn.setToolTip("Move Current Image to Trash (Del)\nDelete Permanently (Shift+Del)")
         self.delete_btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
         self.delete_btn.setEnabled(False)
-        self.delete_btn.clicked.connect(self.delete_current_image)
+        self.delete_btn.clicked.connect(lambda: self.delete_current_image())
         control_layout.addWidget(self.delete_btn)
 
         self.counter_label = QLabel("0 / 0")
@@ -380,6 +730,15 @@ class ImageViewerWindow(QMainWindow):
         self.counter_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         control_layout.addWidget(self.counter_label)
 
+        self.scrubber = QSlider(Qt.Orientation.Horizontal)
+        self.scrubber.setFixedHeight(35)
+        self.scrubber.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.scrubber.setRange(0, 0)
+        self.scrubber.setEnabled(False)
+        self.scrubber.valueChanged.connect(self._on_scrubber_changed)
+        self.scrubber.sliderReleased.connect(self._commit_scrub)
+        control_layout.addWidget(self.scrubber, 2)
+
         self.filename_label = QLabel("")
         self.filename_label.setFixedHeight(35)
         self.filename_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
@@ -436,12 +795,16 @@ class ImageViewerWindow(QMainWindow):
             self,
             "이미지 파일 열기",
             "",
-            "이미지 파일 (*.jpg *.jpeg *.png *.gif *.bmp *.webp *.tiff *.tif);;모든 파일 (*)",
+            "이미지 파일 (*.jpg *.jpeg *.png *.gif *.bmp *.webp *.tiff *.tif);;"
+            "압축 파일 (*.zip *.cbz);;모든 파일 (*)",
         )
         if file_path:
             self.open_file(file_path)
 
     def open_file(self, file_path: str) -> None:
+        if is_archive_file(file_path) or split_member_path(file_path) is not None:
+            self._open_archive(file_path)
+            return
         file_path = os.path.abspath(file_path)
         if not os.path.isfile(file_path):
             self.show_error(f"파일이 존재하지 않습니다: {file_path}")
@@ -451,48 +814,219 @@ class ImageViewerWindow(QMainWindow):
             return
 
         directory = os.path.dirname(file_path)
+        self.current_directory = directory
+        self.signatures.watch([directory])
         self.images = get_image_files_from_directory(directory)
         self.current_index = get_current_image_index(self.images, file_path)
+        self._scan_flush_timer.stop()
+        self._scan_buffer = []
+        self._scan_keys = {}
+        if self.recursive:
+            # 바로 아래 파일로 먼저 보여주고, 하위 폴더 결과는 도착하는 대로 이름 순 위치에 끼워 넣는다.
+            # 메타데이터 색인은 목록이 완성된 뒤(_on_scan_finished)에 만든다.
+            self._scan_generation = self.folder_scanner.start(directory, include_root_files=False)
+        else:
+            self.folder_scanner.cancel()
+            # 이름 순으로 바로 띄우고, 색인이 끝나면(영속 색인이 있으면 곧바로) 선택한 정렬로 재배열
+            self.metadata_index.build(directory, self.images)
+        self._show_new_image_list()
+
+    def _open_archive(self, file_path: str) -> None:
+        """ZIP/CBZ 안의 이미지 멤버를 탐색 목록으로 연다 ("archive.zip!/멤버" 경로도 허용)."""
+        member = split_member_path(file_path)
+        archive_path = os.path.abspath(member[0] if member else file_path)
+        if not os.path.isfile(archive_path):
+            self.show_error(f"파일이 존재하지 않습니다: {archive_path}")
+            return
+        try:
+            images = archive_pool.list_images(archive_path)
+        except (OSError, zipfile.BadZipFile) as e:
+            self.show_error(f"압축 파일을 열 수 없습니다: {archive_path}\n{e}")
+            return
+        if not images:
+            self.show_error(f"압축 파일 안에 표시할 이미지가 없습니다: {archive_path}")
+            return
+
+        self.folder_scanner.cancel()
+        self._scan_flush_timer.stop()
+        self._scan_buffer = []
+        self._scan_keys = {}
+        self.current_directory = member_path(archive_path, "")
+        self.signatures.watch([archive_path])
+        self.images = images
+        selected = member_path(archive_path, member[1]) if member else None
+        self.current_index = images.index(selected) if selected in images else 0
+        self.metadata_index.build(self.current_directory, self.images)
+        self._show_new_image_list()
+
+    def _show_new_image_list(self) -> None:
+        self.thumbnails.clear()
+        self.similar.cancel()
+        self.similar_groups = []
+        self._similar_progress = ""
+        self._session_warm_paths = []
+        if self.thumbnail_grid.isVisible():
+            self.thumbnail_grid.set_images(self.images, self.current_index)
         self.show_image(self.current_index)
 
     def show_image(self, index: int) -> None:
         if not self.images or index < 0 or index >= len(self.images):
             return
+        navigated = index != self.current_index
+        if navigated:
+            self.navigation.record()
         self.current_index = index
+        # 표시하고 미리 읽을 파일은 제자리 수정도 바로 알 수 있게 파일 자체를 감시한다
+        self.signatures.watch_files(self.images[i] for i in [index] + self._neighbor_indices())
+        if self.compare_panes:
+            self._show_compare()
+            return
         file_path = self.images[index]
         self.current_path = None
 
-        width = self.image_container.width() or DEFAULT_CONTAINER_SIZE[0]
-        height = self.image_container.height() or DEFAULT_CONTAINER_SIZE[1]
+        width, height, dpr = self._render_target()
 
         self._load_seq += 1
         seq = self._load_seq
+        if navigated:
+            self._navigation_started = (seq, time.perf_counter(), os.path.splitext(file_path)[1].lower() or "?")
 
-        signature = file_signature(file_path)
-        cache_key = f"{file_path}::{signature}::{width}x{height}"
+        signature = self.signatures.get(file_path)
+        cache_key = self._rendition_key(file_path, signature, width, height, dpr)
         cached = self.resize_cache.get(cache_key)
+        self.telemetry.lookup("rendition", cached is not None)
         if cached is not None:
             self.resize_cache.move_to_end(cache_key)
-            self._apply_image(seq, file_path, cached)
+            self._apply_image(seq, file_path, cached, cache_key)
             self._update_nav_state()
+            self._schedule_neighbor_warmup()
+            self.io_scheduler.schedule(self.images, self.current_index)
             return
 
-        self._show_loading_indicator()
-
-        task = _ImageLoadTask(seq, file_path, (width, height), self.raw_cache)
-        task.signals.loaded.connect(self._on_image_loaded)
-        task.signals.error.connect(self._on_image_error)
-        self.thread_pool.start(task)
+        # 원본 품질이 없어도 저품질 렌디션이 있으면 먼저 띄우고, 원본이 오면 교체한다
+        draft_key = self._rendition_key(file_path, signature, width, height, dpr, draft=True)
+        draft = self.resize_cache.get(draft_key)
+        if draft is not None:
+            self._apply_image(seq, file_path, draft, draft_key)
+        elif not self.slideshow.running and not self._show_preview(file_path):
+            # 슬라이드쇼 중에는 다음 슬라이드가 준비될 때까지 이전 슬라이드를 그대로 둔다
+            self._show_loading_indicator()
+
+        rapid = self.navigation.rapid and not self.slideshow.running
+        self._start_load(seq, file_path, signature, rapid)
+        self.io_scheduler.schedule(self.images, self.current_index)
         self._update_nav_state()
 
-    def _on_image_loaded(self, seq: int, file_path: str, qimage: QImage) -> None:
-        if seq != self._load_seq:
+    def _start_load(self, seq: int, file_path: str, signature, rapid: bool = False) -> None:
+        """현재 창 크기의 렌디션을 만들고, 오면 seq가 아직 현재 로드일 때 표시한다.
+
+        같은 렌디션을 이미 만드는 중이면(프리페치, 빠른 왕복 탐색) 새로 디코딩하지 않고
+        그 작업의 결과를 기다린다. 그 작업이 아직 큐에 있으면 표시 우선순위로 올린다.
+        """
+        width, height, dpr = self._render_target()
+        cache_key = self._rendition_key(file_path, signature, width, height, dpr)
+        pending = self._in_flight.get(cache_key)
+        if pending is None:
+            pending = self._submit_render(cache_key, file_path, signature, (width, height), dpr, rapid=rapid)
+        else:
+            self._raise_priority(pending, 0)
+        pending.waiters.append(seq)
+
+    def _submit_render(
+        self,
+        cache_key: str,
+        file_path: str,
+        signature,
+        target_size: Tuple[int, int],
+        dpr: float,
+        draft: bool = False,
+        rapid: bool = False,
+        priority: int = 0,
+        prefetch: bool = False,
+    ) -> _PendingRender:
+        task = _ImageLoadTask(
+            cache_key, file_path, signature, target_size, self.decoder_engines, self.bytes_cache,
+            self._process_decoder, dpr, draft, resample_policy=self.resample_policy, rapid=rapid,
+            orientation=self._view_orientations.get(file_path, 1),
+        )
+        task.signals.loaded.connect(self._on_render_loaded)
+        task.signals.error.connect(self._on_render_error)
+        pending = _PendingRender(task, priority, prefetch, None if draft else time.perf_counter())
+        self._in_flight[cache_key] = pending
+        self.thread_pool.start(task, priority)
+        return pending
+
+    def _raise_priority(self, pending: _PendingRender, priority: int) -> None:
+        # 이미 실행 중인 작업은 tryTake가 실패하므로 그대로 둔다
+        if priority > pending.priority and self.thread_pool.tryTake(pending.task):
+            pending.priority = priority
+            self.thread_pool.start(pending.task, priority)
+
+    def _on_render_loaded(self, cache_key: str, file_path: str, qimage: QImage, full_quality: bool) -> None:
+        pending = self._in_flight.pop(cache_key, None)
+        if pending is None:
+            return  # 창 크기 변경/파일 삭제로 버려진 작업
+        decoder = pending.task.process_decoder
+        if decoder is not None and decoder is not self._process_decoder:
+            # 이미 끈 디코더의 공유 메모리를 캐시가 붙잡지 않도록 복사하고, 원래 블록은 닫는다
+            qimage = qimage.copy()
+            QTimer.singleShot(0, self, self._release_retired_decoders)
+        if full_quality and pending.started is not None:
+            # 빠른 필터 시간은 원본 품질 추정을 왜곡하므로 원본 품질 결과만 반영한다
+            elapsed_ms = (time.perf_counter() - pending.started) * 1000
+            self.slideshow.estimator.record(file_path, self.file_size(file_path), elapsed_ms)
+        # 빠른 필터 결과는 저품질 렌디션 자리에 두어, 원본 품질이 오면 그대로 교체되게 한다
+        if not full_quality and not cache_key.endswith("::draft"):
+            cache_key += "::draft"
+        self._store_rendition(cache_key, qimage)
+        if pending.prefetch and cache_key in self.resize_cache:
+            self.telemetry.on_prefetch_stored(cache_key)
+
+        if self._load_seq in pending.waiters:
+            self._apply_image(self._load_seq, file_path, qimage, cache_key)
+            self._update_nav_state()
+            self._schedule_neighbor_warmup()
+            if not full_quality:
+                self._refine_timer.start(RESAMPLE_DWELL_MS)
+        else:
+            self._pixmap_warmup_timer.start()
+        if self.compare_panes:
+            self._refresh_compare_panes()
+
+    def _on_render_error(self, cache_key: str, message: str) -> None:
+        pending = self._in_flight.pop(cache_key, None)
+        if pending is None:
+            return
+        if self._load_seq in pending.waiters:
+            self._show_load_error(message)
+        elif self.compare_panes:
+            # 비교 모드에서는 칸 자체가 표시 대상이므로 그 칸에 실패를 보여준다
+            for pane in self.compare_view.panes:
+                if pane.file_path and cache_key.startswith(f"{pane.file_path}::") and pane.pixmap is None:
+                    pane.show_message("표시할 수 없는 이미지")
+        # 그 밖의 프리페치 실패는 조용히 버린다: 실제로 그 이미지로 이동하면 다시 로드하며 오류를 보여준다
+
+    def _refine_current(self) -> None:
+        """빠른 탐색이 멈추고 RESAMPLE_DWELL_MS 동안 머물면 현재 이미지를 LANCZOS로 다시 렌더링."""
+        idle_ms = self.navigation.idle_ms()
+        if idle_ms < RESAMPLE_DWELL_MS:
+            self._refine_timer.start(int(RESAMPLE_DWELL_MS - idle_ms) + 1)
             return
-        width = self.image_container.width() or DEFAULT_CONTAINER_SIZE[0]
-        height = self.image_container.height() or DEFAULT_CONTAINER_SIZE[1]
-        signature = file_signature(file_path)
-        cache_key = f"{file_path}::{signature}::{width}x{height}"
+        if not self.images or self.current_path != self.images[self.current_index]:
+            return  # 다른 이미지를 로드 중이면 그 로드가 알아서 원본 품질을 만든다
+        file_path = self.current_path
+        signature = self.signatures.get(file_path)
+        if self._rendition_key_for(self.current_index) in self.resize_cache:
+            self.show_image(self.current_index)
+            return
+        self._load_seq += 1
+        self._start_load(self._load_seq, file_path, signature)
+
+    def file_size(self, file_path: str) -> int:
+        signature = self.signatures.get(file_path)
+        return signature[1] if signature else 0
 
+    def _store_rendition(self, cache_key: str, qimage: QImage) -> None:
         image_memory = qimage.sizeInBytes()
         max_resize_memory = MAX_MEMORY_MB * 1024 * 1024
         existing = self.resize_cache.pop(cache_key, None)
@@ -504,18 +1038,238 @@ class ImageViewerWindow(QMainWindow):
                 len(self.resize_cache) >= MAX_RESIZE_CACHE_SIZE
                 or self._resize_cache_memory + image_memory > max_resize_memory
             ):
-                _, oldest = self.resize_cache.popitem(last=False)
+                evicted_key, oldest = self.resize_cache.popitem(last=False)
                 self._resize_cache_memory -= oldest.sizeInBytes()
+                self.telemetry.on_rendition_evicted(evicted_key)
             self.resize_cache[cache_key] = qimage
             self._resize_cache_memory += image_memory
 
-        self._apply_image(seq, file_path, qimage)
-        self._update_nav_state()
+    # ------------------------------------------------------------------
+    # 이웃 이미지 프리페치 / 표시용 QPixmap 계층
+    # ------------------------------------------------------------------
+    def _schedule_neighbor_warmup(self) -> None:
+        """현재 이미지가 표시된 뒤 이웃 렌디션을 백그라운드로 준비.
+
+        리사이즈 캐시에 없는 이웃은 낮은 우선순위로 디코딩을 걸고, 이미 있는
+        렌디션은 유휴 시간에 QPixmap으로 올려 둔다. 다음 탐색에서 남는 일이
+        setPixmap 하나뿐이게 만드는 것이 목적이다.
+        """
+        for index in self._neighbor_indices():
+            self.prefetch_index(index)
+        self._prefetch_session_renditions()
+        self._pixmap_warmup_timer.start()
+
+    def _neighbor_indices(self) -> List[int]:
+        # 비교 모드에서는 함께 보이는 나머지 칸과, 칸 묶음 양쪽 바깥의 이웃
+        last = self.current_index + max(1, self.compare_panes) - 1
+        indices = list(range(self.current_index + 1, last + 1))
+        for distance in range(1, PIXMAP_CACHE_NEIGHBORS + 1):
+            indices.extend((last + distance, self.current_index - distance))
+        return [index for index in indices if 0 <= index < len(self.images)]
+
+    def _rendition_key_for(self, index: int, draft: bool = False) -> str:
+        width, height, dpr = self._render_target()
+        file_path = self.images[index]
+        return self._rendition_key(file_path, self.signatures.get(file_path), width, height, dpr, draft)
+
+    def ready_quality(self, index: int) -> Optional[str]:
+        """해당 이미지를 지금 바로 띄울 수 있는 최고 품질("full"/"draft"), 없으면 None."""
+        if self._rendition_key_for(index) in self.resize_cache:
+            return "full"
+        if self._rendition_key_for(index, draft=True) in self.resize_cache:
+            return "draft"
+        return None
+
+    def prefetch_index(self, index: int, draft: bool = False, priority: Optional[int] = None) -> None:
+        """해당 이미지의 렌디션을 낮은 우선순위로 미리 만들어 리사이즈 캐시에 넣는다.
+
+        priority를 주면 그 우선순위로 실행한다 (비교 모드에서 화면에 보이는 칸).
+        """
+        if not 0 <= index < len(self.images):
+            return
+        width, height, dpr = self._render_target()
+        file_path = self.images[index]
+        signature = self.signatures.get(file_path)
+        cache_key = self._rendition_key(file_path, signature, width, height, dpr, draft)
+        # 마감이 걸린 저품질 렌디션은 일반 프리페치보다 먼저 처리
+        if priority is None:
+            priority = 0 if draft else PREFETCH_PRIORITY
+        if cache_key in self.resize_cache:
+            return
+        pending = self._in_flight.get(cache_key)
+        if pending is not None:
+            self._raise_priority(pending, priority)
+            return
+        if draft and self._rendition_key(file_path, signature, width, height, dpr) in self.resize_cache:
+            return
+        self._submit_render(
+            cache_key, file_path, signature, (width, height), dpr, draft, priority=priority, prefetch=True
+        )
+
+    def _warm_pixmap_cache(self) -> None:
+        """유휴 시간에 호출: 이웃 렌디션 하나를 QPixmap으로 변환하고 다시 예약.
+
+        한 번에 하나씩만 변환해 4K 이미지 여러 장의 fromImage 비용이 한 이벤트
+        루프 반복에 몰려 입력 처리가 밀리지 않게 한다.
+        """
+        if not self.images:
+            return
+        width, height, dpr = self._render_target()
+        wanted = [self.images[self.current_index]] + [self.images[index] for index in self._neighbor_indices()]
+        wanted_keys = [
+            self._rendition_key(file_path, self.signatures.get(file_path), width, height, dpr)
+            for file_path in wanted
+        ]
+
+        # 이웃 범위를 벗어난 픽스맵은 바로 내려 GPU/공유 메모리를 돌려준다
+        for cache_key in [key for key in self.pixmap_cache if key not in wanted_keys]:
+            self._pixmap_cache_memory -= self._pixmap_memory(self.pixmap_cache.pop(cache_key))
+
+        for cache_key in wanted_keys:
+            if cache_key in self.pixmap_cache:
+                continue
+            qimage = self.resize_cache.get(cache_key)
+            if qimage is None:
+                continue
+            self._store_pixmap(cache_key, QPixmap.fromImage(qimage))
+            self._pixmap_warmup_timer.start()
+            return
+
+    @staticmethod
+    def _pixmap_memory(pixmap: QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * max(1, pixmap.depth() // 8)
 
-    def _apply_image(self, seq: int, file_path: str, qimage: QImage) -> None:
+    def _store_pixmap(self, cache_key: str, pixmap: QPixmap) -> None:
+        pixmap_memory = self._pixmap_memory(pixmap)
+        max_pixmap_memory = MAX_PIXMAP_CACHE_MB * 1024 * 1024
+        existing = self.pixmap_cache.pop(cache_key, None)
+        if existing is not None:
+            self._pixmap_cache_memory -= self._pixmap_memory(existing)
+        if not 0 < pixmap_memory <= max_pixmap_memory:
+            return
+        while self.pixmap_cache and self._pixmap_cache_memory + pixmap_memory > max_pixmap_memory:
+            _, oldest = self.pixmap_cache.popitem(last=False)
+            self._pixmap_cache_memory -= self._pixmap_memory(oldest)
+        self.pixmap_cache[cache_key] = pixmap
+        self._pixmap_cache_memory += pixmap_memory
+
+    def invalidate_path(self, file_path: str) -> None:
+        """한 파일의 항목만 모든 캐시 계층에서 제거. 다른 파일의 캐시는 그대로 유지된다."""
+        prefix = f"{file_path}::"
+        self.signatures.invalidate(file_path)
+        self._view_orientations.pop(file_path, None)
+        self.raw_cache.invalidate_prefix(prefix)
+        self.bytes_cache.invalidate(file_path)
+        for cache_key in [key for key in self.resize_cache if key.startswith(prefix)]:
+            self._resize_cache_memory -= self.resize_cache.pop(cache_key).sizeInBytes()
+            self.telemetry.on_rendition_evicted(cache_key)
+        for cache_key in [key for key in self.pixmap_cache if key.startswith(prefix)]:
+            self._pixmap_cache_memory -= self._pixmap_memory(self.pixmap_cache.pop(cache_key))
+        for cache_key in [key for key in self._in_flight if key.startswith(prefix)]:
+            del self._in_flight[cache_key]
+        self.thumbnails.invalidate(file_path)
+
+    def _rekey_transformed_renditions(self, old_prefix: str, new_prefix: str, operation: str) -> None:
+        """회전/뒤집기로 키 앞부분(서명, 화면에서만 돌린 방향)만 바뀐 렌디션을 변환해 새 키로 옮긴다.
+
+        파일은 방향 태그만 바뀌었거나 그대로이므로 다시 디코딩할 필요가 없다. 90도 회전으로 화면
+        칸에 맞는 크기가 달라진 렌디션은 저품질 자리로 옮겨, 표시할 때 원본 캐시에서
+        LANCZOS로 다시 리샘플링되게 한다. 픽스맵은 버리고 유휴 시간에 다시 올린다.
+        """
+        # 원본 품질 렌디션을 먼저 옮겨, 같은 자리의 저품질 렌디션보다 우선하게 한다
+        old_keys = sorted(
+            (key for key in self.resize_cache if key.startswith(old_prefix)), key=lambda key: key.endswith("::draft")
+        )
+        moved = {key: self.resize_cache.pop(key) for key in old_keys}
+        for cache_key, qimage in moved.items():
+            self._resize_cache_memory -= qimage.sizeInBytes()
+        for cache_key, qimage in moved.items():
+            suffix = cache_key[len(old_prefix):]
+            width, height = (int(value) for value in suffix.split("@", 1)[0].split("x"))
+            transformed, exact = self._transform_rendition(qimage, operation, width, height)
+            if not exact and not suffix.endswith("::draft"):
+                suffix += "::draft"
+            if new_prefix + suffix not in self.resize_cache:
+                self._store_rendition(new_prefix + suffix, transformed)
+        for cache_key in [key for key in self.pixmap_cache if key.startswith(old_prefix)]:
+            self._pixmap_cache_memory -= self._pixmap_memory(self.pixmap_cache.pop(cache_key))
+        # 이전 방향으로 진행 중인 렌더링은 결과가 와도 쓸 곳이 없다
+        for cache_key in [key for key in self._in_flight if key.startswith(old_prefix)]:
+            del self._in_flight[cache_key]
+
+    @staticmethod
+    def _transform_rendition(rendition, operation: str, width: int, height: int):
+        """렌디션(QImage/QPixmap)을 회전/뒤집고 (결과, 원본 품질 유지 여부)를 반환.
+
+        90도 회전 뒤 (width, height) 칸에 맞는 크기가 달라지면 Qt의 부드러운
+        리샘플링으로 맞추고 원본 품질이 아니라고 알린다.
+        """
+        dpr = rendition.devicePixelRatio()
+        transformed = rendition.transformed(_OPERATION_TRANSFORMS[operation])
+        transformed.setDevicePixelRatio(dpr)
+        fit_width, fit_height = fit_size(transformed.width(), transformed.height(), width, height)
+        if abs(fit_width - transformed.width()) <= 1 and abs(fit_height - transformed.height()) <= 1:
+            return transformed, True
+        scaled = transformed.scaled(
+            fit_width, fit_height, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation
+        )
+        scaled.setDevicePixelRatio(dpr)
+        return scaled, False
+
+    def _clear_rendition_caches(self) -> None:
+        self.resize_cache.clear()
+        self._resize_cache_memory = 0
+        self.pixmap_cache.clear()
+        self._pixmap_cache_memory = 0
+        # 이전 크기로 진행 중인 프리페치 결과는 버린다. 지금 표시를 기다리는 작업만 남긴다
+        self._in_flight = {
+            cache_key: pending for cache_key, pending in self._in_flight.items() if self._load_seq in pending.waiters
+        }
+        self.telemetry.forget_prefetches()
+
+    def _render_target(self) -> Tuple[int, int, float]:
+        """렌디션을 만들 물리 픽셀 크기와 그때의 devicePixelRatio.
+
+        논리 픽셀 크기로 렌더링하면 2x 디스플레이에서 Qt가 픽스맵을 다시 확대해
+        LANCZOS로 얻은 선명도를 잃으므로, 처음부터 물리 해상도로 만든다.
+        비교 모드에서는 칸 하나의 크기다.
+        """
+        dpr = self.devicePixelRatioF()
+        if self.compare_panes:
+            width, height = self.compare_view.pane_size()
+        else:
+            width = self.image_container.width() or DEFAULT_CONTAINER_SIZE[0]
+            height = self.image_container.height() or DEFAULT_CONTAINER_SIZE[1]
+        return max(1, round(width * dpr)), max(1, round(height * dpr)), dpr
+
+    def _rendition_prefix(self, file_path: str, signature) -> str:
+        # 화면에서만 돌린 방향도 키에 넣어, 이전 방향으로 진행 중이던 렌더링 결과가 새 방향의 요청을 채우지 않게 한다
+        orientation = self._view_orientations.get(file_path, 1)
+        if orientation == 1:
+            return f"{file_path}::{signature}::"
+        return f"{file_path}::o{orientation}::{signature}::"
+
+    def _rendition_key(
+        self, file_path: str, signature, width: int, height: int, dpr: float, draft: bool = False
+    ) -> str:
+        key = f"{self._rendition_prefix(file_path, signature)}{width}x{height}@{dpr:g}"
+        return f"{key}::draft" if draft else key
+
+    def _apply_image(self, seq: int, file_path: str, qimage: QImage, cache_key: str) -> None:
         if seq != self._load_seq:
             return
-        pixmap = QPixmap.fromImage(qimage)
+        pixmap = self.pixmap_cache.get(cache_key)
+        self.telemetry.lookup("pixmap", pixmap is not None)
+        self.telemetry.on_rendition_shown(cache_key)
+        if self._navigation_started is not None and self._navigation_started[0] == seq:
+            _, started, image_format = self._navigation_started
+            self.telemetry.on_navigation(image_format, (time.perf_counter() - started) * 1000)
+            self._navigation_started = None
+        if pixmap is None:
+            pixmap = QPixmap.fromImage(qimage)
+            self._store_pixmap(cache_key, pixmap)
+        else:
+            self.pixmap_cache.move_to_end(cache_key)
         self.current_pixmap = pixmap
         self.current_path = file_path
         self.image_label.setObjectName("")
@@ -523,10 +1277,13 @@ class ImageViewerWindow(QMainWindow):
         self.image_label.setPixmap(pixmap)
         self.title_label.setText(f"{APP_DISPLAY_NAME} - {os.path.basename(file_path)}")
         self.counter_label.setText(f"{self.current_index + 1} / {len(self.images)}")
-        self.filename_label.setText(os.path.basename(file_path))
+        self._update_filename_label()
+        self.slideshow.on_slide_displayed(self.current_index)
 
-    def _on_image_error(self, seq: int, message: str) -> None:
-        if seq != self._load_seq:
+    def _show_load_error(self, message: str) -> None:
+        if self.slideshow.running:
+            # 무인 디스플레이에서 모달 오류 창으로 멈추지 않도록 건너뛴다
+            self.slideshow.on_slide_failed(self.current_index)
             return
         self.current_pixmap = None
         self.current_path = None
@@ -549,14 +1306,471 @@ class ImageViewerWindow(QMainWindow):
         self.prev_btn.setEnabled(has_images and self.current_index > 0)
         self.next_btn.setEnabled(has_images and self.current_index < len(self.images) - 1)
         self.delete_btn.setEnabled(bool(self.current_path))
+        self._sync_scrubber()
 
     def show_next_image(self) -> None:
         if self.images and self.current_index < len(self.images) - 1:
             self.show_image(self.current_index + 1)
+            self.slideshow.restart_from_current()
 
     def show_previous_image(self) -> None:
         if self.images and self.current_index > 0:
             self.show_image(self.current_index - 1)
+            self.slideshow.restart_from_current()
+
+    # ------------------------------------------------------------------
+    # 정렬
+    # ------------------------------------------------------------------
+    def set_sort_mode(self, mode: str) -> None:
+        self.sort_mode = mode
+        if mode == "name" or self.metadata_index.complete:
+            self._apply_sort()
+        # 색인이 아직 만들어지는 중이면 완료 시 _on_metadata_indexed에서 정렬한다
+
+    def _on_metadata_indexed(self, directory: str) -> None:
+        if self.sort_mode != "name" and self.images and directory == self.current_directory:
+            self._apply_sort()
+
+    def _name_sort_key(self) -> Callable[[str], tuple]:
+        # 하위 폴더 포함 모드와 압축 파일은 목록 기준 경로에 대한 상대 경로로 정렬
+        if self.current_directory and (self.recursive or split_member_path(self.current_directory) is not None):
+            root = self.current_directory
+            return lambda file_path: natural_path_key(file_path, root)
+        return natural_sort_key
+
+    def _apply_sort(self) -> None:
+        """self.images를 현재 정렬 모드로 다시 정렬. 보고 있던 이미지는 그대로 유지된다."""
+        if not self.images:
+            return
+        current = self.images[self.current_index]
+        key = self._name_sort_key() if self.sort_mode == "name" else self.metadata_index.sort_key(self.sort_mode)
+        self.images.sort(key=key)
+        self.current_index = self.images.index(current)
+        if self.current_path:
+            self.counter_label.setText(f"{self.current_index + 1} / {len(self.images)}")
+        self._update_nav_state()
+        if self.thumbnail_grid.isVisible():
+            self.thumbnail_grid.set_images(self.images, self.current_index)
+        # 이웃이 바뀌었으므로 프리페치/미리 읽기 대상을 새 순서로 다시 잡는다
+        self._schedule_neighbor_warmup()
+        self.io_scheduler.schedule(self.images, self.current_index)
+        self.slideshow.restart_from_current()
+
+    # ------------------------------------------------------------------
+    # 하위 폴더 포함 (재귀) 모드
+    # ------------------------------------------------------------------
+    def set_recursive(self, enabled: bool) -> None:
+        self.recursive = enabled
+        if self.images:
+            self.open_file(self.images[self.current_index])
+
+    def _on_scan_found(self, generation: int, paths: List[str]) -> None:
+        if generation != self._scan_generation:
+            return
+        self._scan_buffer.extend(paths)
+        if not self._scan_flush_timer.isActive():
+            self._scan_flush_timer.start()
+
+    def _flush_scan_results(self) -> None:
+        """쌓인 스캔 결과를 현재 목록에 이름 순으로 병합 (보고 있는 이미지는 유지)."""
+        if not self._scan_buffer:
+            return
+        name_key = self._name_sort_key()
+        keys = self._scan_keys
+        for file_path in self.images:
+            if file_path not in keys:
+                keys[file_path] = name_key(file_path)
+        for file_path in self._scan_buffer:
+            keys[file_path] = name_key(file_path)
+        incoming = sorted(self._scan_buffer, key=keys.__getitem__)
+        self._scan_buffer = []
+
+        current = self.images[self.current_index] if self.images else None
+        self.images = list(heapq.merge(self.images, incoming, key=keys.__getitem__))
+        if current is not None:
+            self.current_index = self.images.index(current)
+            if self.current_path:
+                self.counter_label.setText(f"{self.current_index + 1} / {len(self.images)}")
+        elif self.images:
+            self.show_image(0)
+        self._update_nav_state()
+
+    def _on_scan_finished(self, generation: int) -> None:
+        if generation != self._scan_generation:
+            return
+        self._flush_scan_results()
+        self._scan_keys = {}
+        if self.thumbnail_grid.isVisible():
+            self.thumbnail_grid.set_images(self.images, self.current_index)
+        self._schedule_neighbor_warmup()
+        self.io_scheduler.schedule(self.images, self.current_index)
+        if self.current_directory:
+            self.metadata_index.build(self.current_directory, self.images)
+
+    # ------------------------------------------------------------------
+    # 스크러버
+    # ------------------------------------------------------------------
+    def _sync_scrubber(self) -> None:
+        if self.scrubber.isSliderDown():
+            return
+        self.scrubber.blockSignals(True)
+        self.scrubber.setRange(0, max(0, len(self.images) - 1))
+        self.scrubber.setValue(self.current_index if self.images else 0)
+        self.scrubber.blockSignals(False)
+        self.scrubber.setEnabled(len(self.images) > 1)
+
+    def _on_scrubber_changed(self, index: int) -> None:
+        if not self.images:
+            return
+        if not self.scrubber.isSliderDown():
+            # 홈 클릭/휠처럼 한 번에 끝나는 이동은 바로 확정
+            self._scrub_index = index
+            self._commit_scrub()
+            return
+        # 드래그 중에는 원본 디코딩을 절대 큐에 넣지 않는다: 썸네일 계층만 사용
+        self._scrub_index = index
+        self._scrub_settle_timer.start()
+        file_path = self.images[index]
+        self.counter_label.setText(f"{index + 1} / {len(self.images)}")
+        self.filename_label.setText(os.path.basename(file_path))
+        ready = self.pixmap_cache.get(self._rendition_key_for(index))
+        if ready is not None:
+            self.image_label.setPixmap(ready)
+        else:
+            self._show_preview(file_path)
+        start = max(0, index - SCRUBBER_PREVIEW_NEIGHBORS)
+        end = min(len(self.images), index + SCRUBBER_PREVIEW_NEIGHBORS + 1)
+        nearby = sorted(range(start, end), key=lambda row: abs(row - index))
+        self.thumbnails.request(self.images[row] for row in nearby)
+
+    def _commit_scrub(self) -> None:
+        self._scrub_settle_timer.stop()
+        index = self._scrub_index
+        if index is None or not 0 <= index < len(self.images):
+            return
+        if not self.scrubber.isSliderDown():
+            self._scrub_index = None
+        if index != self.current_index or self.current_path is None:
+            self.show_image(index)
+            self.slideshow.restart_from_current()
+
+    def _on_scrub_thumbnail_ready(self, file_path: str) -> None:
+        index = self._scrub_index
+        if index is not None and index < len(self.images) and self.images[index] == file_path:
+            self._show_preview(file_path)
+
+    def _show_preview(self, file_path: str) -> bool:
+        """썸네일 계층의 미리보기를 화면 크기로 띄운다. 원본 로드 전까지만 보이는 임시 화면."""
+        thumbnail = self.thumbnails.get(file_path)
+        if thumbnail is None:
+            return False
+        width, height, dpr = self._render_target()
+        preview = thumbnail.scaled(
+            width, height, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
+        )
+        preview.setDevicePixelRatio(dpr)
+        self.image_label.setPixmap(preview)
+        return True
+
+    # ------------------------------------------------------------------
+    # 세션 저장 / 복원
+    # ------------------------------------------------------------------
+    def _restore_session(self) -> None:
+        """지난 세션의 파일로 돌아가고, 그때 최근에 보던 렌디션을 백그라운드로 다시 만든다.
+
+        파일이 없어졌으면 같은 폴더의 같은 위치(current_index)를 연다. 이웃 프리페치와
+        같은 낮은 우선순위로 렌더링하고 썸네일도 함께 요청해, 렌더링이 끝나기 전에
+        그 이미지로 가더라도 미리보기부터 바로 뜨게 한다.
+        """
+        if self.images:
+            return  # 실행 직후에 이미 다른 파일이 열렸다 (드래그 앤 드롭, OS 파일 열기 요청)
+        target = self.session.file_path
+        member = split_member_path(target) if target else None
+        if target and not os.path.isfile(member[0] if member else target):
+            target = None
+        if target is None and self.session.directory and os.path.isdir(self.session.directory):
+            images = get_image_files_from_directory(self.session.directory)
+            if images:
+                target = images[min(self.session.index, len(images) - 1)]
+        if target is None:
+            return
+        self.open_file(target)
+        if not self.images:
+            return
+        current = self.images[self.current_index]
+        self._session_warm_paths = [file_path for file_path in self.session.hot_paths() if file_path != current]
+        self.thumbnails.request(self._session_warm_paths)
+        # 현재 이미지가 표시되면 _schedule_neighbor_warmup에서 프리페치를 건다
+
+    def _prefetch_session_renditions(self) -> None:
+        if not self._session_warm_paths:
+            return
+        wanted = set(self._session_warm_paths)
+        found = {file_path: index for index, file_path in enumerate(self.images) if file_path in wanted}
+        for file_path in self._session_warm_paths:
+            if file_path in found:
+                self.prefetch_index(found[file_path])
+        # 재귀 스캔이 끝나지 않았으면 아직 못 찾은 경로를 남겨 두고, 끝났으면 포기한다
+        if self.folder_scanner.scanning:
+            self._session_warm_paths = [file_path for file_path in self._session_warm_paths if file_path not in found]
+        else:
+            self._session_warm_paths = []
+
+    def _save_session(self) -> None:
+        if not self.isFullScreen():
+            # 전체 화면으로 끝냈으면 그 전의 창 위치/크기를 유지한다
+            self.session.geometry = self.saveGeometry()
+        if self.images:
+            self.session.file_path = self.images[self.current_index]
+            self.session.directory = self.current_directory
+            self.session.index = self.current_index
+            # 리사이즈 캐시는 LRU 순서: 끝에 있을수록 최근에 표시/프리페치된 렌디션
+            self.session.hot_renditions = [
+                cache_key for cache_key in reversed(self.resize_cache) if not cache_key.endswith("::draft")
+            ][:SESSION_WARM_RENDITIONS]
+        self.session.save()
+
+    # ------------------------------------------------------------------
+    # 비슷한 이미지 묶음
+    # ------------------------------------------------------------------
+    def find_similar_images(self) -> None:
+        """현재 목록 전체의 dHash를 백그라운드로 계산(저장된 해시는 재사용)해 묶는다."""
+        if not self.images or not self.current_directory:
+            return
+        self.similar_groups = []
+        self._similar_progress = f"비슷한 이미지 찾는 중 0/{len(self.images)}"
+        self._update_filename_label()
+        self.similar.start(self.current_directory, self.images)
+
+    def _on_similar_progress(self, done: int, total: int) -> None:
+        self._similar_progress = f"비슷한 이미지 찾는 중 {done}/{total}"
+        self._update_filename_label()
+
+    def _on_similar_grouped(self, groups: List[List[str]]) -> None:
+        self.similar_groups = groups
+        self._similar_progress = "" if groups else "비슷한 이미지 없음"
+        self._update_filename_label()
+
+    def _ordered_similar_groups(self) -> List[List[int]]:
+        """묶음을 현재 탐색 목록의 인덱스로 (정렬이 바뀌어도 지금 순서를 따른다)."""
+        positions = {file_path: index for index, file_path in enumerate(self.images)}
+        groups = [sorted(positions[path] for path in group if path in positions) for group in self.similar_groups]
+        return sorted(group for group in groups if len(group) > 1)
+
+    def jump_similar_group(self, step: int) -> None:
+        """다음(step=1)/이전(step=-1) 비슷한 이미지 묶음의 첫 장으로 이동."""
+        groups = self._ordered_similar_groups()
+        if not groups:
+            return
+        # 묶음 안에 있으면 그 묶음의 첫 장을 기준으로 해서, 이전 묶음 이동이 같은 묶음에 머물지 않게 한다
+        anchor = next((group[0] for group in groups if self.current_index in group), self.current_index)
+        if step > 0:
+            target = next((group[0] for group in groups if group[0] > anchor), None)
+        else:
+            target = next((group[0] for group in reversed(groups) if group[0] < anchor), None)
+        if target is not None:
+            self.show_image(target)
+            self.slideshow.restart_from_current()
+
+    def _update_filename_label(self) -> None:
+        if self.compare_panes or not self.current_path:
+            return
+        parts = [os.path.basename(self.current_path)]
+        groups = self._ordered_similar_groups() if self.similar_groups else []
+        for number, group in enumerate(groups, 1):
+            if self.current_index in group:
+                parts.append(
+                    f"비슷한 이미지 묶음 {number}/{len(groups)} ({group.index(self.current_index) + 1}/{len(group)})"
+                )
+                break
+        if self._similar_progress:
+            parts.append(self._similar_progress)
+        self.filename_label.setText("  ·  ".join(parts))
+
+    # ------------------------------------------------------------------
+    # 비교 모드
+    # ------------------------------------------------------------------
+    def toggle_compare(self) -> None:
+        self.set_compare_panes(0 if self.compare_panes else COMPARE_PANES)
+
+    def set_compare_panes(self, count: int) -> None:
+        """비교 모드 칸 수를 바꾼다 (2 미만이면 한 장 보기).
+
+        칸들은 현재 이미지부터 이어지는 이미지를 보여 주며, 원본/바이트/렌디션 캐시와
+        미리 읽기 스케줄러를 한 장 보기와 그대로 공유한다. 그래서 한 칸의 이웃이
+        다른 칸의 이미지여도 한 번만 디코딩된다.
+        """
+        count = min(count, COMPARE_MAX_PANES) if count >= 2 else 0
+        if count == self.compare_panes:
+            return
+        self.compare_panes = count
+        self._load_seq += 1  # 이전 모드의 진행 중 로드 결과는 버린다
+        self._refine_timer.stop()
+        self._compare_detail_in_flight.clear()
+        self.compare_view.set_pane_count(count)
+        self.compare_view.reset_zoom()
+        for pane in self.compare_view.panes:
+            pane.installEventFilter(self)
+        self.image_label.setVisible(not count)
+        self.compare_view.setVisible(bool(count))
+        self.image_container.layout().activate()  # 칸 크기를 확정한 뒤 렌디션 크기를 정한다
+        if self.images:
+            self.show_image(self.current_index)
+
+    def _show_compare(self) -> None:
+        """현재 이미지부터 칸 수만큼 이어지는 이미지를 나란히 표시.
+
+        화면에 보이는 칸은 현재 이미지 로드와 같은 우선순위로, 칸 묶음 바깥의 이웃은
+        평소처럼 낮은 우선순위로 미리 렌더링한다. 모두 공유 캐시의 같은 키를 쓰므로
+        이미 진행 중이거나 만들어 둔 렌디션은 다시 요청하지 않는다.
+        """
+        self._load_seq += 1
+        shown = self.images[self.current_index:self.current_index + self.compare_panes]
+        for offset, pane in enumerate(self.compare_view.panes):
+            if offset >= len(shown):
+                pane.set_image(None, None)
+                continue
+            pixmap, full_quality = self._compare_pixmap(self.current_index + offset)
+            pane.set_image(shown[offset], pixmap)
+            if not full_quality:
+                self.prefetch_index(self.current_index + offset, priority=0)
+        self.current_path = shown[0]
+        self.current_pixmap = self.compare_view.panes[0].pixmap
+        names = [os.path.basename(file_path) for file_path in shown]
+        self.title_label.setText(f"{APP_DISPLAY_NAME} - {' | '.join(names)}")
+        self.counter_label.setText(
+            f"{self.current_index + 1}-{self.current_index + len(shown)} / {len(self.images)}"
+        )
+        self.filename_label.setText(" | ".join(names))
+        self.slideshow.on_slide_displayed(self.current_index)
+        self._update_nav_state()
+        self._schedule_neighbor_warmup()
+        self.io_scheduler.schedule(self.images, self.current_index)
+        self._request_compare_details()
+
+    def _compare_pixmap(self, index: int) -> Tuple[Optional[QPixmap], bool]:
+        """칸에 바로 띄울 수 있는 가장 좋은 픽스맵과 그것이 원본 품질인지."""
+        for draft in (False, True):
+            cache_key = self._rendition_key_for(index, draft)
+            pixmap = self.pixmap_cache.get(cache_key)
+            if pixmap is None and cache_key in self.resize_cache:
+                pixmap = QPixmap.fromImage(self.resize_cache[cache_key])
+                self._store_pixmap(cache_key, pixmap)
+            if pixmap is not None:
+                self.telemetry.on_rendition_shown(cache_key)
+                return pixmap, not draft
+        thumbnail = self.thumbnails.get(self.images[index])
+        if thumbnail is None:
+            return None, False
+        width, height, dpr = self._render_target()
+        preview = thumbnail.scaled(
+            width, height, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
+        )
+        preview.setDevicePixelRatio(dpr)
+        return preview, False
+
+    def _refresh_compare_panes(self) -> None:
+        """프리페치가 끝난 렌디션을 해당 칸에 반영 (이미 같은 픽스맵이면 그대로 둔다)."""
+        for offset, pane in enumerate(self.compare_view.panes):
+            index = self.current_index + offset
+            if pane.file_path is None or index >= len(self.images) or self.images[index] != pane.file_path:
+                continue
+            pixmap, full_quality = self._compare_pixmap(index)
+            if pixmap is not None and pixmap is not pane.pixmap and (full_quality or pane.pixmap is None):
+                pane.set_image(pane.file_path, pixmap)
+        self.current_pixmap = self.compare_view.panes[0].pixmap if self.compare_view.panes else None
+
+    def _request_compare_details(self) -> None:
+        """확대 중: 칸마다 보이는 영역만 원본에서 칸 해상도로 렌더링.
+
+        원본은 공유 원본 캐시에서 꺼내므로, 확대/이동을 반복해도 다시 디코딩하지 않고
+        리샘플링만 한다. 새 요청이 나가면 이전 요청의 결과는 버린다.
+        """
+        self._compare_detail_in_flight.clear()
+        if not self.compare_panes or self.compare_view.zoom <= 1.0:
+            return
+        dpr = self.devicePixelRatioF()
+        for offset, pane in enumerate(self.compare_view.panes):
+            visible = pane.visible_region()
+            if visible is None or pane.file_path is None:
+                continue
+            region, target = visible
+            if pane.detail_region == region:
+                continue
+            signature = self.signatures.get(pane.file_path)
+            target_size = (max(1, round(target.width() * dpr)), max(1, round(target.height() * dpr)))
+            request_key = self._rendition_key(pane.file_path, signature, *target_size, dpr) + f"::{region}"
+            self._compare_detail_in_flight[request_key] = (offset, pane.file_path, region)
+            task = _ImageLoadTask(
+                request_key, pane.file_path, signature, target_size, self.decoder_engines,
+                self.bytes_cache, self._process_decoder, dpr, resample_policy=self.resample_policy, region=region,
+                orientation=self._view_orientations.get(pane.file_path, 1),
+            )
+            task.signals.loaded.connect(self._on_compare_detail_loaded)
+            task.signals.error.connect(self._on_compare_detail_error)
+            self.thread_pool.start(task)
+
+    def _on_compare_detail_loaded(self, request_key: str, file_path: str, qimage: QImage, full_quality: bool) -> None:
+        request = self._compare_detail_in_flight.pop(request_key, None)
+        if request is None or request[0] >= len(self.compare_view.panes):
+            return
+        offset, file_path, region = request
+        self.compare_view.panes[offset].set_detail(file_path, region, QPixmap.fromImage(qimage))
+
+    def _on_compare_detail_error(self, request_key: str, message: str) -> None:
+        # 확대 영역을 못 만들면 칸에 맞춘 렌디션을 늘려 그린 화면이 그대로 남는다
+        self._compare_detail_in_flight.pop(request_key, None)
+
+    # ------------------------------------------------------------------
+    # 썸네일 격자
+    # ------------------------------------------------------------------
+    def toggle_thumbnail_grid(self) -> None:
+        if self.thumbnail_grid.isVisible():
+            self._hide_thumbnail_grid()
+            return
+        if not self.images:
+            return
+        self.image_container.hide()
+        self.thumbnail_grid.show()
+        self.thumbnail_grid.set_images(self.images, self.current_index)
+        self.thumbnail_grid.setFocus()
+
+    def _hide_thumbnail_grid(self) -> None:
+        self.thumbnail_grid.hide()
+        self.image_container.show()
+        self.setFocus()
+
+    def _on_grid_image_activated(self, index: int) -> None:
+        self._hide_thumbnail_grid()
+        self.show_image(index)
+        self.slideshow.restart_from_current()
+
+    # ------------------------------------------------------------------
+    # 슬라이드쇼
+    # ------------------------------------------------------------------
+    def toggle_slideshow(self) -> None:
+        if self.slideshow.running:
+            self.slideshow.stop()
+        else:
+            self.slideshow.start()
+
+    def _on_slideshow_deadline_missed(self, index: int, late_ms: float) -> None:
+        # 통계 패널에 보이고 종료 시 세션 통계 JSON에 남는다: 간격/프리페치 설정을 고칠 근거
+        if 0 <= index < len(self.images):
+            self.telemetry.on_slideshow_late(self.images[index], late_ms)
+
+    def choose_slideshow_interval(self) -> None:
+        seconds, ok = QInputDialog.getDouble(
+            self,
+            "슬라이드쇼 간격",
+            "전환 간격(초):",
+            self.slideshow.interval_ms / 1000,
+            0.5,
+            3600.0,
+            1,
+        )
+        if ok:
+            self.slideshow.set_interval(int(seconds * 1000))
 
     # ------------------------------------------------------------------
     # Win32 프레임리스 스냅 / 창 상태 이벤트
@@ -565,6 +1779,20 @@ class ImageViewerWindow(QMainWindow):
         super().showEvent(event)
         if IS_WINDOWS and not self._win32_initialized:
             self._init_win32_frameless()
+        if not self._screen_signal_connected and self.windowHandle() is not None:
+            self._screen_signal_connected = True
+            self.windowHandle().screenChanged.connect(self._on_screen_changed)
+
+    def _on_screen_changed(self, _screen) -> None:
+        """배율이 다른 화면으로 옮겨지면 현재 이미지만 새 배율로 다시 렌더링.
+
+        캐시 키에 배율이 들어 있어 다른 배율의 렌디션은 그대로 남으므로,
+        원래 화면으로 돌아오면 다시 디코딩하지 않고 바로 표시된다.
+        """
+        if self.current_pixmap is None or not self.images:
+            return
+        if self.current_pixmap.devicePixelRatio() != self.devicePixelRatioF():
+            self.show_image(self.current_index)
 
     def _init_win32_frameless(self) -> None:
         self._win32_initialized = True
@@ -608,6 +1836,26 @@ class ImageViewerWindow(QMainWindow):
                 pass
         return super().nativeEvent(event_type, message)
 
+    def closeEvent(self, event) -> None:
+        self.slideshow.stop()
+        self._refine_timer.stop()
+        self.io_scheduler.cancel()
+        self.thumbnails.cancel()
+        self._tier_usage_timer.stop()
+        self.decoder_engines.save()
+        self._save_session()
+        self._dump_telemetry()
+        self.metadata_index.cancel()
+        self.similar.cancel()
+        self.folder_scanner.cancel()
+        archive_pool.close()
+        if self._process_decoder is not None:
+            # 공유 메모리를 감싼 렌디션을 놓아야 종료 전에 블록을 닫을 수 있다
+            self._clear_rendition_caches()
+            self._process_decoder.shutdown()
+        self._release_retired_decoders()
+        super().closeEvent(event)
+
     # ------------------------------------------------------------------
     # 창 크기 변경 / 전체 화면
     # ------------------------------------------------------------------
@@ -617,8 +1865,7 @@ class ImageViewerWindow(QMainWindow):
             self._resize_timer.start()
 
     def _on_resize_settled(self) -> None:
-        self.resize_cache.clear()
-        self._resize_cache_memory = 0
+        self._clear_rendition_caches()
         if self.images:
             self.show_image(self.current_index)
 
@@ -666,7 +1913,9 @@ class ImageViewerWindow(QMainWindow):
     def mouseDoubleClickEvent(self, event) -> None:
         if event.button() == Qt.MouseButton.LeftButton:
             child = self.childAt(event.position().toPoint())
-            if child in (self.image_container, self.image_label, self.central_widget):
+            if child in (self.image_container, self.image_label, self.central_widget, self.compare_view) or isinstance(
+                child, ComparePane
+            ):
                 self.toggle_fullscreen()
                 event.accept()
                 return
@@ -747,7 +1996,7 @@ class ImageViewerWindow(QMainWindow):
                 self.title_bar, self.control_bar,
                 self.title_label, self.counter_label, self.filename_label,
             }
-            if child is None or child in draggable:
+            if child is None or child in draggable or child is self.compare_view or isinstance(child, ComparePane):
                 if IS_WINDOWS and child in (self.title_bar, self.title_label):
                     hwnd = int(self.winId())
                     user32.ReleaseCapture()
@@ -795,7 +2044,11 @@ class ImageViewerWindow(QMainWindow):
         meta = bool(event.modifiers() & Qt.KeyboardModifier.MetaModifier)
         no_nav_modifier = not (ctrl or alt or meta)
 
-        if key == Qt.Key.Key_Left and no_nav_modifier:
+        if self.thumbnail_grid.isVisible() and key in (Qt.Key.Key_Escape, Qt.Key.Key_G) and no_nav_modifier:
+            self._hide_thumbnail_grid()
+        elif key == Qt.Key.Key_G and no_nav_modifier:
+            self.toggle_thumbnail_grid()
+        elif key == Qt.Key.Key_Left and no_nav_modifier:
             self.show_previous_image()
         elif key == Qt.Key.Key_Right and no_nav_modifier:
             self.show_next_image()
@@ -803,6 +2056,24 @@ class ImageViewerWindow(QMainWindow):
             self.close()
         elif key in (Qt.Key.Key_Return, Qt.Key.Key_Enter) and no_nav_modifier:
             self.toggle_fullscreen()
+        elif key == Qt.Key.Key_S and no_nav_modifier:
+            self.toggle_slideshow()
+        elif key == Qt.Key.Key_BracketRight and no_nav_modifier:
+            self.jump_similar_group(1)
+        elif key == Qt.Key.Key_BracketLeft and no_nav_modifier:
+            self.jump_similar_group(-1)
+        elif key == Qt.Key.Key_I and no_nav_modifier:
+            self.toggle_stats_panel()
+        elif key == Qt.Key.Key_C and no_nav_modifier:
+            self.toggle_compare()
+        elif key == Qt.Key.Key_R and no_nav_modifier:
+            self.transform_current_image("rotate_cw")
+        elif key == Qt.Key.Key_L and no_nav_modifier:
+            self.transform_current_image("rotate_ccw")
+        elif key == Qt.Key.Key_H and no_nav_modifier:
+            self.transform_current_image("flip_horizontal")
+        elif key == Qt.Key.Key_V and no_nav_modifier:
+            self.transform_current_image("flip_vertical")
         elif ctrl and key == Qt.Key.Key_O:
             self.select_image()
         elif ctrl and key == Qt.Key.Key_R:
@@ -810,7 +2081,8 @@ class ImageViewerWindow(QMainWindow):
         elif ctrl and key == Qt.Key.Key_M:
             self.show_memory_info()
         elif key in (Qt.Key.Key_Delete, Qt.Key.Key_Backspace) and no_nav_modifier:
-            self.delete_current_image()
+            shift = bool(event.modifiers() & Qt.KeyboardModifier.ShiftModifier)
+            self.delete_current_image(permanent=shift)
         else:
             super().keyPressEvent(event)
 
@@ -820,7 +2092,7 @@ class ImageViewerWindow(QMainWindow):
     def dragEnterEvent(self, event) -> None:
         if event.mimeData().hasUrls():
             files = [u.toLocalFile() for u in event.mimeData().urls()]
-            if files and is_image_file(files[0]):
+            if files and (is_image_file(files[0]) or is_archive_file(files[0])):
                 event.acceptProposedAction()
                 return
         event.ignore()
@@ -841,11 +2113,93 @@ class ImageViewerWindow(QMainWindow):
         menu.addAction(open_action)
         menu.addSeparator()
 
-        delete_action = QAction("Delete Current Image", self)
+        grid_action = QAction("Hide Thumbnails" if self.thumbnail_grid.isVisible() else "Show Thumbnails", self)
+        grid_action.setEnabled(bool(self.images))
+        grid_action.triggered.connect(self.toggle_thumbnail_grid)
+        menu.addAction(grid_action)
+
+        compare_menu = menu.addMenu("Compare")
+        compare_menu.setEnabled(bool(self.images))
+        compare_group = QActionGroup(compare_menu)
+        for count in [0] + list(range(2, COMPARE_MAX_PANES + 1)):
+            compare_action = QAction("Off" if not count else f"{count} Panes", compare_menu)
+            compare_action.setCheckable(True)
+            compare_action.setChecked(count == self.compare_panes)
+            compare_action.triggered.connect(lambda checked=False, count=count: self.set_compare_panes(count))
+            compare_group.addAction(compare_action)
+            compare_menu.addAction(compare_action)
+
+        similar_menu = menu.addMenu("Similar Images")
+        similar_menu.setEnabled(bool(self.images))
+        find_similar_action = QAction("Find Similar Images", similar_menu)
+        find_similar_action.setEnabled(not self.similar.running)
+        find_similar_action.triggered.connect(self.find_similar_images)
+        similar_menu.addAction(find_similar_action)
+        next_group_action = QAction("Next Group", similar_menu)
+        next_group_action.setEnabled(bool(self.similar_groups))
+        next_group_action.triggered.connect(lambda: self.jump_similar_group(1))
+        similar_menu.addAction(next_group_action)
+        previous_group_action = QAction("Previous Group", similar_menu)
+        previous_group_action.setEnabled(bool(self.similar_groups))
+        previous_group_action.triggered.connect(lambda: self.jump_similar_group(-1))
+        similar_menu.addAction(previous_group_action)
+
+        slideshow_action = QAction("Stop Slideshow" if self.slideshow.running else "Start Slideshow", self)
+        slideshow_action.setEnabled(bool(self.images))
+        slideshow_action.triggered.connect(self.toggle_slideshow)
+        menu.addAction(slideshow_action)
+
+        interval_action = QAction("Slideshow Interval...", self)
+        interval_action.triggered.connect(self.choose_slideshow_interval)
+        menu.addAction(interval_action)
+
+        recursive_action = QAction("Include Subfolders", self)
+        recursive_action.setCheckable(True)
+        recursive_action.setChecked(self.recursive)
+        recursive_action.toggled.connect(self.set_recursive)
+        menu.addAction(recursive_action)
+
+        sort_menu = menu.addMenu("Sort By")
+        sort_group = QActionGroup(sort_menu)
+        for mode, label in SORT_MODES.items():
+            sort_action = QAction(label, sort_menu)
+            sort_action.setCheckable(True)
+            sort_action.setChecked(mode == self.sort_mode)
+            sort_action.triggered.connect(lambda checked=False, mode=mode: self.set_sort_mode(mode))
+            sort_group.addAction(sort_action)
+            sort_menu.addAction(sort_action)
+        menu.addSeparator()
+
+        transform_menu = menu.addMenu("Rotate / Flip")
+        transform_menu.setEnabled(bool(self.current_path))
+        for operation, label in (
+            ("rotate_cw", "Rotate Clockwise"),
+            ("rotate_ccw", "Rotate Counterclockwise"),
+            ("flip_horizontal", "Flip Horizontal"),
+            ("flip_vertical", "Flip Vertical"),
+        ):
+            transform_action = QAction(label, transform_menu)
+            transform_action.triggered.connect(
+                lambda checked=False, operation=operation: self.transform_current_image(operation)
+            )
+            transform_menu.addAction(transform_action)
+
+        delete_action = QAction("Move to Trash", self)
         delete_action.setEnabled(bool(self.current_path))
-        delete_action.triggered.connect(self.delete_current_image)
+        delete_action.triggered.connect(lambda: self.delete_current_image())
         menu.addAction(delete_action)
 
+        confirm_trash_action = QAction("Confirm Before Moving to Trash", self)
+        confirm_trash_action.setCheckable(True)
+        confirm_trash_action.setChecked(self.confirm_trash)
+        confirm_trash_action.toggled.connect(self.set_confirm_trash)
+        menu.addAction(confirm_trash_action)
+
+        permanent_delete_action = QAction("Delete Permanently...", self)
+        permanent_delete_action.setEnabled(bool(self.current_path))
+        permanent_delete_action.triggered.connect(lambda: self.delete_current_image(permanent=True))
+        menu.addAction(permanent_delete_action)
+
         clear_cache_action = QAction("Clear Cache", self)
         clear_cache_action.triggered.connect(self.clear_cache)
         menu.addAction(clear_cache_action)
@@ -853,6 +2207,29 @@ class ImageViewerWindow(QMainWindow):
         memory_action = QAction("Memory Info", self)
         memory_action.triggered.connect(self.show_memory_info)
         menu.addAction(memory_action)
+
+        stats_action = QAction("Hide Stats Panel" if self.stats_panel.isVisible() else "Show Stats Panel", self)
+        stats_action.triggered.connect(self.toggle_stats_panel)
+        menu.addAction(stats_action)
+
+        process_action = QAction("Decode in Separate Processes", self)
+        process_action.setCheckable(True)
+        process_action.setChecked(self._process_decoder is not None)
+        process_action.toggled.connect(self.set_process_decoding)
+        menu.addAction(process_action)
+
+        engine_menu = menu.addMenu("Decoder Engine")
+        engine_group = QActionGroup(engine_menu)
+        engine_choices = [("auto", "Auto (Fastest Measured)")] + [
+            (name, engine.label) for name, engine in self.decoder_engines.engines.items()
+        ]
+        for name, label in engine_choices:
+            engine_action = QAction(label, engine_menu)
+            engine_action.setCheckable(True)
+            engine_action.setChecked(name == self.decoder_engines.override)
+            engine_action.triggered.connect(lambda checked=False, name=name: self.set_decoder_engine(name))
+            engine_group.addAction(engine_action)
+            engine_menu.addAction(engine_action)
         menu.addSeparator()
 
         if IS_WINDOWS:
@@ -876,19 +2253,128 @@ class ImageViewerWindow(QMainWindow):
     # ------------------------------------------------------------------
     def clear_cache(self) -> None:
         self.raw_cache.clear()
-        self.resize_cache.clear()
-        self._resize_cache_memory = 0
+        self.bytes_cache.clear()
+        self.signatures.clear()
+        self._clear_rendition_caches()
         QMessageBox.information(self, "캐시 정리", "모든 캐시가 정리되었습니다.")
 
+    def set_process_decoding(self, enabled: bool) -> None:
+        """디코드 백엔드를 스레드/프로세스 사이에서 전환한다."""
+        if enabled and self._process_decoder is None:
+            self._process_decoder = ProcessDecoder(DECODE_PROCESS_WORKERS)
+        elif not enabled and self._process_decoder is not None:
+            self._retire_process_decoder()
+
+    def _retire_process_decoder(self) -> None:
+        """프로세스 디코더를 끈다.
+
+        리사이즈 캐시의 렌디션 중 디코더 프로세스가 만든 것은 공유 메모리를 복사 없이
+        감싸고 있어, 그대로 두면 블록을 닫지 못한다. 렌디션을 복사본으로 바꾼 뒤 블록을
+        닫고, 진행 중이던 작업이 아직 붙잡고 있는 블록은 결과가 도착한 뒤에 닫는다.
+        픽스맵은 fromImage가 이미 픽셀을 복사해 두었으므로 그대로 둔다.
+        """
+        decoder, self._process_decoder = self._process_decoder, None
+        decoder.shutdown()
+        for cache_key in list(self.resize_cache):
+            self.resize_cache[cache_key] = self.resize_cache[cache_key].copy()
+        self._retired_decoders.append(decoder)
+        QTimer.singleShot(0, self, self._release_retired_decoders)
+
+    def _release_retired_decoders(self) -> None:
+        for decoder in self._retired_decoders:
+            decoder.release_unused()
+        self._retired_decoders = [decoder for decoder in self._retired_decoders if decoder.holds_shared_memory()]
+
+    def set_decoder_engine(self, name: str) -> None:
+        """스레드 디코딩 엔진을 고정하거나("pillow", "qt" 등) 자동 선택("auto")으로 되돌린다."""
+        self.decoder_engines.override = name
+
+    def _memory_tiers(self) -> Dict[str, Tuple[int, Optional[int]]]:
+        """캐시 계층별 (사용 바이트, 예산 바이트). 썸네일은 개수로만 묶여 예산이 없다."""
+        megabyte = 1024 * 1024
+        raw_stats = self.raw_cache.get_stats()
+        bytes_stats = self.bytes_cache.get_stats()
+        return {
+            "원본 캐시": (int(raw_stats["memory_usage_mb"] * megabyte), raw_stats["max_memory_mb"] * megabyte),
+            "파일 바이트 캐시": (int(bytes_stats["memory_usage_mb"] * megabyte), bytes_stats["max_memory_mb"] * megabyte),
+            "리사이즈 캐시": (self._resize_cache_memory, MAX_MEMORY_MB * megabyte),
+            "표시용 픽스맵": (self._pixmap_cache_memory, MAX_PIXMAP_CACHE_MB * megabyte),
+            "썸네일": (self.thumbnails.memory_usage(), None),
+        }
+
+    def _sample_tier_usage(self) -> None:
+        tiers = self._memory_tiers()
+        self.telemetry.observe_usage(tiers)
+        if MEMORY_AUDIT_ENABLED:
+            self.memory_audit.sample(tiers)
+
+    def _audit_memory(self) -> None:
+        tiers = self._memory_tiers()
+        self.memory_audit.sample(tiers)
+        self.telemetry.observe_usage(tiers)
+
+    def _telemetry_snapshot(self) -> Dict[str, Any]:
+        return self.telemetry.snapshot({
+            "raw": (self.raw_cache.hits, self.raw_cache.misses),
+            "bytes": (self.bytes_cache.hits, self.bytes_cache.misses),
+        })
+
+    def _stats_lines(self) -> List[str]:
+        return Telemetry.format_lines(self._telemetry_snapshot())
+
+    def toggle_stats_panel(self) -> None:
+        self.stats_panel.toggle()
+
+    def _dump_telemetry(self) -> None:
+        """세션 통계를 캐시 폴더에 JSON으로 남긴다: 캐시 예산을 정할 때 쓰는 자료."""
+        self._sample_tier_usage()
+        base = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.GenericCacheLocation)
+        config = {
+            "MAX_CACHE_SIZE": MAX_CACHE_SIZE,
+            "MAX_MEMORY_MB": MAX_MEMORY_MB,
+            "MAX_BYTES_CACHE_SIZE": MAX_BYTES_CACHE_SIZE,
+            "MAX_BYTES_CACHE_MB": MAX_BYTES_CACHE_MB,
+            "MAX_RESIZE_CACHE_SIZE": MAX_RESIZE_CACHE_SIZE,
+            "MAX_PIXMAP_CACHE_MB": MAX_PIXMAP_CACHE_MB,
+            "PIXMAP_CACHE_NEIGHBORS": PIXMAP_CACHE_NEIGHBORS,
+            "decode_backend": "process" if self._process_decoder is not None else "thread",
+            "decoder_engine": self.decoder_engines.override,
+        }
+        self.telemetry.dump(os.path.join(base, ORG_NAME, APP_NAME, "telemetry"), self._telemetry_snapshot(), config)
+
     def show_memory_info(self) -> None:
         stats = self.raw_cache.get_stats()
+        bytes_stats = self.bytes_cache.get_stats()
         info = (
             f"이미지 캐시:\n"
             f"  - 캐시된 이미지: {stats['size']}/{stats['max_size']}\n"
             f"  - 메모리 사용량: {stats['memory_usage_mb']:.2f}MB/{stats['max_memory_mb']}MB\n"
+            f"파일 바이트 캐시:\n"
+            f"  - 캐시된 파일: {bytes_stats['size']}/{bytes_stats['max_size']}\n"
+            f"  - 메모리 사용량: {bytes_stats['memory_usage_mb']:.2f}MB/{bytes_stats['max_memory_mb']}MB\n"
+            f"  - 미리 읽기: {self.io_scheduler.summary()}\n"
+            f"디코드 엔진:\n"
+            f"  - {self.decoder_engines.summary()}\n"
+            f"리샘플링:\n"
+            f"  - {self.resample_policy.summary()}\n"
+            f"  - 탐색 속도: 초당 {self.navigation.per_second:.0f}장\n"
+            f"색 관리:\n"
+            f"  - ICC 변환 캐시: {transform_cache_summary()}\n"
+            f"파일 서명 캐시:\n"
+            f"  - {self.signatures.summary()}\n"
             f"리사이즈 캐시:\n"
-            f"  - 캐시된 리사이즈: {len(self.resize_cache)}/{MAX_RESIZE_CACHE_SIZE}"
+            f"  - 캐시된 리사이즈: {len(self.resize_cache)}/{MAX_RESIZE_CACHE_SIZE}\n"
+            f"표시용 픽스맵:\n"
+            f"  - 준비된 픽스맵: {len(self.pixmap_cache)} "
+            f"({self._pixmap_cache_memory / 1024 / 1024:.2f}MB/{MAX_PIXMAP_CACHE_MB}MB)\n"
+            f"썸네일 캐시:\n"
+            f"  - 캐시된 썸네일: {len(self.thumbnails)} ({self.thumbnails.memory_usage() / 1024 / 1024:.2f}MB)\n"
+            f"슬라이드쇼:\n"
+            f"  - {self.slideshow.summary()}\n"
+            f"메모리 감사:\n"
         )
+        self._audit_memory()
+        info += "\n".join(f"  - {line}" for line in self.memory_audit.report())
         QMessageBox.information(self, "메모리 정보", info)
 
     def show_debug_info(self) -> None:
@@ -942,41 +2428,141 @@ class ImageViewerWindow(QMainWindow):
                         f"설정 화면을 여는 데 실패했습니다:\n{e}\n\nWindows 시작 메뉴에서 '기본 앱'을 직접 검색해주세요.",
                     )
 
-    def delete_current_image(self) -> None:
-        if not self.current_path:
-            QMessageBox.information(self, "삭제 불가", "삭제할 이미지가 없습니다.")
+    def transform_current_image(self, operation: str) -> None:
+        """현재 이미지를 회전/뒤집기. 화면은 즉시 바뀌고, 파일은 백그라운드에서 무손실로 저장.
+
+        화면에는 표시 중인 렌디션을 그대로 변환해 다시 디코딩하지 않는다. 파일은 JPEG의
+        EXIF 방향 태그만 고치며(_OrientationWriteTask), 저장이 끝나면 서명이 키에 들어간
+        캐시들을 버리지 않고 새 서명으로 옮긴다(_on_orientation_written).
+        PNG/WebP 등 JPEG가 아닌 파일은 무손실로 저장할 방법이 없어 파일은 그대로 두고,
+        이번 실행 동안 화면에서만 돌린다(_view_orientations): 방향이 들어간 새 키로 캐시된
+        렌디션을 변환해 옮기고, 이후 렌더링은 _ImageLoadTask가 같은 방향을 덧붙인다.
+        """
+        target = self.current_path
+        if not target or self.current_pixmap is None:
+            return
+        if split_member_path(target) is not None:
+            QMessageBox.information(self, "회전 불가", "압축 파일 안의 이미지는 회전할 수 없습니다.")
             return
 
-        file_to_delete = self.current_path
-        file_name = os.path.basename(file_to_delete)
+        self._load_seq += 1  # 이전 방향으로 진행 중인 로드 결과가 덮어쓰지 않게 한다
+        self._refine_timer.stop()
+        width, height, _ = self._render_target()
+        self.current_pixmap, _ = self._transform_rendition(self.current_pixmap, operation, width, height)
+        if self.compare_panes:
+            self.compare_view.panes[0].set_image(None, None)  # 이전 방향의 확대 영역은 버린다
+            self.compare_view.panes[0].set_image(target, self.current_pixmap)
+        else:
+            self.image_label.setPixmap(self.current_pixmap)
+
+        if os.path.splitext(target)[1].lower() not in _LOSSLESS_ROTATE_EXTENSIONS:
+            signature = self.signatures.get(target)
+            old_prefix = self._rendition_prefix(target, signature)
+            orientation = compose_orientation(self._view_orientations.get(target, 1), operation)
+            if orientation == 1:
+                self._view_orientations.pop(target, None)
+            else:
+                self._view_orientations[target] = orientation
+            self.thumbnails.set_view_orientation(target, orientation)
+            self.thumbnails.transform(target, _OPERATION_TRANSFORMS[operation])
+            self._rekey_transformed_renditions(old_prefix, self._rendition_prefix(target, signature), operation)
+            self.show_image(self.current_index)
+            return
 
-        confirm = QMessageBox.question(
-            self,
-            "이미지 삭제 확인",
-            f"'{file_name}' 파일을 삭제하시겠습니까?\n\n이 작업은 되돌릴 수 없습니다.",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No,
-        )
-        if confirm != QMessageBox.StandardButton.Yes:
+        self._pending_orientation_writes[target] = self._pending_orientation_writes.get(target, 0) + 1
+        task = _OrientationWriteTask(target, operation, self.bytes_cache)
+        task.signals.finished.connect(self._on_orientation_written)
+        self._file_ops_pool.start(task)
+
+    def _on_orientation_written(
+        self, file_path: str, old_signature, new_signature, operation: str, orientation: int, message: str
+    ) -> None:
+        remaining = self._pending_orientation_writes.pop(file_path, 1) - 1
+        if remaining:
+            self._pending_orientation_writes[file_path] = remaining
+        if not message:
+            self.signatures.update(file_path, new_signature)
+            self._rekey_transformed_renditions(
+                self._rendition_prefix(file_path, old_signature), self._rendition_prefix(file_path, new_signature),
+                operation,
+            )
+            # 디코딩된 픽셀은 그대로 유효하다: 키와 방향 정보만 바꾼다
+            raw_image = self.raw_cache.rekey(f"{file_path}::{old_signature}", f"{file_path}::{new_signature}")
+            if raw_image is not None:
+                set_exif_orientation(raw_image, orientation)
+            self.thumbnails.transform(file_path, _OPERATION_TRANSFORMS[operation], new_signature)
+            self.metadata_index.update_signature(file_path, new_signature)
+        if not remaining and file_path == self.current_path:
+            # 옮겨 둔 렌디션(실패했다면 파일의 실제 방향)으로 다시 표시한다
+            self.show_image(self.current_index)
+        if message:
+            QMessageBox.critical(self, "회전 오류", f"회전 저장 실패: {os.path.basename(file_path)}\n{message}")
+
+    def delete_current_image(self, permanent: bool = False) -> None:
+        """현재 이미지를 휴지통으로 옮기거나(기본) 영구 삭제.
+
+        목록에서 바로 빼고 다음 이미지를 (대개 이미 준비된 캐시에서) 즉시 띄운 뒤,
+        실제 파일 작업은 백그라운드에서 한다. 실패하면 목록에 되돌리고 알린다.
+        휴지통 이동도 기본은 확인 후 진행하며, 확인을 끄면(confirm_trash) 바로 골라낸다.
+        """
+        target = self.current_path or (self.images[self.current_index] if self.images else None)
+        if not target:
+            QMessageBox.information(self, "삭제 불가", "삭제할 이미지가 없습니다.")
             return
 
-        try:
-            os.remove(file_to_delete)
-        except OSError as e:
-            QMessageBox.critical(
+        if split_member_path(target) is not None:
+            QMessageBox.information(self, "삭제 불가", "압축 파일 안의 이미지는 삭제할 수 없습니다.")
+            return
+
+        if permanent:
+            confirm = QMessageBox.question(
                 self,
-                "삭제 오류",
-                f"파일 삭제 실패: {file_name}\n{e}\n\n파일이 사용 중이거나 권한이 없을 수 있습니다.",
+                "이미지 삭제 확인",
+                f"'{os.path.basename(target)}' 파일을 영구 삭제하시겠습니까?\n\n이 작업은 되돌릴 수 없습니다.",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                QMessageBox.StandardButton.No,
             )
+            if confirm != QMessageBox.StandardButton.Yes:
+                return
+        elif self.confirm_trash and not self._confirm_trash(target):
             return
 
-        QMessageBox.information(self, "삭제 완료", f"'{file_name}' 파일이 성공적으로 삭제되었습니다.")
-
-        if file_to_delete in self.images:
-            self.images.remove(file_to_delete)
-        self.raw_cache.clear()
-        self.resize_cache.clear()
-        self._resize_cache_memory = 0
+        self._pending_removals[target] = self.images.index(target) if target in self.images else self.current_index
+        self._remove_from_list(target)
+        task = _FileRemovalTask(target, permanent)
+        task.signals.finished.connect(self._on_file_removed)
+        self._file_ops_pool.start(task)
+
+    def _confirm_trash(self, target: str) -> bool:
+        box = QMessageBox(
+            QMessageBox.Icon.Question,
+            "휴지통으로 이동",
+            f"'{os.path.basename(target)}' 파일을 휴지통으로 옮기시겠습니까?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            self,
+        )
+        box.setDefaultButton(QMessageBox.StandardButton.No)
+        dont_ask = QCheckBox("다시 묻지 않기 (우클릭 메뉴에서 다시 켤 수 있음)")
+        box.setCheckBox(dont_ask)
+        if box.exec() != QMessageBox.StandardButton.Yes:
+            return False
+        if dont_ask.isChecked():
+            self.set_confirm_trash(False)
+        return True
+
+    def set_confirm_trash(self, enabled: bool) -> None:
+        self.confirm_trash = enabled
+        QSettings(ORG_NAME, APP_NAME).setValue(_CONFIRM_TRASH_SETTING, enabled)
+
+    def _remove_from_list(self, file_path: str) -> None:
+        if file_path in self.images:
+            index = self.images.index(file_path)
+            del self.images[index]
+            if index < self.current_index:
+                self.current_index -= 1
+        self.invalidate_path(file_path)
+        if self.thumbnail_grid.isVisible():
+            self.thumbnail_grid.set_images(self.images, self.current_index)
 
         if self.images:
             self.current_index = min(self.current_index, len(self.images) - 1)
@@ -992,7 +2578,34 @@ class ImageViewerWindow(QMainWindow):
             self.counter_label.setText("0 / 0")
             self.filename_label.setText("")
             self._update_nav_state()
-            QMessageBox.information(self, "알림", "더 이상 표시할 이미지가 없습니다.")
+
+    def _on_file_removed(self, file_path: str, success: bool, message: str) -> None:
+        original_index = self._pending_removals.pop(file_path, 0)
+        if success:
+            self.metadata_index.forget(file_path)
+            if self.similar_groups:
+                groups = [[path for path in group if path != file_path] for group in self.similar_groups]
+                self.similar_groups = [group for group in groups if len(group) > 1]
+            return
+
+        if file_path not in self.images and os.path.exists(file_path):
+            index = min(original_index, len(self.images))
+            self.images.insert(index, file_path)
+            if self.current_path is None and len(self.images) == 1:
+                self.current_index = 0
+                self.show_image(0)
+            elif index <= self.current_index:
+                self.current_index += 1
+            self._update_nav_state()
+            if self.current_path:
+                self.counter_label.setText(f"{self.current_index + 1} / {len(self.images)}")
+            if self.thumbnail_grid.isVisible():
+                self.thumbnail_grid.set_images(self.images, self.current_index)
+        QMessageBox.critical(
+            self,
+            "삭제 오류",
+            f"파일 삭제 실패: {os.path.basename(file_path)}\n{message}\n\n파일이 사용 중이거나 권한이 없을 수 있습니다.",
+        )
 
     def show_error(self, message: str) -> None:
         QMessageBox.critical(self, "오류", message)
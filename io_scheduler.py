@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import os
+import time
+from typing import List, Optional
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool
+
+from constants import (
+    BYTES_PREFETCH_WINDOW,
+    IO_READ_CHUNK_BYTES,
+    IO_READAHEAD_BEHIND,
+    IO_READAHEAD_HORIZON_S,
+    IO_SLOW_FS_WINDOW_FACTOR,
+    IO_SLOW_STAT_MS,
+    IO_SLOW_THROUGHPUT_MBPS,
+)
+from archive import read_image_bytes, split_member_path
+from image_cache import BytesCache
+from signature_cache import SignatureCache
+
+_EWMA_ALPHA = 0.3
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+
+
+class _IoStats:
+    """I/O 스레드가 측정해 기록하고 GUI 스레드가 읽는 값 (float 대입은 원자적이라 락 없이 공유)."""
+
+    def __init__(self) -> None:
+        self.throughput_mbps: Optional[float] = None
+        self.stat_ms: Optional[float] = None
+        self.bytes_read = 0
+
+    @staticmethod
+    def _blend(previous: Optional[float], value: float) -> float:
+        return value if previous is None else previous + _EWMA_ALPHA * (value - previous)
+
+    def record_read(self, size: int, seconds: float) -> None:
+        self.bytes_read += size
+        # 아주 작은 파일은 지연 시간이 지배해 처리량을 과소평가하므로 청크 하나 이상일 때만 반영
+        if size >= IO_READ_CHUNK_BYTES and seconds > 0:
+            self.throughput_mbps = self._blend(self.throughput_mbps, size / 1024 / 1024 / seconds)
+
+    def record_stat(self, seconds: float) -> None:
+        self.stat_ms = self._blend(self.stat_ms, seconds * 1000)
+
+    @property
+    def slow(self) -> bool:
+        """stat 지연이나 읽기 처리량으로 보아 네트워크/USB 같은 느린 저장소인지."""
+        if self.stat_ms is not None and self.stat_ms >= IO_SLOW_STAT_MS:
+            return True
+        return self.throughput_mbps is not None and self.throughput_mbps < IO_SLOW_THROUGHPUT_MBPS
+
+
+class _ReadAheadTask(QRunnable):
+    """탐색 방향 순서대로 파일을 통째로 순차 읽기해 바이트 캐시에 채운다.
+
+    캐시에 넣기엔 너무 큰 파일은 읽지 않고 OS에 WILLNEED 힌트만 줘 페이지 캐시로
+    올리게 한다. 사용자가 이동해 generation이 바뀌면 청크 단위로 바로 멈춘다.
+    """
+
+    def __init__(
+        self,
+        generation: int,
+        current_generation: List[int],
+        paths: List[str],
+        bytes_cache: BytesCache,
+        signatures: SignatureCache,
+        stats: _IoStats,
+        budget_bytes: Optional[int],
+    ):
+        super().__init__()
+        self._generation = generation
+        self._current_generation = current_generation
+        self._paths = paths
+        self._bytes_cache = bytes_cache
+        self._signatures = signatures
+        self._stats = stats
+        self._budget_bytes = budget_bytes
+
+    def _cancelled(self) -> bool:
+        return self._current_generation[0] != self._generation
+
+    def run(self) -> None:
+        spent = 0
+        for file_path in self._paths:
+            if self._cancelled():
+                return
+            if self._budget_bytes is not None and spent >= self._budget_bytes:
+                return
+            signature, stat_seconds = self._signatures.get_timed(file_path)
+            if stat_seconds is not None:
+                # 캐시에서 나온 서명은 저장소 지연과 무관하므로 실제 stat만 반영
+                self._stats.record_stat(stat_seconds)
+            if signature is None or self._bytes_cache.contains(file_path, signature):
+                continue
+            try:
+                if self._bytes_cache.accepts(signature):
+                    spent += self._read_into_cache(file_path, signature)
+                elif _HAS_FADVISE and split_member_path(file_path) is None:
+                    self._advise(file_path)
+            except OSError:
+                continue
+
+    def _read_into_cache(self, file_path: str, signature) -> int:
+        started = time.perf_counter()
+        if split_member_path(file_path) is not None:
+            # 압축 파일 멤버는 풀에 열려 있는 핸들로 한 번에 읽는다 (멤버는 대개 작다)
+            data = read_image_bytes(file_path)
+            self._stats.record_read(len(data), time.perf_counter() - started)
+            self._bytes_cache.put(file_path, signature, data)
+            return len(data)
+        chunks = []
+        with open(file_path, "rb", buffering=0) as f:
+            while True:
+                if self._cancelled():
+                    return sum(len(chunk) for chunk in chunks)
+                chunk = f.read(IO_READ_CHUNK_BYTES)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        data = b"".join(chunks)
+        self._stats.record_read(len(data), time.perf_counter() - started)
+        self._bytes_cache.put(file_path, signature, data)
+        return len(data)
+
+    @staticmethod
+    def _advise(file_path: str) -> None:
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+
+
+class IoScheduler(QObject):
+    """이웃 파일 미리 읽기(read-ahead) 스케줄러.
+
+    디코드 워커와 분리된 I/O 전용 스레드 하나에서 돈다: 느린 디스크에 동시 읽기를
+    몰아도 빨라지지 않고, 디코드 스레드가 읽기 대기에 묶이지도 않는다. 마지막
+    이동 방향으로 더 많이 읽고, 한 번에 읽을 양은 측정된 처리량으로
+    IO_READAHEAD_HORIZON_S초 안에 끝낼 수 있는 만큼으로 제한한다. 느린 저장소로
+    판단되면 창을 넓혀 더 공격적으로 미리 읽는다.
+    """
+
+    def __init__(self, bytes_cache: BytesCache, signatures: SignatureCache, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._bytes_cache = bytes_cache
+        self._signatures = signatures
+        self.stats = _IoStats()
+        self._generation = [0]
+        self._last_index: Optional[int] = None
+        self.direction = 1
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+
+    def schedule(self, images: List[str], current_index: int) -> None:
+        self._generation[0] += 1
+        if self._last_index is not None and current_index != self._last_index:
+            self.direction = 1 if current_index > self._last_index else -1
+        self._last_index = current_index
+        if not images:
+            return
+
+        factor = IO_SLOW_FS_WINDOW_FACTOR if self.stats.slow else 1
+        ahead = BYTES_PREFETCH_WINDOW * factor
+        behind = IO_READAHEAD_BEHIND * factor
+        paths = [
+            images[index]
+            for index in self._order(current_index, ahead, behind)
+            if 0 <= index < len(images)
+        ]
+        if not paths:
+            return
+
+        budget = None
+        if self.stats.throughput_mbps is not None:
+            horizon = IO_READAHEAD_HORIZON_S * factor
+            budget = int(self.stats.throughput_mbps * 1024 * 1024 * horizon)
+        generation = self._generation[0]
+        self._pool.start(
+            _ReadAheadTask(
+                generation, self._generation, paths, self._bytes_cache, self._signatures, self.stats, budget
+            )
+        )
+
+    def _order(self, current_index: int, ahead: int, behind: int) -> List[int]:
+        # 진행 방향 파일을 먼저, 반대 방향은 가까운 몇 장만 중간중간 끼워 넣는다
+        order = []
+        for distance in range(1, max(ahead, behind) + 1):
+            if distance <= ahead:
+                order.append(current_index + self.direction * distance)
+            if distance <= behind:
+                order.append(current_index - self.direction * distance)
+        return order
+
+    def cancel(self) -> None:
+        self._generation[0] += 1
+
+    def summary(self) -> str:
+        throughput = "측정 전" if self.stats.throughput_mbps is None else f"{self.stats.throughput_mbps:.1f}MB/s"
+        stat_ms = "측정 전" if self.stats.stat_ms is None else f"{self.stats.stat_ms:.2f}ms"
+        kind = "느린 저장소" if self.stats.slow else "일반"
+        return (
+            f"처리량 {throughput}, stat 지연 {stat_ms}, {kind}, "
+            f"미리 읽은 양 {self.stats.bytes_read / 1024 / 1024:.1f}MB"
+        )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import multiprocessing
 import os
 import sys
 from collections.abc import Callable
@@ -39,6 +40,8 @@ class ImageViewerApplication(QApplication):
 
 
 def main() -> int:
+    # PyInstaller로 빌드한 실행 파일에서 디코더 프로세스(spawn)가 창을 다시 띄우지 않도록
+    multiprocessing.freeze_support()
     app = ImageViewerApplication(sys.argv)
     app.setStyle("Fusion")
     app.setWindowIcon(QIcon(resource_path("assets/icon.png")))
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import os
+import sys
+import tracemalloc
+from typing import Dict, List, Optional, Tuple
+
+from constants import MEMORY_AUDIT_OVERHEAD_MB, MEMORY_AUDIT_TRACE_PYTHON
+
+# 이 모듈은 Qt에 의존하지 않는다.
+
+_MB = 1024 * 1024
+
+
+def resident_bytes() -> Optional[int]:
+    """현재 프로세스의 상주 메모리(RSS). 알 수 없는 플랫폼이면 None."""
+    if sys.platform.startswith("linux"):
+        try:
+            with open("/proc/self/statm", "rb") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError, IndexError):
+            return None
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        class _Counters(ctypes.Structure):
+            _fields_ = [
+                ("cb", wintypes.DWORD),
+                ("PageFaultCount", wintypes.DWORD),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+
+        counters = _Counters()
+        counters.cb = ctypes.sizeof(counters)
+        try:
+            process = ctypes.windll.kernel32.GetCurrentProcess()
+            if ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+                return counters.WorkingSetSize
+        except (AttributeError, OSError):
+            pass
+        return None
+    if sys.platform == "darwin":
+        import ctypes
+        import ctypes.util
+
+        class _TaskBasicInfo(ctypes.Structure):
+            _fields_ = [
+                ("virtual_size", ctypes.c_uint64),
+                ("resident_size", ctypes.c_uint64),
+                ("resident_size_max", ctypes.c_uint64),
+                ("user_time", ctypes.c_uint64),
+                ("system_time", ctypes.c_uint64),
+                ("policy", ctypes.c_int),
+                ("suspend_count", ctypes.c_int),
+            ]
+
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"))
+            info = _TaskBasicInfo()
+            count = ctypes.c_uint(ctypes.sizeof(info) // 4)
+            task = ctypes.c_uint.in_dll(libc, "mach_task_self_")
+            if libc.task_info(task, 20, ctypes.byref(info), ctypes.byref(count)) == 0:  # MACH_TASK_BASIC_INFO
+                return info.resident_size
+        except (AttributeError, OSError, ValueError):
+            pass
+        return None
+    return None
+
+
+class MemoryAudit:
+    """캐시 계층별 사용량과 실제 RSS 증가를 비교해 예산 밖의 메모리를 잡아낸다.
+
+    계층(원본, 파일 바이트, 리사이즈, 픽스맵, 썸네일)은 각자 예산 안에 머물도록
+    관리되지만, 그 계산은 캐시가 잡고 있는 객체만 센다. 캐시에서 빠졌는데도 ImageQt나
+    시그널 인자에 붙잡혀 해제되지 않은 QImage/PIL 버퍼는 그 계산에 보이지 않는다.
+    그래서 창을 만든 직후의 RSS를 기준으로, 그 뒤의 증가가 "모든 계층 예산 합 +
+    MEMORY_AUDIT_OVERHEAD_MB"를 넘는지 샘플마다 확인하고 넘은 횟수를 기록한다.
+    MEMORY_AUDIT_TRACE_PYTHON이면 tracemalloc으로 파이썬 할당 증가 위치도 보여 준다.
+    """
+
+    def __init__(self):
+        if MEMORY_AUDIT_TRACE_PYTHON and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self._trace_baseline = tracemalloc.take_snapshot() if tracemalloc.is_tracing() else None
+        self.baseline = resident_bytes()
+        self.last_rss: Optional[int] = self.baseline
+        self.peak_growth = 0
+        self.samples = 0
+        self.overruns = 0
+        self.worst_excess = 0
+        self._tiers: Dict[str, Tuple[int, Optional[int]]] = {}
+
+    def sample(self, tiers: Dict[str, Tuple[int, Optional[int]]]) -> bool:
+        """계층별 (사용 바이트, 예산 바이트 또는 None) 스냅샷과 RSS를 비교. 예산 안이면 True."""
+        self._tiers = dict(tiers)
+        rss = resident_bytes()
+        if rss is None or self.baseline is None:
+            return True
+        self.samples += 1
+        self.last_rss = rss
+        growth = rss - self.baseline
+        self.peak_growth = max(self.peak_growth, growth)
+        excess = growth - self.allowed_bytes()
+        if excess > 0:
+            self.overruns += 1
+            self.worst_excess = max(self.worst_excess, excess)
+            return False
+        return True
+
+    def allowed_bytes(self) -> int:
+        # 예산이 없는 계층(썸네일 등 개수로만 묶인 것)은 지금 쓰는 만큼을 허용한다
+        budgets = sum(budget if budget is not None else used for used, budget in self._tiers.values())
+        return budgets + MEMORY_AUDIT_OVERHEAD_MB * _MB
+
+    def report(self) -> List[str]:
+        """메모리 정보 창에 보일 줄 목록."""
+        lines = []
+        for name, (used, budget) in self._tiers.items():
+            limit = f"{budget / _MB:.0f}MB" if budget is not None else "개수 제한"
+            lines.append(f"{name}: {used / _MB:.1f}MB/{limit}")
+        if self.baseline is None:
+            lines.append("RSS: 이 플랫폼에서는 측정할 수 없음")
+            return lines
+        tracked = sum(used for used, _ in self._tiers.values())
+        growth = (self.last_rss or self.baseline) - self.baseline
+        lines.append(
+            f"RSS 증가: {growth / _MB:.1f}MB (캐시 합계 {tracked / _MB:.1f}MB, "
+            f"허용 {self.allowed_bytes() / _MB:.0f}MB, 최대 {self.peak_growth / _MB:.1f}MB)"
+        )
+        lines.append(
+            f"예산 초과: {self.overruns}/{self.samples}회"
+            + (f" (최대 {self.worst_excess / _MB:.1f}MB 초과)" if self.overruns else "")
+        )
+        if self._trace_baseline is not None:
+            snapshot = tracemalloc.take_snapshot()
+            for stat in snapshot.compare_to(self._trace_baseline, "lineno")[:3]:
+                frame = stat.traceback[0]
+                lines.append(
+                    f"파이썬 할당 증가: {os.path.basename(frame.filename)}:{frame.lineno} {stat.size_diff / _MB:+.1f}MB"
+                )
+        return lines
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from PIL import ExifTags, Image
+from PySide6.QtCore import QObject, QRunnable, QStandardPaths, QThreadPool, Signal
+
+from constants import APP_NAME, METADATA_BATCH_SIZE, METADATA_WORKERS, ORG_NAME
+from archive import open_image_source
+from signature_cache import SignatureCache
+from utils import natural_sort_key
+
+# 정렬 모드 → 메뉴 표시 이름
+SORT_MODES = {
+    "name": "File Name",
+    "date_taken": "Date Taken",
+    "mtime": "Date Modified",
+    "size": "File Size",
+    "dimensions": "Dimensions",
+}
+
+_INDEX_VERSION = 2
+_EXIF_DATETIME_ORIGINAL = 0x9003
+_EXIF_DATETIME = 0x0132
+
+
+def _parse_exif_datetime(value: Any) -> Optional[float]:
+    try:
+        return datetime.strptime(str(value).strip("\x00 "), "%Y:%m:%d %H:%M:%S").timestamp()
+    except (TypeError, ValueError, OverflowError, OSError):
+        return None
+
+
+def read_metadata(file_path: str, signature) -> Dict[str, Any]:
+    """헤더만 읽어 정렬용 메타데이터를 만든다. Image.open은 픽셀을 디코딩하지 않는다."""
+    entry: Dict[str, Any] = {
+        "sig": list(signature),
+        "mtime": signature[0] / 1e9,
+        "size": signature[1],
+        "width": None,
+        "height": None,
+        "taken": None,
+    }
+    try:
+        with Image.open(open_image_source(file_path)) as opened:
+            entry["width"], entry["height"] = opened.size
+            exif = opened.getexif()
+            taken = exif.get_ifd(ExifTags.IFD.Exif).get(_EXIF_DATETIME_ORIGINAL) or exif.get(_EXIF_DATETIME)
+            entry["taken"] = _parse_exif_datetime(taken) if taken else None
+    except Exception:
+        pass  # 헤더를 못 읽는 파일도 mtime/크기 정렬에는 참여
+    return entry
+
+
+def _index_file(directory: str) -> str:
+    base = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.GenericCacheLocation)
+    digest = hashlib.sha1(os.path.normcase(os.path.abspath(directory)).encode("utf-8")).hexdigest()
+    return os.path.join(base, ORG_NAME, APP_NAME, "metadata", f"{digest}.json")
+
+
+class _MetadataSignals(QObject):
+    batch_done = Signal(int, dict)
+
+
+class _MetadataBatchTask(QRunnable):
+    """파일 묶음의 서명을 확인하고, 바뀐 파일만 헤더를 다시 읽는다."""
+
+    def __init__(
+        self,
+        generation: int,
+        current_generation: List[int],
+        paths: List[str],
+        known: Dict[str, Any],
+        signatures: SignatureCache,
+    ):
+        super().__init__()
+        self.signals = _MetadataSignals()
+        self._generation = generation
+        self._current_generation = current_generation
+        self._paths = paths
+        self._known = known
+        self._signatures = signatures
+
+    def run(self) -> None:
+        results: Dict[str, Any] = {}
+        for file_path in self._paths:
+            if self._current_generation[0] != self._generation:
+                return
+            signature = self._signatures.get(file_path)
+            if signature is None:
+                continue
+            entry = self._known.get(file_path)
+            if entry is None or tuple(entry.get("sig", ())) != signature:
+                entry = read_metadata(file_path, signature)
+            results[file_path] = entry
+        self.signals.batch_done.emit(self._generation, results)
+
+
+class MetadataIndex(QObject):
+    """디렉토리별 메타데이터 색인 (백그라운드 병렬 구축, 디스크에 영속).
+
+    색인은 캐시 폴더에 디렉토리마다 JSON 하나로 저장되고, 항목마다 file_signature를
+    함께 보관해 바뀐 파일만 다시 읽는다. 확인한 서명은 공유 SignatureCache에 남으므로
+    이후 탐색에서는 같은 파일을 다시 stat하지 않는다. 색인이 완성되면 정렬 모드
+    전환은 메모리 안의 정렬 한 번으로 끝난다.
+    """
+
+    indexed = Signal(str)  # 디렉토리 색인이 완성됨
+
+    def __init__(self, signatures: SignatureCache, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._signatures = signatures
+        self.directory: Optional[str] = None
+        self._entries: Dict[str, Any] = {}
+        self._generation = [0]
+        self._pending_batches = 0
+        self.complete = False
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(METADATA_WORKERS)
+
+    def build(self, directory: str, paths: List[str]) -> None:
+        """디렉토리 색인을 불러오고, 변경 확인/누락 항목 채우기를 백그라운드로 시작."""
+        self._generation[0] += 1
+        generation = self._generation[0]
+        self.directory = directory
+        self.complete = False
+        known = self._load(directory)
+        self._entries = {}
+        self._pending_batches = 0
+        for start in range(0, len(paths), METADATA_BATCH_SIZE):
+            task = _MetadataBatchTask(
+                generation, self._generation, paths[start:start + METADATA_BATCH_SIZE], known, self._signatures
+            )
+            task.signals.batch_done.connect(self._on_batch_done)
+            self._pending_batches += 1
+            self._pool.start(task)
+        if not self._pending_batches:
+            self._finish()
+
+    def _on_batch_done(self, generation: int, results: Dict[str, Any]) -> None:
+        if generation != self._generation[0]:
+            return
+        self._entries.update(results)
+        self._pending_batches -= 1
+        if self._pending_batches == 0:
+            self._finish()
+
+    def _finish(self) -> None:
+        self.complete = True
+        self._save()
+        self.indexed.emit(self.directory or "")
+
+    def cancel(self) -> None:
+        self._generation[0] += 1
+
+    def get(self, file_path: str) -> Optional[Dict[str, Any]]:
+        return self._entries.get(file_path)
+
+    def forget(self, file_path: str) -> None:
+        """삭제된 파일의 항목을 버린다 (디스크 색인에는 다음 저장 때 반영)."""
+        self._entries.pop(file_path, None)
+
+    def update_signature(self, file_path: str, signature) -> None:
+        """직접 고친 파일(방향 태그 등)의 서명만 갱신: 크기/촬영 시각은 그대로라 다시 읽지 않는다."""
+        entry = self._entries.get(file_path)
+        if entry is not None and signature is not None:
+            entry.update(sig=list(signature), mtime=signature[0] / 1e9, size=signature[1])
+
+    def sort_key(self, mode: str) -> Callable[[str], tuple]:
+        """정렬 키. 메타데이터가 없는 파일은 뒤로 보내고, 같은 값끼리는 이름 순."""
+
+        def value(entry: Dict[str, Any]) -> Optional[float]:
+            if mode == "date_taken":
+                # 촬영 일시가 없는 파일(스크린샷, 편집본 등)은 수정 시각으로 대신한다
+                return entry["taken"] if entry["taken"] is not None else entry["mtime"]
+            if mode == "dimensions":
+                return None if entry["width"] is None else entry["width"] * entry["height"]
+            return entry.get(mode)
+
+        def key(file_path: str) -> tuple:
+            entry = self._entries.get(file_path)
+            sort_value = value(entry) if entry is not None else None
+            return (sort_value is None, sort_value or 0, natural_sort_key(file_path))
+
+        return key
+
+    # ------------------------------------------------------------------
+    # 영속화
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _load(directory: str) -> Dict[str, Any]:
+        try:
+            with open(_index_file(directory), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != _INDEX_VERSION:
+            return {}
+        return {directory + relative: entry for relative, entry in data.get("entries", {}).items()}
+
+    def _save(self) -> None:
+        if not self.directory:
+            return
+        index_file = _index_file(self.directory)
+        data = {
+            "version": _INDEX_VERSION,
+            # 목록의 경로는 모두 색인 기준 경로(폴더 또는 "archive.zip!/")로 시작하므로
+            # 그 뒷부분만 저장한다: 하위 폴더 포함 모드와 압축 파일 멤버에도 그대로 쓰인다
+            "entries": {
+                path[len(self.directory):]: entry
+                for path, entry in self._entries.items()
+                if path.startswith(self.directory)
+            },
+        }
+        try:
+            os.makedirs(os.path.dirname(index_file), exist_ok=True)
+            temp_file = f"{index_file}.tmp"
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(temp_file, index_file)
+        except OSError:
+            pass  # 색인 저장 실패는 다음 실행에서 다시 만들면 될 뿐이다
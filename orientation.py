@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import struct
+from typing import Iterator, Optional, Tuple
+
+from PIL import Image
+
+# 이 모듈은 Qt에 의존하지 않는다 (디코더 프로세스도 render_image에서 방향을 적용한다).
+#
+# 방향은 EXIF Orientation 값(1~8) 하나로 다룬다. 회전/뒤집기 명령은 이 값을 바꿔 쓰는
+# 것으로 끝나므로 JPEG의 압축 데이터(DCT 계수)는 한 바이트도 건드리지 않는다.
+
+ORIENTATION_TAG = 0x0112
+_SHORT = 3
+
+# Orientation 값 → 저장된 픽셀을 화면 방향으로 돌리는 변환 (ImageOps.exif_transpose와 같다)
+_TRANSPOSES = {
+    2: Image.Transpose.FLIP_LEFT_RIGHT,
+    3: Image.Transpose.ROTATE_180,
+    4: Image.Transpose.FLIP_TOP_BOTTOM,
+    5: Image.Transpose.TRANSPOSE,
+    6: Image.Transpose.ROTATE_270,
+    7: Image.Transpose.TRANSVERSE,
+    8: Image.Transpose.ROTATE_90,
+}
+# Orientation 값 → 같은 변환의 좌표 행렬 (a, b, c, d): (x, y) → (ax + by, cx + dy), y축은 아래쪽
+_MATRICES = {
+    1: (1, 0, 0, 1),
+    2: (-1, 0, 0, 1),
+    3: (-1, 0, 0, -1),
+    4: (1, 0, 0, -1),
+    5: (0, 1, 1, 0),
+    6: (0, -1, 1, 0),
+    7: (0, -1, -1, 0),
+    8: (0, 1, -1, 0),
+}
+_ORIENTATIONS = {matrix: orientation for orientation, matrix in _MATRICES.items()}
+
+# 회전/뒤집기 명령 → 같은 효과의 Orientation 값
+OPERATIONS = {
+    "rotate_cw": 6,
+    "rotate_ccw": 8,
+    "flip_horizontal": 2,
+    "flip_vertical": 4,
+}
+
+
+def compose_orientation(orientation: int, operation: str) -> int:
+    """현재 방향으로 표시된 이미지에 명령을 하나 더 적용한 결과의 Orientation 값."""
+    a, b, c, d = _MATRICES[OPERATIONS[operation]]
+    e, f, g, h = _MATRICES.get(orientation, _MATRICES[1])
+    return _ORIENTATIONS[(a * e + b * g, a * f + b * h, c * e + d * g, c * f + d * h)]
+
+
+def orientation_matrix(orientation: int) -> Tuple[int, int, int, int]:
+    """Orientation 값의 좌표 행렬 (a, b, c, d): (x, y) → (ax + by, cx + dy), y축은 아래쪽."""
+    return _MATRICES.get(orientation, _MATRICES[1])
+
+
+def swaps_axes(orientation: int) -> bool:
+    """90도 회전이 들어 있어 표시할 때 가로/세로가 바뀌는 방향인지."""
+    return orientation in (5, 6, 7, 8)
+
+
+def exif_orientation(image: Image.Image) -> int:
+    """이미지 info의 EXIF에 기록된 Orientation (없거나 잘못된 값이면 1)."""
+    raw_exif = image.info.get("exif")
+    if not raw_exif:
+        return 1
+    exif = Image.Exif()
+    try:
+        exif.load(raw_exif)
+    except (OSError, ValueError, SyntaxError, struct.error):
+        return 1
+    orientation = exif.get(ORIENTATION_TAG, 1)
+    return orientation if orientation in _MATRICES else 1
+
+
+def set_exif_orientation(image: Image.Image, orientation: int) -> None:
+    """캐시된 디코딩 결과의 방향만 바꾼다: 파일의 태그만 바뀌었으니 픽셀은 그대로 유효하다."""
+    exif = Image.Exif()
+    if image.info.get("exif"):
+        exif.load(image.info["exif"])
+    exif[ORIENTATION_TAG] = orientation
+    image.info["exif"] = exif.tobytes()
+
+
+def apply_orientation(image: Image.Image, orientation: int) -> Image.Image:
+    transpose = _TRANSPOSES.get(orientation)
+    return image if transpose is None else image.transpose(transpose)
+
+
+def display_region_to_stored(
+    region: Tuple[float, float, float, float], orientation: int
+) -> Tuple[float, float, float, float]:
+    """표시 방향 기준 정규화 영역 (left, top, right, bottom)을 저장된 픽셀 기준 영역으로.
+
+    변환 행렬은 직교 행렬이라 역변환은 전치 행렬이다.
+    """
+    a, b, c, d = _MATRICES.get(orientation, _MATRICES[1])
+    corners = []
+    for u, v in ((region[0], region[1]), (region[2], region[3])):
+        x, y = u - 0.5, v - 0.5
+        corners.append((a * x + c * y + 0.5, b * x + d * y + 0.5))
+    (x0, y0), (x1, y1) = corners
+    return min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1)
+
+
+# ----------------------------------------------------------------------
+# JPEG Orientation 태그 다시 쓰기
+# ----------------------------------------------------------------------
+def _jpeg_segments(data: bytes) -> Iterator[Tuple[int, int, int]]:
+    """SOS 앞까지의 마커 세그먼트: (마커, 세그먼트 시작, 세그먼트 끝)."""
+    if data[:2] != b"\xff\xd8":
+        raise ValueError("JPEG 파일이 아닙니다")
+    position = 2
+    while position + 4 <= len(data):
+        if data[position] != 0xFF:
+            raise ValueError("손상된 JPEG 마커")
+        marker = data[position + 1]
+        if marker == 0xFF:  # 채움 바이트
+            position += 1
+            continue
+        if marker in (0xDA, 0xD9):  # SOS/EOI: 헤더 끝
+            return
+        (length,) = struct.unpack(">H", data[position + 2:position + 4])
+        yield marker, position, position + 2 + length
+        position += 2 + length
+
+
+def _exif_segment(data: bytes) -> Optional[Tuple[int, int]]:
+    for marker, start, end in _jpeg_segments(data):
+        if marker == 0xE1 and data[start + 4:start + 10] == b"Exif\x00\x00":
+            return start, end
+    return None
+
+
+def _orientation_entry(data: bytes, segment: Tuple[int, int]) -> Optional[Tuple[int, str]]:
+    """IFD0의 Orientation 값이 들어 있는 (파일 위치, 바이트 순서). 태그가 없으면 None."""
+    tiff = segment[0] + 10
+    endian = "<" if data[tiff:tiff + 2] == b"II" else ">"
+    (ifd_offset,) = struct.unpack(f"{endian}I", data[tiff + 4:tiff + 8])
+    ifd = tiff + ifd_offset
+    (count,) = struct.unpack(f"{endian}H", data[ifd:ifd + 2])
+    for index in range(count):
+        entry = ifd + 2 + index * 12
+        if entry + 12 > segment[1]:
+            break
+        tag, tag_type, values = struct.unpack(f"{endian}HHI", data[entry:entry + 8])
+        if tag == ORIENTATION_TAG and tag_type == _SHORT and values == 1:
+            return entry + 8, endian
+    return None
+
+
+def jpeg_orientation(data: bytes) -> int:
+    segment = _exif_segment(data)
+    entry = _orientation_entry(data, segment) if segment is not None else None
+    if entry is None:
+        return 1
+    offset, endian = entry
+    (orientation,) = struct.unpack(f"{endian}H", data[offset:offset + 2])
+    return orientation if orientation in _MATRICES else 1
+
+
+def with_jpeg_orientation(data: bytes, orientation: int) -> Tuple[bytes, Optional[int]]:
+    """Orientation만 바꾼 JPEG 바이트와, 제자리에서 바뀐 2바이트의 위치(없으면 None).
+
+    대부분의 카메라/휴대폰 사진은 IFD0에 Orientation이 이미 있어 값 2바이트만
+    바뀐다. 태그가 없으면 EXIF 세그먼트를 Pillow로 다시 만들고, EXIF가 아예 없으면
+    최소한의 EXIF 세그먼트를 넣는다. 어느 경우든 압축 데이터는 그대로 복사된다.
+    """
+    segment = _exif_segment(data)
+    entry = _orientation_entry(data, segment) if segment is not None else None
+    if entry is not None:
+        offset, endian = entry
+        return data[:offset] + struct.pack(f"{endian}H", orientation) + data[offset + 2:], offset
+    if segment is not None:
+        exif = Image.Exif()
+        exif.load(data[segment[0] + 4:segment[1]])
+        exif[ORIENTATION_TAG] = orientation
+        payload = exif.tobytes()
+        start, end = segment
+    else:
+        payload = b"Exif\x00\x00II*\x00" + struct.pack("<IHHHIHHI", 8, 1, ORIENTATION_TAG, _SHORT, 1, orientation, 0, 0)
+        # JFIF APP0는 SOI 바로 뒤에 있어야 하므로 그 뒤에 넣는다
+        first = next(_jpeg_segments(data), None)
+        start = end = first[2] if first is not None and first[0] == 0xE0 else 2
+    if len(payload) + 2 > 0xFFFF:
+        raise ValueError("EXIF가 너무 커서 다시 쓸 수 없습니다")
+    segment_bytes = b"\xff\xe1" + struct.pack(">H", len(payload) + 2) + payload
+    return data[:start] + segment_bytes + data[end:], None
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, List, Optional, Tuple
+
+from rendering import FULL_QUALITY, crop_region, decode_image, decode_reduced, render_image
+from resample_policy import ResamplePolicy
+
+_USE_POSIX = os.name != "nt"
+
+
+def _render_into_shared_memory(
+    shm_name: str,
+    file_path: str,
+    target_size: Tuple[int, int],
+    draft: bool,
+    data: Optional[bytes] = None,
+    rapid: bool = False,
+    ms_per_mp: Optional[Dict[str, float]] = None,
+    region: Optional[Tuple[float, float, float, float]] = None,
+) -> Tuple[int, int, str, str, Tuple[int, int], float]:
+    """디코더 프로세스에서 실행: 렌디션을 만들어 부모가 준비한 공유 메모리에 쓴다.
+
+    픽셀은 행 사이 여백 없이(stride = width * bpp) 기록하고, 부모가 QImage를
+    만들 수 있도록 (width, height, mode)와 리샘플링 선택/비용만 피클링해 돌려준다.
+    필터는 부모가 넘긴 비용 추정치(ms_per_mp)로 같은 ResamplePolicy 규칙에 따라 고른다.
+    region(확대 보기 영역)이 주어지면 원본 해상도로 디코딩해 그 영역만 렌더링한다.
+    """
+    started = time.perf_counter()
+    if region is not None:
+        image = crop_region(decode_image(file_path, data=data), region)
+    else:
+        image = decode_reduced(file_path, target_size, data) or decode_image(
+            file_path, draft_size=target_size if draft else None, data=data
+        )
+    decode_ms = (time.perf_counter() - started) * 1000
+    resample = ResamplePolicy(ms_per_mp).choose(image.size, target_size, rapid and not draft, decode_ms)
+    started = time.perf_counter()
+    rendered = render_image(image, target_size, draft=draft, resample=resample)
+    render_ms = (time.perf_counter() - started) * 1000
+    data = rendered.tobytes()
+    shm = SharedMemory(name=shm_name)
+    try:
+        shm.buf[: len(data)] = data
+    finally:
+        shm.close()
+    return rendered.width, rendered.height, rendered.mode, resample, image.size, render_ms
+
+
+class SharedRendition:
+    """디코더 프로세스가 공유 메모리에 써 둔 렌디션.
+
+    buffer는 복사 없이 QImage로 감쌀 수 있다. 감싼 뒤에는 ProcessDecoder.retire()로
+    넘겨야 하며, QImage가 버퍼를 참조하는 동안에는 공유 메모리를 닫을 수 없으므로
+    해제는 ProcessDecoder가 나중에 다시 시도한다.
+    """
+
+    __slots__ = ("_shm", "width", "height", "mode", "resample", "source_size", "render_ms")
+
+    def __init__(
+        self,
+        shm: SharedMemory,
+        width: int,
+        height: int,
+        mode: str,
+        resample: str = FULL_QUALITY,
+        source_size: Tuple[int, int] = (0, 0),
+        render_ms: float = 0.0,
+    ):
+        self._shm = shm
+        self.width = width
+        self.height = height
+        self.mode = mode
+        self.resample = resample
+        self.source_size = source_size
+        self.render_ms = render_ms
+
+    @property
+    def buffer(self) -> memoryview:
+        # shm.buf를 그대로 넘기면 QImage는 참조만 쥘 뿐 버퍼를 export하지 않아
+        # close()가 성공해 버린다. 별도 뷰를 만들어야 mmap이 QImage 수명 동안 유지된다.
+        return memoryview(self._shm.buf)
+
+    @property
+    def bytes_per_line(self) -> int:
+        return self.width * len(self.mode)
+
+
+class ProcessDecoder:
+    """디코드+리사이즈를 별도 프로세스 풀에서 수행하는 백엔드.
+
+    PNG inflate, GIF, TIFF LZW 등 GIL을 쥔 채 도는 디코더는 스레드를 늘려도
+    코어를 나눠 쓰지 못하므로 프로세스로 분리한다. 워커 프로세스는 재사용되며,
+    손상된 파일이 디코더를 크래시시켜도 풀만 다시 만들 뿐 뷰어는 살아남는다.
+    """
+
+    def __init__(self, max_workers: int = 0):
+        self._max_workers = max_workers or max(1, (os.cpu_count() or 2) - 1)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._retired: List[SharedMemory] = []
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # Qt 스레드가 도는 프로세스를 fork하면 안전하지 않으므로 모든 플랫폼에서 spawn 사용
+                context = multiprocessing.get_context("spawn")
+                self._executor = ProcessPoolExecutor(max_workers=self._max_workers, mp_context=context)
+            return self._executor
+
+    def _discard_executor(self, broken: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._executor is broken:
+                self._executor = None
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    def render(
+        self,
+        file_path: str,
+        target_size: Tuple[int, int],
+        draft: bool = False,
+        data: Optional[bytes] = None,
+        rapid: bool = False,
+        ms_per_mp: Optional[Dict[str, float]] = None,
+        region: Optional[Tuple[float, float, float, float]] = None,
+    ) -> SharedRendition:
+        """워커 스레드에서 호출: 결과가 준비될 때까지 블록한다.
+
+        data(바이트 캐시에 있던 파일 내용)가 주어지면 디코더 프로세스는 디스크를
+        다시 읽지 않는다. rapid와 ms_per_mp(ResamplePolicy.snapshot())는 빠른 탐색 중
+        리샘플링 필터 선택에 쓰이며, 고른 필터와 비용은 결과 렌디션에 담겨 돌아온다.
+        region은 확대 보기에서 렌더링할 영역이다 (rendering.crop_region).
+
+        풀이 깨지면(다른 파일의 크래시에 휘말린 경우 포함) 새 풀에서 한 번만
+        재시도하고, 그래도 실패하면 OSError로 보고한다.
+        """
+        self.release_unused()
+        box_width, box_height = target_size
+        shm = SharedMemory(create=True, size=max(1, box_width * box_height * 4))
+        try:
+            for attempt in range(2):
+                executor = self._get_executor()
+                try:
+                    width, height, mode, resample, source_size, render_ms = executor.submit(
+                        _render_into_shared_memory, shm.name, file_path, target_size, draft, data, rapid, ms_per_mp, region
+                    ).result()
+                    break
+                except BrokenProcessPool:
+                    self._discard_executor(executor)
+                    if attempt:
+                        raise OSError(f"디코더 프로세스가 비정상 종료되었습니다: {file_path}")
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+
+        if _USE_POSIX:
+            # 이름만 지우고 매핑은 유지: 부모가 죽어도 /dev/shm에 찌꺼기가 남지 않는다
+            shm.unlink()
+        return SharedRendition(shm, width, height, mode, resample, source_size, render_ms)
+
+    def retire(self, rendition: SharedRendition) -> None:
+        """QImage로 감싼 뒤 호출: 참조가 사라지면 release_unused()가 블록을 닫는다."""
+        with self._lock:
+            self._retired.append(rendition._shm)
+
+    def release_unused(self) -> None:
+        """더 이상 QImage가 참조하지 않는 공유 메모리 블록을 닫는다."""
+        with self._lock:
+            still_in_use = []
+            for shm in self._retired:
+                try:
+                    shm.close()
+                except BufferError:
+                    still_in_use.append(shm)
+            self._retired = still_in_use
+
+    def holds_shared_memory(self) -> bool:
+        """아직 닫지 못한(QImage가 참조 중인) 공유 메모리 블록이 남아 있으면 True."""
+        with self._lock:
+            return bool(self._retired)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        self.release_unused()
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import io
+import math
+from typing import Optional, Tuple
+
+from PIL import Image
+
+from color_management import to_display_colors
+from constants import MAX_MEMORY_MB
+from orientation import apply_orientation, display_region_to_stored, exif_orientation, swaps_axes
+from streaming_decode import decode_downscaled
+from tone_mapping import HIGH_BIT_DEPTH_MODES, cmyk_to_rgb, tone_map_to_l
+
+# 이 모듈은 Qt에 의존하지 않는다. 스레드 워커와 디코더 프로세스(process_decoder)가
+# 같은 디코드/리사이즈 경로를 공유해야 하는데, 프로세스 쪽에서 Qt를 임포트하면
+# 워커 시작이 느려지고 GUI 없는 환경에서 불필요한 의존성이 생기기 때문이다.
+
+DISPLAY_MODES = ("RGB", "RGBA", "L")
+
+# 리샘플링 필터 이름 → (Pillow 필터, reducing_gap). 빠른 필터는 정수 배 축소(reduce)를
+# 먼저 거쳐 큰 축소에서도 비용과 앨리어싱을 줄인다. 어떤 필터를 쓸지는 resample_policy가 정한다.
+RESAMPLE_FILTERS = {
+    "lanczos": (Image.Resampling.LANCZOS, None),
+    "bilinear": (Image.Resampling.BILINEAR, 2.0),
+    "nearest": (Image.Resampling.NEAREST, None),
+}
+FULL_QUALITY = "lanczos"
+
+
+def decode_image(
+    file_path: str, draft_size: Optional[Tuple[int, int]] = None, data: Optional[bytes] = None
+) -> Image.Image:
+    """파일을 완전히 디코딩해 파일 핸들과 분리된 이미지를 반환.
+
+    draft_size가 주어지면 JPEG는 DCT 단계에서 그 크기 이상이 되는 가장 작은
+    배율로 축소 디코딩한다(다른 형식은 무시). 결과는 원본 해상도가 아니므로
+    원본 캐시에 넣으면 안 된다. data(이미 읽어 둔 파일 바이트)가 주어지면
+    디스크 대신 메모리에서 디코딩한다.
+    """
+    with Image.open(io.BytesIO(data) if data is not None else file_path) as opened:
+        if draft_size is not None:
+            opened.draft(None, draft_size)
+        return opened.copy()
+
+
+def decode_reduced(
+    file_path: str, target_size: Tuple[int, int], data: Optional[bytes] = None,
+    memory_limit_mb: int = MAX_MEMORY_MB,
+) -> Optional[Image.Image]:
+    """원본 해상도로 디코딩하면 원본 캐시 예산(memory_limit_mb)을 넘는 거대 이미지만
+    띠 단위로 축소하며 디코딩한다 (PNG, 스트립 TIFF, 비압축 BMP).
+
+    최대 메모리가 원본이 아니라 결과 + 띠 하나에 비례하고, 압축 폭탄 검사에도
+    걸리지 않는다. 결과는 원본이 아니므로 원본 캐시에 넣으면 안 된다. 해당하지
+    않으면 None을 반환하므로 호출자는 평소대로 decode_image를 쓰면 된다.
+    """
+    source = io.BytesIO(data) if data is not None else file_path
+    return decode_downscaled(source, target_size, memory_limit_mb * 1024 * 1024)
+
+
+def crop_region(image: Image.Image, region: Tuple[float, float, float, float]) -> Image.Image:
+    """표시 방향 기준 정규화 영역 (left, top, right, bottom)만 원본에서 잘라낸다 (확대 보기용).
+
+    잘라낸 이미지는 원본의 info(EXIF 방향, ICC 프로파일)를 그대로 가지므로
+    render_image에 넘기면 평소와 같은 방향·색으로 렌더링된다.
+    """
+    left, top, right, bottom = display_region_to_stored(region, exif_orientation(image))
+    width, height = image.size
+    box = (
+        max(0, math.floor(left * width)),
+        max(0, math.floor(top * height)),
+        min(width, max(1, math.ceil(right * width))),
+        min(height, max(1, math.ceil(bottom * height))),
+    )
+    return image.crop(box)
+
+
+def fit_size(width: int, height: int, box_width: int, box_height: int) -> Tuple[int, int]:
+    """비율을 유지한 채 (box_width, box_height) 안에 들어가는 최대 크기."""
+    image_ratio = width / height
+    box_ratio = box_width / box_height
+    if image_ratio > box_ratio:
+        return box_width, max(1, int(box_width / image_ratio))
+    return max(1, int(box_height * image_ratio)), box_height
+
+
+def resize_to_fit(
+    image: Image.Image, box_width: int, box_height: int, draft: bool = False, resample: str = FULL_QUALITY
+) -> Image.Image:
+    new_size = fit_size(image.width, image.height, box_width, box_height)
+    if draft:
+        # 정수 배 축소(reduce)로 먼저 줄인 뒤 BILINEAR: LANCZOS보다 몇 배 빠르다
+        resample = "bilinear"
+    resample_filter, reducing_gap = RESAMPLE_FILTERS[resample]
+    return image.resize(new_size, resample_filter, reducing_gap=reducing_gap)
+
+
+def prepare_for_resize(image: Image.Image) -> Image.Image:
+    """리샘플링 필터가 제대로 적용되지 않는 모드만 리사이즈 전에 변환.
+
+    Pillow는 P/1 모드를 항상 NEAREST로 리사이즈하므로 먼저 연속 톤 모드로
+    바꾼다. 그 밖의 모드(16비트, 실수, CMYK 등)는 원본 해상도에서 변환하지 않고
+    축소된 뒤에 to_display_mode에서 처리한다.
+    """
+    if image.mode == "P":
+        return image.convert("RGBA" if "transparency" in image.info else "RGB")
+    if image.mode == "PA":
+        return image.convert("RGBA")
+    if image.mode == "1":
+        return image.convert("L")
+    if image.mode == "I;16B":
+        # Pillow의 리샘플러가 빅엔디언 16비트를 리틀엔디언으로 읽어 값이 뒤섞인다
+        return image.convert("I")
+    return image
+
+
+def to_display_mode(image: Image.Image) -> Image.Image:
+    """Qt로 넘기기 전에 QImage가 직접 표현할 수 있는 모드로 맞춘다."""
+    if image.mode in DISPLAY_MODES:
+        return image
+    if image.mode in HIGH_BIT_DEPTH_MODES:
+        return tone_map_to_l(image)
+    if image.mode == "CMYK":
+        return cmyk_to_rgb(image)
+    if image.mode in ("YCbCr", "LAB", "HSV"):
+        return image.convert("RGB")
+    return image.convert("RGBA")
+
+
+def render_image(
+    image: Image.Image, target_size: Tuple[int, int], draft: bool = False, resample: str = FULL_QUALITY
+) -> Image.Image:
+    """디코딩된 원본을 화면 표시용 렌디션으로 만든다.
+
+    draft=True는 마감 시간을 지켜야 할 때 쓰는 저품질·고속 렌디션이다.
+    resample은 RESAMPLE_FILTERS의 필터 이름이다 (draft면 무시). 임베디드 ICC 프로파일
+    색 변환과 EXIF 방향 회전은 축소가 끝난 뒤에 적용해 비용이 화면 픽셀 수에 비례한다.
+    """
+    icc_profile = image.info.get("icc_profile")
+    orientation = exif_orientation(image)
+    box_width, box_height = target_size
+    if swaps_axes(orientation):
+        box_width, box_height = box_height, box_width
+    resized = resize_to_fit(prepare_for_resize(image), box_width, box_height, draft=draft, resample=resample)
+    return to_display_mode(to_display_colors(apply_orientation(resized, orientation), icc_profile))
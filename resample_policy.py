@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+from constants import RESAMPLE_RAPID_BUDGET_MS, RESAMPLE_RAPID_NAV_PER_S
+from rendering import FULL_QUALITY
+
+# 이 모듈은 Qt에 의존하지 않는다: 디코더 프로세스도 스냅샷으로 같은 정책을 쓴다.
+
+_QUALITY_ORDER = ("lanczos", "bilinear", "nearest")
+# 측정 전 가정하는 메가픽셀당 비용(ms): 일반적인 데스크톱 CPU에서 잰 값
+_DEFAULT_MS_PER_MP = {"lanczos": 20.0, "bilinear": 7.0, "nearest": 0.5}
+_EWMA_ALPHA = 0.3
+_VELOCITY_WINDOW_S = 1.0
+
+
+def _work_megapixels(source_size: Tuple[int, int], target_size: Tuple[int, int]) -> float:
+    # 축소는 원본 픽셀 수에, 확대는 결과 픽셀 수에 비례해 비용이 든다
+    return max(source_size[0] * source_size[1], target_size[0] * target_size[1]) / 1_000_000
+
+
+class ResamplePolicy:
+    """렌디션을 만들 때 쓸 리샘플링 필터를 고르고, 선택과 비용을 기록한다.
+
+    평소에는 항상 LANCZOS를 쓴다. 빠른 탐색 중(rapid)에는 한 장에 쓸 시간
+    RESAMPLE_RAPID_BUDGET_MS에서 이번 디코드에 걸린 시간을 뺀 나머지 안에 끝날 것으로
+    추정되는 가장 좋은 필터를 고르고, 아무것도 맞지 않으면 NEAREST를 쓴다. 추정은
+    필터별로 측정한 메가픽셀당 시간(EWMA)에 원본/결과 크기를 곱해 구한다.
+    GUI 스레드와 워커 스레드가 함께 쓴다.
+    """
+
+    def __init__(self, ms_per_mp: Optional[Dict[str, float]] = None):
+        self._lock = threading.Lock()
+        self._ms_per_mp = dict(_DEFAULT_MS_PER_MP if ms_per_mp is None else ms_per_mp)
+        self.choices: Dict[str, int] = {name: 0 for name in _QUALITY_ORDER}
+        self.total_ms: Dict[str, float] = {name: 0.0 for name in _QUALITY_ORDER}
+
+    def snapshot(self) -> Dict[str, float]:
+        """디코더 프로세스로 넘길 현재 비용 추정치."""
+        with self._lock:
+            return dict(self._ms_per_mp)
+
+    def estimate_ms(self, name: str, source_size: Tuple[int, int], target_size: Tuple[int, int]) -> float:
+        with self._lock:
+            rate = self._ms_per_mp[name]
+        return rate * _work_megapixels(source_size, target_size)
+
+    def choose(
+        self, source_size: Tuple[int, int], target_size: Tuple[int, int], rapid: bool, decode_ms: float = 0.0
+    ) -> str:
+        if not rapid:
+            return FULL_QUALITY
+        budget = RESAMPLE_RAPID_BUDGET_MS - decode_ms
+        for name in _QUALITY_ORDER:
+            if self.estimate_ms(name, source_size, target_size) <= budget:
+                return name
+        return _QUALITY_ORDER[-1]
+
+    def record(self, name: str, source_size: Tuple[int, int], target_size: Tuple[int, int], elapsed_ms: float) -> None:
+        megapixels = _work_megapixels(source_size, target_size)
+        with self._lock:
+            self.choices[name] += 1
+            self.total_ms[name] += elapsed_ms
+            if megapixels >= 0.1:  # 아주 작은 이미지는 고정 비용이 지배해 단가를 왜곡한다
+                rate = elapsed_ms / megapixels
+                self._ms_per_mp[name] += _EWMA_ALPHA * (rate - self._ms_per_mp[name])
+
+    def summary(self) -> str:
+        with self._lock:
+            parts = []
+            for name in _QUALITY_ORDER:
+                count = self.choices[name]
+                average = self.total_ms[name] / count if count else 0.0
+                parts.append(f"{name} {count}회(평균 {average:.1f}ms, {self._ms_per_mp[name]:.1f}ms/MP)")
+        return ", ".join(parts)
+
+
+class NavigationVelocity:
+    """최근 1초 동안의 이미지 이동 횟수로 탐색 속도를 잰다 (GUI 스레드 전용)."""
+
+    def __init__(self) -> None:
+        self._times: Deque[float] = deque()
+        self.last_time: Optional[float] = None
+
+    def record(self) -> None:
+        now = time.monotonic()
+        self._times.append(now)
+        self.last_time = now
+        self._trim(now)
+
+    def _trim(self, now: float) -> None:
+        while self._times and now - self._times[0] > _VELOCITY_WINDOW_S:
+            self._times.popleft()
+
+    @property
+    def per_second(self) -> float:
+        self._trim(time.monotonic())
+        return len(self._times) / _VELOCITY_WINDOW_S
+
+    @property
+    def rapid(self) -> bool:
+        return self.per_second >= RESAMPLE_RAPID_NAV_PER_S
+
+    def idle_ms(self) -> float:
+        if self.last_time is None:
+            return float("inf")
+        return (time.monotonic() - self.last_time) * 1000
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+from PySide6.QtCore import QByteArray, QSettings
+
+from constants import APP_NAME, ORG_NAME, SESSION_WARM_RENDITIONS
+
+_GROUP = "session"
+
+
+class SessionState:
+    """종료 시점의 보기 상태: 다음 실행에서 같은 자리로 돌아가고 캐시를 미리 데우기 위한 것.
+
+    - 마지막 파일과 그 폴더(압축 파일이면 "archive.zip!/"), current_index
+    - 창 위치/크기 (QWidget.saveGeometry)
+    - 가장 최근에 쓰인 원본 품질 렌디션 키 (최근 것 먼저, SESSION_WARM_RENDITIONS개)
+
+    QSettings(ORG_NAME, APP_NAME)에 저장한다. 렌디션 키는 "경로::서명::크기@dpr"이므로
+    다음 실행에서는 경로만 꺼내 지금 창 크기로 다시 렌더링한다.
+    """
+
+    def __init__(self):
+        self.file_path: Optional[str] = None
+        self.directory: Optional[str] = None
+        self.index = 0
+        self.geometry: Optional[QByteArray] = None
+        self.hot_renditions: List[str] = []
+
+    @staticmethod
+    def _settings() -> QSettings:
+        return QSettings(ORG_NAME, APP_NAME)
+
+    @classmethod
+    def load(cls) -> "SessionState":
+        state = cls()
+        settings = cls._settings()
+        settings.beginGroup(_GROUP)
+        state.file_path = settings.value("file") or None
+        state.directory = settings.value("directory") or None
+        try:
+            state.index = max(0, int(settings.value("index", 0)))
+        except (TypeError, ValueError):
+            state.index = 0
+        geometry = settings.value("geometry")
+        state.geometry = geometry if isinstance(geometry, QByteArray) and not geometry.isEmpty() else None
+        hot = settings.value("hot_renditions", [])
+        # 항목이 하나뿐이면 백엔드에 따라 리스트가 아니라 문자열로 돌아온다
+        state.hot_renditions = [hot] if isinstance(hot, str) else [str(key) for key in hot or []]
+        settings.endGroup()
+        return state
+
+    def save(self) -> None:
+        settings = self._settings()
+        settings.beginGroup(_GROUP)
+        settings.setValue("file", self.file_path or "")
+        settings.setValue("directory", self.directory or "")
+        settings.setValue("index", self.index)
+        if self.geometry is not None:
+            settings.setValue("geometry", self.geometry)
+        settings.setValue("hot_renditions", self.hot_renditions[:SESSION_WARM_RENDITIONS])
+        settings.endGroup()
+        settings.sync()
+
+    def hot_paths(self) -> List[str]:
+        """저장된 렌디션 키의 파일 경로 (중복 제거, 최근 것 먼저)."""
+        paths: List[str] = []
+        for cache_key in self.hot_renditions:
+            file_path = cache_key.split("::", 1)[0]
+            if file_path and file_path not in paths:
+                paths.append(file_path)
+        return paths
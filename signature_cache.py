@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
+
+from PySide6.QtCore import QFileSystemWatcher, QObject
+
+from archive import split_member_path
+from constants import SIGNATURE_TTL_S, SIGNATURE_WATCHED_TTL_S
+from utils import file_signature
+
+Signature = Optional[Tuple[int, int]]
+
+
+def _watch_key(path: str) -> str:
+    """경로의 변경을 알려 줄 감시 대상: 일반 파일은 부모 폴더, 압축 파일 멤버는 압축 파일 자체."""
+    member = split_member_path(path)
+    return member[0] if member is not None else os.path.dirname(path)
+
+
+class SignatureCache(QObject):
+    """경로별 file_signature(stat) 결과 캐시. GUI 스레드와 워커 스레드가 함께 쓴다.
+
+    네트워크 파일시스템에서는 stat 한 번이 왕복 한 번이라, 탐색 한 번에 같은 파일을
+    여러 번 stat하면 그만큼 느려진다. 폴더 감시(watch)는 파일 추가/삭제/이름 바꾸기만
+    알려 주고, 편집기가 파일을 제자리에서 덮어쓰거나 잘라 다시 쓰는 경우는 알려 주지
+    않는다. 그래서 파일 자체를 감시하는 파일(watch_files: 현재 이미지와 프리페치 범위)의
+    서명만 SIGNATURE_WATCHED_TTL_S 동안 재사용하고, 나머지는 SIGNATURE_TTL_S가 지나면
+    다시 stat한다. 감시 대상이 바뀌었다는 알림이 오면 해당 항목을 바로 버린다.
+    """
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        # 감시 단위(폴더/압축 파일) → 경로 → (서명, 만료 시각): 변경 알림 시 묶음째 버린다
+        self._entries: Dict[str, Dict[str, Tuple[Signature, float]]] = {}
+        self._watched: FrozenSet[str] = frozenset()
+        self._watched_files: FrozenSet[str] = frozenset()
+        self.hits = 0
+        self.stat_calls = 0
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_changed)
+        self._watcher.fileChanged.connect(self._on_changed)
+
+    def get(self, path: str) -> Signature:
+        return self.get_timed(path)[0]
+
+    def get_timed(self, path: str) -> Tuple[Signature, Optional[float]]:
+        """(서명, 실제로 stat했다면 걸린 초). 캐시에서 나온 값이면 두 번째는 None."""
+        key = _watch_key(path)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key, {}).get(path)
+            if entry is not None and now < entry[1]:
+                self.hits += 1
+                return entry[0], None
+        started = time.perf_counter()
+        signature = file_signature(path)
+        elapsed = time.perf_counter() - started
+        ttl = self._ttl(path)
+        with self._lock:
+            self.stat_calls += 1
+            self._entries.setdefault(key, {})[path] = (signature, now + ttl)
+        return signature, elapsed
+
+    def update(self, path: str, signature: Signature) -> None:
+        """직접 파일을 고친 뒤 새로 잰 서명을 넣는다 (다시 stat하지 않도록)."""
+        key = _watch_key(path)
+        ttl = self._ttl(path)
+        with self._lock:
+            self._entries.setdefault(key, {})[path] = (signature, time.monotonic() + ttl)
+
+    def _ttl(self, path: str) -> float:
+        # 압축 파일 멤버는 압축 파일 자체를 감시하므로 어떤 수정이든 알림이 온다
+        if path in self._watched_files or (split_member_path(path) is not None and _watch_key(path) in self._watched):
+            return SIGNATURE_WATCHED_TTL_S
+        return SIGNATURE_TTL_S
+
+    def invalidate(self, path: str) -> None:
+        with self._lock:
+            self._entries.get(_watch_key(path), {}).pop(path, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def watch(self, paths: Iterable[str]) -> None:
+        """감시 대상(폴더 또는 압축 파일)을 바꾼다. GUI 스레드에서만 호출.
+
+        다른 폴더로 옮겨 가면 이전 폴더의 서명은 더 쓸 일이 없으므로 함께 비운다.
+        """
+        watched = frozenset(paths)
+        if watched == self._watched:
+            return
+        if self._watcher.files() or self._watcher.directories():
+            self._watcher.removePaths(self._watcher.files() + self._watcher.directories())
+        if watched:
+            self._watcher.addPaths(list(watched))
+        self._watched = watched
+        self._watched_files = frozenset()
+        self.clear()
+
+    def watch_files(self, paths: Iterable[str]) -> None:
+        """파일 자체를 감시할 경로(현재 이미지와 프리페치 범위)를 바꾼다. GUI 스레드에서만 호출.
+
+        감시에서 빠지는 파일의 서명은 이제 수정 알림이 오지 않으므로 SIGNATURE_TTL_S 안에
+        다시 확인하게 만료 시각을 당긴다.
+        """
+        files = frozenset(path for path in paths if split_member_path(path) is None)
+        if files == self._watched_files:
+            return
+        removed = self._watched_files - files
+        added = files - self._watched_files
+        if removed:
+            self._watcher.removePaths([path for path in removed if path in self._watcher.files()])
+        if added:
+            self._watcher.addPaths(list(added))
+        self._watched_files = files
+        deadline = time.monotonic() + SIGNATURE_TTL_S
+        with self._lock:
+            for path in removed:
+                entries = self._entries.get(_watch_key(path), {})
+                entry = entries.get(path)
+                if entry is not None and entry[1] > deadline:
+                    entries[path] = (entry[0], deadline)
+
+    def _on_changed(self, path: str) -> None:
+        with self._lock:
+            self._entries.pop(path, None)
+            if path in self._watched_files:
+                self._entries.get(_watch_key(path), {}).pop(path, None)
+        # 새 파일로 바꿔치는 방식으로 저장하면 감시가 풀리므로 다시 건다
+        if path in self._watched_files and path not in self._watcher.files() and os.path.exists(path):
+            self._watcher.addPath(path)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(entries) for entries in self._entries.values())
+
+    def summary(self) -> str:
+        return f"{len(self)}개, 재사용 {self.hits}회, 실제 stat {self.stat_calls}회"
@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+from PySide6.QtCore import QObject, QRunnable, QStandardPaths, QThreadPool, Signal
+
+from constants import (
+    APP_NAME,
+    ORG_NAME,
+    SIMILAR_BATCH_SIZE,
+    SIMILAR_DECODE_SIZE,
+    SIMILAR_MAX_DISTANCE,
+    SIMILAR_WORKERS,
+)
+from signature_cache import SignatureCache
+from thumbnails import load_thumbnail
+
+_HASH_VERSION = 1
+_HASH_WIDTH, _HASH_HEIGHT = 9, 8  # 가로로 이웃한 픽셀 8쌍 x 8행 = 64비트 dHash
+
+
+# ----------------------------------------------------------------------
+# dHash (Qt 비의존)
+# ----------------------------------------------------------------------
+def hash_input(file_path: str) -> np.ndarray:
+    """dHash 입력: 9x8 회색조 픽셀.
+
+    썸네일과 같은 축소 디코딩(EXIF 임베디드 썸네일, JPEG DCT 축소, 거대 이미지 띠 디코딩)을
+    쓰므로 원본 해상도 디코딩 없이 만들어진다. 방향도 썸네일처럼 적용된 뒤라 EXIF 방향만
+    다른 같은 사진은 같은 해시가 된다.
+    """
+    image = load_thumbnail(file_path, SIMILAR_DECODE_SIZE).convert("L")
+    return np.asarray(image.resize((_HASH_WIDTH, _HASH_HEIGHT), Image.Resampling.BOX), dtype=np.uint8)
+
+
+def dhash_batch(pixels: np.ndarray) -> List[int]:
+    """(N, 8, 9) 회색조 묶음의 dHash를 한 번의 NumPy 연산으로 계산해 64비트 정수로."""
+    bits = pixels[:, :, 1:] > pixels[:, :, :-1]
+    packed = np.packbits(bits.reshape(len(pixels), -1), axis=1)
+    return [int(value) for value in packed.view(">u8").ravel()]
+
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+class BKTree:
+    """해밍 거리 BK-트리: 거리 d 이내의 해시를 전체 비교 없이 찾는다.
+
+    노드는 [해시, 그 해시를 가진 값 목록, {거리: 자식 노드}]. 삼각 부등식으로
+    |거리(질의, 노드) - 간선 거리| > d인 가지는 통째로 건너뛴다.
+    """
+
+    def __init__(self):
+        self._root: Optional[list] = None
+
+    def add(self, value_hash: int, value) -> None:
+        if self._root is None:
+            self._root = [value_hash, [value], {}]
+            return
+        node = self._root
+        while True:
+            distance = hamming(value_hash, node[0])
+            if distance == 0:
+                node[1].append(value)
+                return
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = [value_hash, [value], {}]
+                return
+            node = child
+
+    def query(self, value_hash: int, max_distance: int) -> Iterator[Tuple[int, list]]:
+        """max_distance 이내인 (해시, 값 목록)."""
+        if self._root is None:
+            return
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            distance = hamming(value_hash, node[0])
+            if distance <= max_distance:
+                yield node[0], node[1]
+            for edge, child in node[2].items():
+                if distance - max_distance <= edge <= distance + max_distance:
+                    stack.append(child)
+
+
+def group_similar(hashes: Dict[str, int], order: List[str], max_distance: int = SIMILAR_MAX_DISTANCE) -> List[List[str]]:
+    """해밍 거리 max_distance 이내로 이어지는 파일끼리 묶는다 (두 장 이상인 묶음만).
+
+    연사처럼 한 장씩 조금씩 달라지는 사진도 한 묶음이 되도록 연결 요소로 묶는다.
+    묶음과 묶음 안의 파일은 order(현재 탐색 목록) 순서를 따른다.
+    """
+    tree = BKTree()
+    for file_path, value_hash in hashes.items():
+        tree.add(value_hash, file_path)
+    parent: Dict[int, int] = {}
+
+    def find(value_hash: int) -> int:
+        root = value_hash
+        while parent.get(root, root) != root:
+            root = parent[root]
+        while value_hash != root:  # 경로 압축
+            parent[value_hash], value_hash = root, parent[value_hash]
+        return root
+
+    for value_hash in set(hashes.values()):
+        for neighbor, _ in tree.query(value_hash, max_distance):
+            a, b = find(value_hash), find(neighbor)
+            if a != b:
+                parent[a] = b
+    groups: Dict[int, List[str]] = {}
+    for file_path in order:
+        value_hash = hashes.get(file_path)
+        if value_hash is not None:
+            groups.setdefault(find(value_hash), []).append(file_path)
+    return [members for members in groups.values() if len(members) > 1]
+
+
+# ----------------------------------------------------------------------
+# 백그라운드 작업
+# ----------------------------------------------------------------------
+def _hash_file(directory: str) -> str:
+    base = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.GenericCacheLocation)
+    digest = hashlib.sha1(os.path.normcase(os.path.abspath(directory)).encode("utf-8")).hexdigest()
+    return os.path.join(base, ORG_NAME, APP_NAME, "similar", f"{digest}.json")
+
+
+class _SimilarSignals(QObject):
+    batch_done = Signal(int, object)  # dict로 보내면 64비트 부호 없는 해시가 Qt 정수 변환에서 넘친다
+
+
+class _HashBatchTask(QRunnable):
+    """파일 묶음의 서명을 확인하고, 바뀐 파일만 축소 디코딩해 한꺼번에 해시한다.
+
+    디코딩/축소는 Pillow가 GIL을 놓고 수행하므로 SIMILAR_WORKERS개 스레드가 코어를
+    나눠 쓴다. 결과: 경로 → [서명..., 해시] (해시를 못 만든 파일은 해시 None).
+    """
+
+    def __init__(
+        self,
+        generation: int,
+        current_generation: List[int],
+        paths: List[str],
+        known: Dict[str, list],
+        signatures: SignatureCache,
+    ):
+        super().__init__()
+        self.signals = _SimilarSignals()
+        self._generation = generation
+        self._current_generation = current_generation
+        self._paths = paths
+        self._known = known
+        self._signatures = signatures
+
+    def run(self) -> None:
+        results: Dict[str, list] = {}
+        pending: List[Tuple[str, list]] = []
+        pixels: List[np.ndarray] = []
+        for file_path in self._paths:
+            if self._current_generation[0] != self._generation:
+                return
+            signature = self._signatures.get(file_path)
+            if signature is None:
+                continue
+            entry = self._known.get(file_path)
+            if entry is not None and tuple(entry[:-1]) == signature:
+                results[file_path] = entry
+                continue
+            try:
+                pixels.append(hash_input(file_path))
+            except Exception:
+                results[file_path] = [*signature, None]  # 손상된 파일은 다시 시도하지 않도록 기록
+                continue
+            pending.append((file_path, list(signature)))
+        if pixels:
+            for (file_path, signature), value_hash in zip(pending, dhash_batch(np.stack(pixels))):
+                results[file_path] = [*signature, value_hash]
+        self.signals.batch_done.emit(self._generation, results)
+
+
+class SimilarImageFinder(QObject):
+    """폴더 안의 비슷한 이미지(연사, 재저장본 등)를 dHash로 찾아 묶는다.
+
+    해시는 MetadataIndex처럼 디렉토리마다 캐시 폴더의 JSON 하나에 file_signature와 함께
+    저장되어, 다시 찾을 때는 바뀐 파일만 디코딩한다. 묶기는 BK-트리로 이웃만 찾아
+    O(n²) 비교를 피한다.
+    """
+
+    progress = Signal(int, int)  # 처리한 파일 수, 전체 파일 수
+    grouped = Signal(list)       # 묶음 목록 (각 묶음은 탐색 목록 순서의 경로 목록)
+
+    def __init__(self, signatures: SignatureCache, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._signatures = signatures
+        self.directory: Optional[str] = None
+        self._paths: List[str] = []
+        self._entries: Dict[str, list] = {}
+        self._generation = [0]
+        self._pending_batches = 0
+        self._done = 0
+        self.running = False
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(SIMILAR_WORKERS)
+
+    def start(self, directory: str, paths: List[str]) -> None:
+        self._generation[0] += 1
+        generation = self._generation[0]
+        self.directory = directory
+        self._paths = list(paths)
+        self._entries = {}
+        self._pending_batches = 0
+        self._done = 0
+        self.running = True
+        known = self._load(directory)
+        for start in range(0, len(paths), SIMILAR_BATCH_SIZE):
+            task = _HashBatchTask(
+                generation, self._generation, paths[start:start + SIMILAR_BATCH_SIZE], known, self._signatures
+            )
+            task.signals.batch_done.connect(self._on_batch_done)
+            self._pending_batches += 1
+            self._pool.start(task)
+        if not self._pending_batches:
+            self._finish()
+
+    def _on_batch_done(self, generation: int, results: Dict[str, list]) -> None:
+        if generation != self._generation[0]:
+            return
+        self._entries.update(results)
+        self._pending_batches -= 1
+        self._done += len(results)
+        self.progress.emit(self._done, len(self._paths))
+        if self._pending_batches == 0:
+            self._finish()
+
+    def _finish(self) -> None:
+        self.running = False
+        self._save()
+        hashes = {path: entry[-1] for path, entry in self._entries.items() if entry[-1] is not None}
+        self.grouped.emit(group_similar(hashes, self._paths))
+
+    def cancel(self) -> None:
+        self._generation[0] += 1
+        self.running = False
+
+    # ------------------------------------------------------------------
+    # 영속화
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _load(directory: str) -> Dict[str, list]:
+        try:
+            with open(_hash_file(directory), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != _HASH_VERSION:
+            return {}
+        return {directory + relative: entry for relative, entry in data.get("entries", {}).items()}
+
+    def _save(self) -> None:
+        if not self.directory:
+            return
+        hash_file = _hash_file(self.directory)
+        data = {
+            "version": _HASH_VERSION,
+            "entries": {
+                path[len(self.directory):]: entry
+                for path, entry in self._entries.items()
+                if path.startswith(self.directory)
+            },
+        }
+        try:
+            os.makedirs(os.path.dirname(hash_file), exist_ok=True)
+            temp_file = f"{hash_file}.tmp"
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(temp_file, hash_file)
+        except OSError:
+            pass  # 저장 실패는 다음에 다시 해시하면 될 뿐이다
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import os
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Deque, Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from constants import (
+    SLIDESHOW_DEFAULT_MS_PER_MB,
+    SLIDESHOW_LOOKAHEAD,
+    SLIDESHOW_SAFETY_FACTOR,
+    SLIDESHOW_SAFETY_MARGIN_MS,
+)
+
+if TYPE_CHECKING:
+    from image_viewer_window import ImageViewerWindow
+
+_EWMA_ALPHA = 0.3  # 최근 측정값 비중: 캐시 적중 여부에 따라 흔들리는 값을 적당히 평활화
+
+
+class DecodeTimeEstimator:
+    """파일별 디코드+리사이즈 소요 시간을 측정값으로 추정한다.
+
+    한 번 측정한 파일은 그 값(EWMA)을 쓰고, 처음 보는 파일은 같은 확장자의
+    MB당 소요 시간에 파일 크기를 곱해 추정한다. 시간은 작업을 큐에 넣은
+    시점부터 재므로 스레드 풀 대기 시간도 포함된다.
+    """
+
+    def __init__(self) -> None:
+        self._per_file: Dict[str, float] = {}
+        self._ms_per_mb: Dict[str, float] = {}
+
+    @staticmethod
+    def _extension(file_path: str) -> str:
+        return os.path.splitext(file_path)[1].lower()
+
+    def record(self, file_path: str, size_bytes: int, elapsed_ms: float) -> None:
+        previous = self._per_file.get(file_path)
+        self._per_file[file_path] = elapsed_ms if previous is None else (
+            previous + _EWMA_ALPHA * (elapsed_ms - previous)
+        )
+        if size_bytes > 0:
+            ext = self._extension(file_path)
+            rate = elapsed_ms / (size_bytes / 1024 / 1024)
+            previous_rate = self._ms_per_mb.get(ext)
+            self._ms_per_mb[ext] = rate if previous_rate is None else (
+                previous_rate + _EWMA_ALPHA * (rate - previous_rate)
+            )
+
+    def estimate(self, file_path: str, size_bytes: int) -> float:
+        measured = self._per_file.get(file_path)
+        if measured is not None:
+            return measured
+        rate = self._ms_per_mb.get(self._extension(file_path), SLIDESHOW_DEFAULT_MS_PER_MB)
+        return rate * max(size_bytes, 0) / 1024 / 1024
+
+
+class SlideshowScheduler(QObject):
+    """마감 시각 기반 슬라이드쇼 스케줄러.
+
+    슬라이드 k가 표시되는 순간 k+1, k+2의 마감 시각을 정하고, 추정 디코드
+    시간만큼 앞서 미리 디코딩을 건다. 남은 시간 안에 원본 품질을 만들 수 없을
+    것 같으면 저품질(draft) 렌디션도 함께 요청해, 마감 때는 준비된 것 중 가장
+    좋은 품질을 띄운다. 아무것도 준비되지 못하면 마감을 놓친 것으로 기록한다.
+    """
+
+    deadline_missed = Signal(int, float)  # (인덱스, 지연 ms)
+
+    def __init__(self, viewer: "ImageViewerWindow", interval_ms: int):
+        super().__init__(viewer)
+        self._viewer = viewer
+        self.interval_ms = interval_ms
+        self.estimator = DecodeTimeEstimator()
+        self.running = False
+
+        self.slides_shown = 0
+        self.draft_slides = 0
+        self.missed_count = 0
+        self.worst_late_ms = 0.0
+        # 몇 시간씩 도는 동안 무한히 쌓이지 않게 최근 기록만 보관
+        self.recent_missed: Deque[Tuple[int, float]] = deque(maxlen=100)
+        self._late_since: Optional[float] = None
+
+        self._deadline: float = 0.0
+        self._deadline_timer = QTimer(self)
+        self._deadline_timer.setSingleShot(True)
+        self._deadline_timer.timeout.connect(self._on_deadline)
+        self._predecode_timers: List[QTimer] = []
+
+    # ------------------------------------------------------------------
+    # 시작 / 정지
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        if self.running or not self._viewer.images:
+            return
+        self.running = True
+        self._arm(time.monotonic())
+
+    def stop(self) -> None:
+        self.running = False
+        self._late_since = None
+        self._deadline_timer.stop()
+        self._cancel_predecode()
+
+    def set_interval(self, interval_ms: int) -> None:
+        self.interval_ms = interval_ms
+        if self.running:
+            self._arm(time.monotonic())
+
+    def restart_from_current(self) -> None:
+        """사용자가 직접 이동하면 그 슬라이드부터 간격을 다시 잰다."""
+        if self.running:
+            self._late_since = None
+            self._arm(time.monotonic())
+
+    # ------------------------------------------------------------------
+    # 스케줄링
+    # ------------------------------------------------------------------
+    def _next_index(self, steps: int = 1) -> int:
+        # 로비 디스플레이처럼 몇 시간씩 도는 용도라 끝에 닿으면 처음으로 돌아간다
+        return (self._viewer.current_index + steps) % len(self._viewer.images)
+
+    def _cancel_predecode(self) -> None:
+        for timer in self._predecode_timers:
+            timer.stop()
+            timer.deleteLater()
+        self._predecode_timers = []
+
+    def _arm(self, shown_at: float) -> None:
+        self._cancel_predecode()
+        self._deadline = shown_at + self.interval_ms / 1000
+        self._deadline_timer.start(self.interval_ms)
+
+        now = time.monotonic()
+        for steps in range(1, SLIDESHOW_LOOKAHEAD + 1):
+            index = self._next_index(steps)
+            deadline = shown_at + steps * self.interval_ms / 1000
+            estimate_ms = self._estimate(index) * SLIDESHOW_SAFETY_FACTOR + SLIDESHOW_SAFETY_MARGIN_MS
+            start_in_ms = int((deadline - now) * 1000 - estimate_ms)
+            if start_in_ms <= 0:
+                self._predecode(index, deadline)
+                continue
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.timeout.connect(lambda index=index, deadline=deadline: self._predecode(index, deadline))
+            timer.start(start_in_ms)
+            self._predecode_timers.append(timer)
+
+    def _estimate(self, index: int) -> float:
+        file_path = self._viewer.images[index]
+        return self.estimator.estimate(file_path, self._viewer.file_size(file_path))
+
+    def _predecode(self, index: int, deadline: float) -> None:
+        if not self.running or index >= len(self._viewer.images):
+            return
+        remaining_ms = (deadline - time.monotonic()) * 1000
+        estimate_ms = self._estimate(index) * SLIDESHOW_SAFETY_FACTOR
+        if estimate_ms > remaining_ms:
+            # 원본 품질이 늦을 것 같으면 빠른 렌디션을 먼저 만들어 두고 원본은 계속 진행
+            self._viewer.prefetch_index(index, draft=True)
+        self._viewer.prefetch_index(index)
+
+    def _on_deadline(self) -> None:
+        if not self.running or not self._viewer.images:
+            return
+        index = self._next_index()
+        quality = self._viewer.ready_quality(index)
+        if quality is None:
+            # 아무 렌디션도 없으면 보여줄 수 있게 될 때까지 이전 슬라이드를 유지한다
+            if self._late_since is None:
+                self._late_since = self._deadline
+            self._viewer.show_image(index)
+            return
+        if quality == "draft":
+            self.draft_slides += 1
+        self.slides_shown += 1
+        self._viewer.show_image(index)
+        self._arm(self._deadline)
+
+    def on_slide_displayed(self, index: int) -> None:
+        """뷰어가 이미지를 화면에 올렸을 때 호출: 늦게 도착한 슬라이드를 기록."""
+        if not self.running or self._late_since is None:
+            return
+        late_ms = (time.monotonic() - self._late_since) * 1000
+        self._late_since = None
+        self.slides_shown += 1
+        self.missed_count += 1
+        self.worst_late_ms = max(self.worst_late_ms, late_ms)
+        self.recent_missed.append((index, late_ms))
+        self.deadline_missed.emit(index, late_ms)
+        self._arm(time.monotonic())
+
+    def on_slide_failed(self, index: int) -> None:
+        """슬라이드를 열 수 없으면 멈추지 않고 다음 슬라이드로 넘어가도록 다시 예약."""
+        if not self.running:
+            return
+        self._late_since = None
+        self._arm(time.monotonic())
+
+    def summary(self) -> str:
+        if not self.missed_count:
+            return f"표시 {self.slides_shown}장, 저품질 대체 {self.draft_slides}장, 마감 놓침 없음"
+        return (
+            f"표시 {self.slides_shown}장, 저품질 대체 {self.draft_slides}장, "
+            f"마감 놓침 {self.missed_count}회 (최대 지연 {self.worst_late_ms:.0f}ms)"
+        )
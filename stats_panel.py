@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from typing import Callable, List, Optional
+
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QLabel, QWidget
+
+from constants import TELEMETRY_PANEL_REFRESH_MS
+
+PANEL_STYLE = (
+    "QLabel { background-color: rgba(0, 0, 0, 170); color: #ddd; border: 1px solid #333; "
+    "border-radius: 4px; padding: 6px 8px; font-family: monospace; font-size: 11px; }"
+)
+_MARGIN = 8
+
+
+class StatsPanel(QLabel):
+    """이미지 영역 왼쪽 위에 떠 있는 실시간 탐색 통계 패널.
+
+    보이는 동안만 TELEMETRY_PANEL_REFRESH_MS마다 lines_source를 불러 다시 그린다.
+    레이아웃에 넣지 않은 자식이라 이미지 크기 계산에 영향을 주지 않는다.
+    """
+
+    def __init__(self, lines_source: Callable[[], List[str]], parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self._lines_source = lines_source
+        self.setStyleSheet(PANEL_STYLE)
+        self.setMouseTracking(True)
+        self._timer = QTimer(self)
+        self._timer.setInterval(TELEMETRY_PANEL_REFRESH_MS)
+        self._timer.timeout.connect(self.refresh)
+        self.hide()
+
+    def toggle(self) -> None:
+        if self.isVisible():
+            self._timer.stop()
+            self.hide()
+            return
+        self.refresh()
+        self.show()
+        self.raise_()
+        self._timer.start()
+
+    def refresh(self) -> None:
+        self.setText("\n".join(self._lines_source()))
+        self.adjustSize()
+        self.move(_MARGIN, _MARGIN)
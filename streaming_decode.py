@@ -0,0 +1,377 @@
+from __future__ import annotations
+
+import io
+import struct
+import zlib
+from typing import BinaryIO, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+from PIL import BmpImagePlugin, Image, TiffImagePlugin
+
+from constants import STREAM_DECODE_BAND_MB
+
+# 이 모듈은 Qt에 의존하지 않는다 (디코더 프로세스에서도 쓴다).
+#
+# 30000x30000 PNG를 Image.open().copy()로 열면 원본 해상도 버퍼(약 3.6GB)를 먼저
+# 잡은 뒤에야 축소할 수 있고, Pillow의 압축 폭탄 검사에 막혀 아예 열리지 않기도
+# 한다. 행 단위로 디코딩되는 형식(PNG, 스트립 TIFF, 비압축 BMP)은 가로 띠 하나씩
+# 디코딩해 바로 정수 배 축소(reduce)하고 버리므로, 최대 메모리가 원본이 아니라
+# (축소 결과 + 띠 하나)에 비례한다.
+
+Source = Union[str, BinaryIO]
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_TIFF_SIGNATURES = (b"II*\x00", b"MM\x00*")
+
+# PNG 색 유형 → 채널 수
+_PNG_CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+# 필터 단위(바이트/픽셀) → 같은 바이트를 그대로 돌려주는 8비트 PNG 색 유형
+_PNG_RAW_VIEW_TYPES = {1: 0, 2: 4, 3: 2, 4: 6}
+# (색 유형, 비트 심도) → (Pillow 모드, raw 디코더 모드). 팔레트와 16비트 회색+알파는 따로 처리
+_PNG_RAW_MODES = {
+    (0, 1): ("1", "1"),
+    (0, 2): ("L", "L;2"),
+    (0, 4): ("L", "L;4"),
+    (0, 8): ("L", "L"),
+    (0, 16): ("I;16", "I;16B"),
+    (2, 8): ("RGB", "RGB"),
+    (4, 8): ("LA", "LA"),
+    (6, 8): ("RGBA", "RGBA"),
+}
+# 띠 TIFF를 만들 때 원본 IFD에서 옮겨 올 태그 (크기/스트립 위치 태그는 새로 쓴다)
+_TIFF_COPIED_TAGS = (256, 258, 259, 262, 266, 277, 284, 317, 320, 338, 339, 347, 529, 530, 532)
+_TIFF_IMAGE_LENGTH = 257
+_TIFF_STRIP_OFFSETS = 273
+_TIFF_ROWS_PER_STRIP = 278
+_TIFF_STRIP_BYTE_COUNTS = 279
+_TIFF_LONG = 4
+
+_BYTES_PER_PIXEL = {"1": 1, "L": 1, "P": 1, "LA": 2, "I;16": 2, "RGB": 3, "RGBA": 4, "CMYK": 4, "I": 4, "F": 4}
+
+
+def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", zlib.crc32(chunk_type + data))
+
+
+class _StreamSource:
+    width: int
+    height: int
+    mode: str
+    icc_profile: Optional[bytes] = None
+
+    @property
+    def decoded_bytes(self) -> int:
+        """원본 해상도로 통째로 디코딩했을 때의 버퍼 크기."""
+        return self.width * self.height * _BYTES_PER_PIXEL.get(self.mode, 4)
+
+    @property
+    def row_bytes(self) -> int:
+        return self.width * _BYTES_PER_PIXEL.get(self.mode, 4)
+
+    def bands(self, rows: int) -> Iterator[Image.Image]:
+        raise NotImplementedError
+
+
+class _PngSource(_StreamSource):
+    """PNG: IDAT 스트림을 이어서 풀고, 띠마다 작은 PNG를 만들어 Pillow로 필터를 되돌린다.
+
+    PNG 행 필터(Up/Average/Paeth)는 바로 윗행의 복원된 바이트를 참조한다. 그래서
+    띠 PNG의 첫 행에 이전 띠 마지막 행의 원시 바이트를 필터 없음(0)으로 넣는다.
+    그 원시 바이트를 얻기 위해 띠는 필터 단위가 같은 8비트 형식으로 선언해 디코딩한다.
+    그러면 결과 픽셀 바이트가 곧 원시 스캔라인이 된다.
+    """
+
+    def __init__(self, fp: BinaryIO):
+        self._fp = fp
+        self._palette: Optional[bytes] = None
+        self._transparency: Optional[bytes] = None
+        fp.seek(len(_PNG_SIGNATURE))
+        while True:
+            header = fp.read(8)
+            if len(header) < 8:
+                raise ValueError("IDAT 없음")
+            length, chunk_type = struct.unpack(">I4s", header)
+            if chunk_type == b"IDAT":
+                self._idat_position = fp.tell() - 8
+                break
+            data = fp.read(length)
+            fp.seek(4, io.SEEK_CUR)  # CRC
+            if chunk_type == b"IHDR":
+                self.width, self.height, self._depth, self._color_type, _, _, interlace = struct.unpack(">IIBBBBB", data)
+                if interlace:
+                    raise ValueError("인터레이스 PNG는 행 순서로 디코딩되지 않는다")
+            elif chunk_type == b"PLTE":
+                self._palette = data
+            elif chunk_type == b"tRNS":
+                self._transparency = data
+            elif chunk_type == b"iCCP":
+                name_end = data.index(b"\x00")
+                self.icc_profile = zlib.decompress(data[name_end + 2:])
+
+        bits_per_pixel = _PNG_CHANNELS[self._color_type] * self._depth
+        self._filter_unit = max(1, bits_per_pixel // 8)
+        if self._filter_unit not in _PNG_RAW_VIEW_TYPES:
+            raise ValueError("16비트 RGB/RGBA PNG는 원시 바이트 보기를 만들 수 없다")
+        self._scanline = (self.width * bits_per_pixel + 7) // 8
+        if self._color_type == 3:
+            self.mode = "RGBA" if self._transparency else "RGB"
+        elif (self._color_type, self._depth) == (4, 16):
+            self.mode = "LA"
+        else:
+            self.mode = _PNG_RAW_MODES[(self._color_type, self._depth)][0]
+
+    def _idat_payloads(self) -> Iterator[bytes]:
+        self._fp.seek(self._idat_position)
+        while True:
+            header = self._fp.read(8)
+            if len(header) < 8:
+                return
+            length, chunk_type = struct.unpack(">I4s", header)
+            if chunk_type == b"IEND":
+                return
+            data = self._fp.read(length)
+            self._fp.seek(4, io.SEEK_CUR)
+            if chunk_type == b"IDAT":
+                yield data
+
+    def bands(self, rows: int) -> Iterator[Image.Image]:
+        stride = self._scanline + 1  # 행마다 필터 유형 바이트 하나
+        band_bytes = rows * stride
+        inflater = zlib.decompressobj()
+        buffer = bytearray()
+        previous_row: Optional[bytes] = None
+        for payload in self._idat_payloads():
+            pending = payload
+            while pending:
+                # 압축률이 극단적인 IDAT 하나가 수 GB로 풀리지 않도록 띠 크기만큼만 푼다
+                buffer += inflater.decompress(pending, band_bytes - len(buffer))
+                pending = inflater.unconsumed_tail
+                if len(buffer) >= band_bytes:
+                    band, previous_row = self._decode_band(bytes(buffer[:band_bytes]), rows, previous_row)
+                    del buffer[:band_bytes]
+                    yield band
+        buffer += inflater.flush()
+        remaining = len(buffer) // stride
+        if remaining:
+            band, _ = self._decode_band(bytes(buffer[:remaining * stride]), remaining, previous_row)
+            yield band
+
+    def _decode_band(self, filtered: bytes, rows: int, previous_row: Optional[bytes]) -> Tuple[Image.Image, bytes]:
+        if previous_row is not None:
+            filtered = b"\x00" + previous_row + filtered
+        view_rows = rows + (previous_row is not None)
+        view_width = self._scanline // self._filter_unit
+        header = struct.pack(">IIBBBBB", view_width, view_rows, 8, _PNG_RAW_VIEW_TYPES[self._filter_unit], 0, 0, 0)
+        view_png = (
+            _PNG_SIGNATURE + _png_chunk(b"IHDR", header)
+            + _png_chunk(b"IDAT", zlib.compress(filtered, 0)) + _png_chunk(b"IEND", b"")
+        )
+        with Image.open(io.BytesIO(view_png)) as view:
+            raw = view.tobytes()
+        if previous_row is not None:
+            raw = raw[self._scanline:]
+        return self._from_raw(raw, rows), raw[-self._scanline:]
+
+    def _from_raw(self, raw: bytes, rows: int) -> Image.Image:
+        size = (self.width, rows)
+        if self._color_type == 3:
+            band = Image.frombytes("P", size, raw, "raw", "P" if self._depth == 8 else f"P;{self._depth}", self._scanline)
+            if self._transparency:
+                alpha = self._transparency.ljust(len(self._palette) // 3, b"\xff")
+                rgba = bytes(
+                    value for index in range(len(self._palette) // 3)
+                    for value in (*self._palette[index * 3:index * 3 + 3], alpha[index])
+                )
+                band.putpalette(rgba, "RGBA")
+                return band.convert("RGBA")
+            band.putpalette(self._palette)
+            return band.convert("RGB")
+        if (self._color_type, self._depth) == (4, 16):
+            # Pillow에 16비트 회색+알파 raw 모드가 없어 상위 바이트만 취한다 (Pillow의 PNG 디코딩과 같은 결과)
+            pixels = (np.frombuffer(raw, dtype=">u2").reshape(rows, self.width, 2) >> 8).astype(np.uint8)
+            return Image.fromarray(pixels, "LA")
+        mode, raw_mode = _PNG_RAW_MODES[(self._color_type, self._depth)]
+        return Image.frombytes(mode, size, raw, "raw", raw_mode, self._scanline)
+
+
+class _TiffSource(_StreamSource):
+    """스트립 TIFF: 연속한 스트립 몇 개씩을 원래 압축 그대로 작은 TIFF로 다시 감싸 디코딩.
+
+    스트립은 서로 독립적으로 압축돼 있으므로 압축 방식(LZW, Deflate, PackBits, JPEG
+    등)과 상관없이 띠 단위로 잘라 읽을 수 있다.
+    """
+
+    def __init__(self, fp: BinaryIO):
+        self._fp = fp
+        fp.seek(0)
+        image = TiffImagePlugin.TiffImageFile(fp)  # Image.open을 거치지 않아 압축 폭탄 검사 없이 헤더만 읽는다
+        tags = image.tag_v2
+        if 322 in tags or tags.get(284, 1) != 1 or _TIFF_STRIP_OFFSETS not in tags:
+            raise ValueError("타일 TIFF나 평면 분리 TIFF는 스트립 순서로 읽을 수 없다")
+        self.width, self.height = image.size
+        self.mode = image.mode
+        self.icc_profile = image.info.get("icc_profile")
+        self._tags = tags
+        self._rows_per_strip = min(int(tags.get(_TIFF_ROWS_PER_STRIP, self.height)), self.height)
+        self._offsets = list(tags[_TIFF_STRIP_OFFSETS])
+        self._byte_counts = list(tags[_TIFF_STRIP_BYTE_COUNTS])
+
+    def bands(self, rows: int) -> Iterator[Image.Image]:
+        strips_per_band = max(1, rows // self._rows_per_strip)
+        for first in range(0, len(self._offsets), strips_per_band):
+            indices = range(first, min(first + strips_per_band, len(self._offsets)))
+            band_rows = min(len(indices) * self._rows_per_strip, self.height - first * self._rows_per_strip)
+            if band_rows <= 0:
+                return
+            strips: List[bytes] = []
+            for index in indices:
+                self._fp.seek(self._offsets[index])
+                strips.append(self._fp.read(self._byte_counts[index]))
+            with Image.open(io.BytesIO(self._band_file(strips, band_rows))) as band:
+                band.load()
+                yield band.copy()
+
+    def _band_file(self, strips: List[bytes], rows: int) -> bytes:
+        prefix = self._tags.prefix
+        ifd = TiffImagePlugin.ImageFileDirectory_v2(prefix=prefix)
+        for tag in _TIFF_COPIED_TAGS:
+            if tag in self._tags:
+                ifd[tag] = self._tags[tag]
+                ifd.tagtype[tag] = self._tags.tagtype[tag]
+        ifd[_TIFF_IMAGE_LENGTH] = rows
+        ifd[_TIFF_ROWS_PER_STRIP] = self._rows_per_strip
+        ifd[_TIFF_STRIP_BYTE_COUNTS] = tuple(len(strip) for strip in strips)
+        ifd.tagtype[_TIFF_STRIP_BYTE_COUNTS] = _TIFF_LONG
+        ifd.tagtype[_TIFF_STRIP_OFFSETS] = _TIFF_LONG
+        endian = "<" if prefix == b"II" else ">"
+        header = prefix + struct.pack(f"{endian}HI", 42, 8)
+        # Pillow은 StripOffsets를 IFD(와 보조 데이터) 끝을 기준으로 한 상대 위치로 보고
+        # 쓸 때 IFD 끝 위치를 더해 준다: 스트립은 IFD 바로 뒤에 이어 붙인다
+        offsets, position = [], 0
+        for strip in strips:
+            offsets.append(position)
+            position += len(strip)
+        ifd[_TIFF_STRIP_OFFSETS] = tuple(offsets)
+        return header + ifd.tobytes(len(header)) + b"".join(strips)
+
+
+class _BmpSource(_StreamSource):
+    """비압축 BMP: 행 바이트 위치를 계산할 수 있으므로 띠마다 해당 행만 읽는다."""
+
+    def __init__(self, fp: BinaryIO):
+        self._fp = fp
+        fp.seek(0)
+        image = BmpImagePlugin.BmpImageFile(fp)
+        if len(image.tile) != 1 or image.tile[0][0] != "raw":
+            raise ValueError("RLE 압축 BMP는 행 위치를 계산할 수 없다")
+        self.width, self.height = image.size
+        self.mode = image.mode
+        _, _, self._offset, (self._raw_mode, self._stride, self._direction) = image.tile[0]
+
+    def bands(self, rows: int) -> Iterator[Image.Image]:
+        for top in range(0, self.height, rows):
+            band_rows = min(rows, self.height - top)
+            # 아래에서 위로 저장된 BMP(direction -1)는 파일 뒤쪽부터 화면 위쪽 행이다
+            first_file_row = top if self._direction == 1 else self.height - top - band_rows
+            self._fp.seek(0)
+            band = BmpImagePlugin.BmpImageFile(self._fp)
+            band._size = (self.width, band_rows)
+            band.tile = [
+                ("raw", (0, 0, self.width, band_rows), self._offset + first_file_row * self._stride,
+                 (self._raw_mode, self._stride, self._direction))
+            ]
+            band.load()
+            yield band
+
+
+def open_stream_source(source: Source) -> Optional[_StreamSource]:
+    """행 순서로 디코딩할 수 있는 형식이면 헤더만 읽은 스트림 소스를, 아니면 None."""
+    fp = open(source, "rb") if isinstance(source, str) else source
+    try:
+        fp.seek(0)
+        magic = fp.read(8)
+        if magic.startswith(_PNG_SIGNATURE):
+            return _PngSource(fp)
+        if magic[:4] in _TIFF_SIGNATURES:
+            return _TiffSource(fp)
+        if magic.startswith(b"BM"):
+            return _BmpSource(fp)
+    except (OSError, ValueError, KeyError, SyntaxError, struct.error, zlib.error):
+        pass  # 지원하지 않는 변형이거나 손상된 헤더: 일반 디코딩 경로에 맡긴다
+    if fp is not source:
+        fp.close()
+    return None
+
+
+def _normalize_band(band: Image.Image) -> Image.Image:
+    """reduce가 처리할 수 있는 모드로 맞춘다 (rendering.prepare_for_resize와 같은 규칙)."""
+    if band.mode == "1":
+        return band.convert("L")
+    if band.mode in ("I;16", "I;16B", "I;16L"):
+        return band.convert("I")
+    if band.mode == "P":
+        return band.convert("RGBA" if "transparency" in band.info else "RGB")
+    return band
+
+
+def decode_downscaled(
+    source: Source, target_size: Tuple[int, int], memory_limit_bytes: int
+) -> Optional[Image.Image]:
+    """원본 전체 디코딩이 memory_limit_bytes를 넘는 큰 이미지를 띠 단위로 축소 디코딩.
+
+    결과는 target_size의 약 2배 이상 크기로 정수 배 축소된 이미지라, 평소처럼
+    render_image로 마무리 리샘플링하면 된다. 원본 해상도가 아니므로 원본 캐시에
+    넣으면 안 된다. 작은 이미지이거나 지원하지 않는 형식이면 None.
+    """
+    stream = open_stream_source(source)
+    if stream is None:
+        return None
+    try:
+        if stream.decoded_bytes <= memory_limit_bytes:
+            return None
+        box_width, box_height = target_size
+        ratio = min(stream.width / max(1, box_width), stream.height / max(1, box_height))
+        # 마지막 LANCZOS가 쓸 여유를 남기도록 목표의 약 2배 크기까지만 정수 배로 줄인다
+        factor = max(1, int(ratio / 2))
+        if factor == 1:
+            return None  # 줄일 수 없으면 결과가 원본만큼 커서 띠 디코딩의 이득이 없다
+        band_rows = max(factor, int(STREAM_DECODE_BAND_MB * 1024 * 1024 // max(1, stream.row_bytes)) // factor * factor)
+
+        output: Optional[Image.Image] = None
+        carry: Optional[Image.Image] = None
+        y = 0
+        for band in stream.bands(band_rows):
+            band = _normalize_band(band)
+            if carry is not None:
+                # 이전 띠에서 factor 배수로 떨어지지 않고 남은 행을 앞에 붙인다
+                joined = Image.new(band.mode, (band.width, carry.height + band.height))
+                joined.paste(carry, (0, 0))
+                joined.paste(band, (0, carry.height))
+                band = joined
+            usable = band.height // factor * factor
+            carry = band.crop((0, usable, band.width, band.height)) if usable < band.height else None
+            if not usable:
+                continue
+            reduced = band.crop((0, 0, band.width, usable)).reduce(factor)
+            if output is None:
+                output = Image.new(reduced.mode, (reduced.width, -(-stream.height // factor)))
+            output.paste(reduced, (0, y))
+            y += reduced.height
+        if carry is not None:
+            reduced = carry.reduce(factor)
+            if output is None:
+                output = Image.new(reduced.mode, (reduced.width, -(-stream.height // factor)))
+            output.paste(reduced, (0, y))
+            y += reduced.height
+        if output is None or y == 0:
+            return None
+        if y < output.height:
+            output = output.crop((0, 0, output.width, y))  # 잘린 파일: 읽은 만큼만
+        if stream.icc_profile:
+            output.info["icc_profile"] = stream.icc_profile
+        return output
+    except (OSError, ValueError, SyntaxError, struct.error, zlib.error):
+        return None  # 손상된 데이터: 일반 디코딩 경로가 같은 오류를 알맞게 보고한다
+    finally:
+        if isinstance(source, str):
+            stream._fp.close()
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import glob
+import json
+import math
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+from constants import TELEMETRY_KEEP_FILES, TELEMETRY_LATENCY_SAMPLES
+
+# 이 모듈은 Qt에 의존하지 않는다.
+
+_PERCENTILES = (50, 90, 99)
+# 계층 키(JSON에 그대로 저장) → 패널 표시 이름
+_TIER_LABELS = {"pixmap": "픽스맵", "rendition": "리사이즈 캐시", "raw": "원본 캐시", "bytes": "파일 바이트"}
+
+
+def percentile(sorted_values: List[float], percent: float) -> float:
+    """최근접 순위 백분위수 (sorted_values는 오름차순, 비어 있지 않아야 한다)."""
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class Telemetry:
+    """캐시가 실제로 탐색을 빠르게 하는지 보여 주는 세션 통계.
+
+    - 계층별 적중/실패: 픽스맵·리사이즈 계층은 창이, 원본·파일 바이트 계층은 각 캐시가 센다
+      (tier_counts로 합쳐 넘겨받는다)
+    - 프리페치 효용: 미리 만든 렌디션이 표시되었는지, 한 번도 쓰이지 않고 밀려났는지
+    - 탐색 지연: 이동 요청부터 첫 렌디션이 화면에 나올 때까지, 형식별 백분위수
+    - 계층별 최대 사용량: MAX_CACHE_SIZE/MAX_MEMORY_MB 같은 예산을 정할 근거
+    - 슬라이드쇼 마감 놓침: 렌디션이 제때 준비되지 않아 늦게 넘어간 슬라이드와 그 지연
+
+    종료할 때 dump로 JSON 한 파일에 남긴다. GUI 스레드와 워커 스레드가 함께 쓴다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started = time.time()
+        self._tiers: Dict[str, List[int]] = {}
+        self._pending_prefetches: Set[str] = set()
+        self.prefetch_stored = 0
+        self.prefetch_shown = 0
+        self.prefetch_evicted = 0
+        self._latency: Dict[str, Deque[float]] = {}
+        self.navigations = 0
+        self._peak_usage: Dict[str, Tuple[int, Optional[int]]] = {}
+        self._slideshow_late: Deque[Tuple[str, float]] = deque(maxlen=TELEMETRY_LATENCY_SAMPLES)
+        self.slideshow_missed = 0
+
+    # ------------------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------------------
+    def lookup(self, tier: str, hit: bool) -> None:
+        with self._lock:
+            counts = self._tiers.setdefault(tier, [0, 0])
+            counts[0 if hit else 1] += 1
+
+    def on_prefetch_stored(self, cache_key: str) -> None:
+        with self._lock:
+            if cache_key not in self._pending_prefetches:
+                self._pending_prefetches.add(cache_key)
+                self.prefetch_stored += 1
+
+    def on_rendition_shown(self, cache_key: str) -> None:
+        with self._lock:
+            if cache_key in self._pending_prefetches:
+                self._pending_prefetches.discard(cache_key)
+                self.prefetch_shown += 1
+
+    def on_rendition_evicted(self, cache_key: str) -> None:
+        with self._lock:
+            if cache_key in self._pending_prefetches:
+                self._pending_prefetches.discard(cache_key)
+                self.prefetch_evicted += 1
+
+    def forget_prefetches(self) -> None:
+        """캐시를 통째로 비웠을 때: 남은 프리페치는 쓰였는지 알 수 없으므로 어느 쪽에도 세지 않는다."""
+        with self._lock:
+            self._pending_prefetches.clear()
+
+    def on_navigation(self, image_format: str, latency_ms: float) -> None:
+        with self._lock:
+            self.navigations += 1
+            samples = self._latency.setdefault(image_format, deque(maxlen=TELEMETRY_LATENCY_SAMPLES))
+            samples.append(latency_ms)
+
+    def on_slideshow_late(self, file_path: str, late_ms: float) -> None:
+        with self._lock:
+            self.slideshow_missed += 1
+            self._slideshow_late.append((file_path, late_ms))
+
+    def observe_usage(self, tiers: Dict[str, Tuple[int, Optional[int]]]) -> None:
+        """계층별 (사용 바이트, 예산 바이트) 스냅샷에서 최대 사용량을 갱신."""
+        with self._lock:
+            for name, (used, budget) in tiers.items():
+                peak = self._peak_usage.get(name)
+                if peak is None or used > peak[0]:
+                    self._peak_usage[name] = (used, budget)
+
+    # ------------------------------------------------------------------
+    # 보고
+    # ------------------------------------------------------------------
+    def snapshot(self, tier_counts: Optional[Dict[str, Tuple[int, int]]] = None) -> Dict[str, Any]:
+        """지금까지의 통계. tier_counts는 캐시가 직접 센 (적중, 실패)를 계층 이름별로 더한다."""
+        with self._lock:
+            tiers = {name: tuple(counts) for name, counts in self._tiers.items()}
+            tiers.update(tier_counts or {})
+            latency = {
+                image_format: sorted(samples) for image_format, samples in self._latency.items() if samples
+            }
+            late = sorted(late_ms for _, late_ms in self._slideshow_late)
+            worst = max(self._slideshow_late, key=lambda item: item[1], default=None)
+            data: Dict[str, Any] = {
+                "started": self.started,
+                "duration_s": round(time.time() - self.started, 1),
+                "navigations": self.navigations,
+                "tiers": {
+                    name: {
+                        "hits": hits,
+                        "misses": misses,
+                        "hit_ratio": round(hits / (hits + misses), 4) if hits + misses else None,
+                    }
+                    for name, (hits, misses) in tiers.items()
+                },
+                "prefetch": {
+                    "stored": self.prefetch_stored,
+                    "shown": self.prefetch_shown,
+                    "evicted_unused": self.prefetch_evicted,
+                    "pending": len(self._pending_prefetches),
+                },
+                "latency_ms": {
+                    image_format: {
+                        "count": len(samples),
+                        **{f"p{percent}": round(percentile(samples, percent), 1) for percent in _PERCENTILES},
+                    }
+                    for image_format, samples in latency.items()
+                },
+                "slideshow": {
+                    "missed": self.slideshow_missed,
+                    "late_ms": {f"p{percent}": round(percentile(late, percent), 1) for percent in _PERCENTILES}
+                    if late else {},
+                    "worst": None if worst is None else {"file": worst[0], "late_ms": round(worst[1], 1)},
+                },
+                "peak_usage_mb": {
+                    name: {
+                        "used": round(used / 1024 / 1024, 1),
+                        "budget": None if budget is None else round(budget / 1024 / 1024, 1),
+                    }
+                    for name, (used, budget) in self._peak_usage.items()
+                },
+            }
+        return data
+
+    @staticmethod
+    def format_lines(data: Dict[str, Any]) -> List[str]:
+        """snapshot 결과를 통계 패널/메모리 정보 창에 보일 줄 목록으로."""
+        lines = [f"탐색 {data['navigations']}회 ({data['duration_s']:.0f}초)"]
+        for name, tier in data["tiers"].items():
+            ratio = "-" if tier["hit_ratio"] is None else f"{tier['hit_ratio'] * 100:.0f}%"
+            label = _TIER_LABELS.get(name, name)
+            lines.append(f"{label}: 적중 {ratio} ({tier['hits']}/{tier['hits'] + tier['misses']})")
+        prefetch = data["prefetch"]
+        lines.append(
+            f"프리페치: {prefetch['stored']}개 중 표시 {prefetch['shown']}, "
+            f"쓰이지 않고 밀려남 {prefetch['evicted_unused']}, 대기 {prefetch['pending']}"
+        )
+        for image_format, latency in sorted(data["latency_ms"].items()):
+            lines.append(
+                f"{image_format} 지연: p50 {latency['p50']:.0f}ms, p90 {latency['p90']:.0f}ms, "
+                f"p99 {latency['p99']:.0f}ms ({latency['count']}회)"
+            )
+        slideshow = data["slideshow"]
+        if slideshow["missed"]:
+            worst = slideshow["worst"]
+            lines.append(
+                f"슬라이드쇼 마감 놓침 {slideshow['missed']}회: p50 {slideshow['late_ms']['p50']:.0f}ms, "
+                f"최대 {worst['late_ms']:.0f}ms ({os.path.basename(worst['file'])})"
+            )
+        return lines
+
+    def dump(self, directory: str, data: Dict[str, Any], config: Dict[str, Any]) -> Optional[str]:
+        """세션 통계를 directory에 JSON 한 파일로 저장하고 오래된 파일은 TELEMETRY_KEEP_FILES개만 남긴다."""
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(self.started))
+        path = os.path.join(directory, f"session-{stamp}.json")
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({**data, "config": config}, f, ensure_ascii=False, indent=1)
+            for old in sorted(glob.glob(os.path.join(directory, "session-*.json")))[:-TELEMETRY_KEEP_FILES]:
+                os.remove(old)
+        except OSError:
+            return None  # 통계 저장 실패로 종료를 막지 않는다
+        return path
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+
+# Qt를 불러오기 전에: 화면 없이 실행하고, 세션/캐시 파일은 사용자 폴더 대신 임시 폴더에 쓴다
+os.environ["QT_QPA_PLATFORM"] = "offscreen"
+_SANDBOX = tempfile.mkdtemp(prefix="imageviewer-tests-")
+os.environ["XDG_CONFIG_HOME"] = os.path.join(_SANDBOX, "config")
+os.environ["XDG_CACHE_HOME"] = os.path.join(_SANDBOX, "cache")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    app = QApplication.instance() or QApplication([])
+    yield app
+
+
+class _RecordingPool:
+    """창의 렌더링 풀 대신: 작업을 실행하지 않고 쌓아 두기만 한다 (결과는 테스트가 직접 전달).
+
+    워커 스레드에서 신호를 보내지 않으므로 창의 결과 처리 순서를 테스트가 정할 수 있다.
+    """
+
+    def __init__(self):
+        self.started = []
+        self.queued = set()
+
+    def start(self, task, priority=0):
+        self.started.append((task, priority))
+        self.queued.add(task)
+
+    def tryTake(self, task):
+        if task not in self.queued:
+            return False
+        self.queued.discard(task)
+        return True
+
+
+@pytest.fixture
+def recording_window(qapp, tmp_path, monkeypatch):
+    """PNG 6장이 든 폴더를 연 창. 렌더링 작업은 _RecordingPool에 쌓이기만 한다."""
+    import image_viewer_window
+    from PIL import Image
+
+    for index in range(6):
+        Image.new("RGB", (640, 480), (index * 40, 0, 0)).save(tmp_path / f"{index}.png")
+    monkeypatch.setattr(image_viewer_window.QMessageBox, "critical", staticmethod(lambda *args: None))
+    window = image_viewer_window.ImageViewerWindow()
+    window.resize(800, 600)
+    window.thread_pool = _RecordingPool()
+    window.open_file(str(tmp_path / "0.png"))
+    deadline = time.monotonic() + 10
+    while len(window.images) < 6 and time.monotonic() < deadline:
+        qapp.processEvents()
+    yield window
+    window.close()
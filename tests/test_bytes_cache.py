@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import random
+
+from image_cache import BytesCache
+
+_MB = 1024 * 1024
+
+
+def _signature(data: bytes, mtime: float = 1.0):
+    return (mtime, len(data))
+
+
+def _stored_bytes(cache: BytesCache) -> int:
+    return round(cache.get_stats()["memory_usage_mb"] * _MB)
+
+
+def test_usage_never_exceeds_byte_budget():
+    cache = BytesCache(max_size=1000, max_memory_mb=1)
+    rng = random.Random(0)
+    for step in range(2000):
+        path = f"/images/{rng.randrange(64)}.jpg"
+        data = bytes(rng.randrange(1, cache.max_entry_bytes + 1))
+        cache.put(path, _signature(data, step), data)
+        assert _stored_bytes(cache) <= cache.max_memory_mb * _MB
+        assert cache.contains(path, _signature(data, step))  # 방금 넣은 항목은 밀려나지 않는다
+
+
+def test_entry_count_limit_evicts_least_recently_used():
+    cache = BytesCache(max_size=3, max_memory_mb=1)
+    for name in "abc":
+        cache.put(name, (1.0, 1), b"x")
+    assert cache.get("a", (1.0, 1)) == b"x"  # a가 가장 최근에 쓰인 항목이 된다
+    cache.put("d", (1.0, 1), b"x")
+    assert cache.get_stats()["size"] == 3
+    assert not cache.contains("b", (1.0, 1))
+    assert all(cache.contains(name, (1.0, 1)) for name in "acd")
+
+
+def test_oversized_entries_are_rejected():
+    cache = BytesCache(max_size=10, max_memory_mb=1)
+    cache.put("small", (1.0, 10), bytes(10))
+    oversized = bytes(cache.max_entry_bytes + 1)
+    cache.put("big", _signature(oversized), oversized)
+    assert not cache.contains("big", _signature(oversized))
+    assert cache.contains("small", (1.0, 10))  # 거절된 항목 때문에 다른 항목이 밀려나지 않는다
+    # 서명은 작은 파일이라고 해도 실제 바이트가 예산을 넘으면 넣지 않는다
+    cache.put("stale", (1.0, 10), oversized)
+    assert not cache.contains("stale", (1.0, 10))
+    assert _stored_bytes(cache) == 10
+
+
+def test_oversized_file_is_loaded_but_not_cached(tmp_path):
+    cache = BytesCache(max_size=10, max_memory_mb=1)
+    path = tmp_path / "big.png"
+    data = bytes(cache.max_entry_bytes + 1)
+    path.write_bytes(data)
+    assert cache.load(str(path), _signature(data)) == data
+    assert not cache.contains(str(path), _signature(data))
+    assert cache.get_stats()["size"] == 0
+
+
+def test_changed_file_signature_drops_stale_bytes():
+    cache = BytesCache(max_size=10, max_memory_mb=1)
+    cache.put("a.jpg", (1.0, 4), b"old!")
+    assert cache.get("a.jpg", (2.0, 4)) is None
+    assert cache.get_stats()["size"] == 0
+    assert _stored_bytes(cache) == 0
@@ -0,0 +1,134 @@
+"""긴 탐색 세션을 재생하면서 상주 메모리 증가가 캐시 계층 예산 안에 머무는지 확인.
+
+여러 픽셀 모드(L/RGB/RGBA/I;16/CMYK/F)와 크기의 합성 이미지를 만들어 다음/이전
+이미지로 수백 번 오간 뒤, RSS 증가가 "모든 계층 예산 합 + MEMORY_AUDIT_OVERHEAD_MB"
+이하인지, tracemalloc으로 본 파이썬 할당 증가가 파일 바이트 캐시 + 고정 여유 이하인지
+검사한다. 계층별 사용량은 출력해 둔다 (pytest -s로 확인).
+"""
+
+from __future__ import annotations
+
+import random
+import time
+import tracemalloc
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from constants import MEMORY_AUDIT_OVERHEAD_MB
+from memory_audit import MemoryAudit, resident_bytes
+
+NAVIGATION_STEPS = 300
+STEP_TIMEOUT_S = 20
+PYTHON_GROWTH_OVERHEAD_MB = 32  # 파일 바이트 캐시 밖에서 허용할 파이썬 할당 증가 (서명/색인/통계 등)
+SIZES = ((640, 480), (1920, 1280), (4000, 3000))
+_MB = 1024 * 1024
+
+
+def _gradient(width: int, height: int, seed: int) -> np.ndarray:
+    """0~1 실수 배열: 압축이 너무 잘 되지 않도록 그라데이션에 약한 잡음을 섞는다."""
+    rng = np.random.default_rng(seed)
+    x = np.linspace(0.0, 1.0, width, dtype=np.float32)[None, :]
+    y = np.linspace(0.0, 1.0, height, dtype=np.float32)[:, None]
+    noise = rng.random((height, width), dtype=np.float32) * 0.1
+    return np.clip((x + y) / 2 + noise, 0.0, 1.0)
+
+
+def _make_image(mode: str, width: int, height: int, seed: int) -> Image.Image:
+    base = _gradient(width, height, seed)
+    if mode == "L":
+        return Image.fromarray((base * 255).astype(np.uint8), "L")
+    if mode in ("RGB", "RGBA", "CMYK"):
+        channels = [(np.roll(base, shift, axis=1) * 255).astype(np.uint8) for shift in range(0, len(mode) * 97, 97)]
+        return Image.fromarray(np.stack(channels, axis=-1), mode)
+    if mode == "I;16":
+        return Image.fromarray((base * 65535).astype(np.uint16))  # uint16 → I;16
+    if mode == "F":
+        return Image.fromarray(base * 4.0, "F")  # HDR처럼 1을 넘는 값
+    raise ValueError(mode)
+
+
+# 모드별 저장 형식: 각 모드를 실제로 담을 수 있는 형식
+_FORMATS = {"L": "jpg", "RGB": "jpg", "RGBA": "png", "I;16": "png", "CMYK": "jpg", "F": "tif"}
+
+
+@pytest.fixture(scope="module")
+def image_folder(tmp_path_factory):
+    folder = tmp_path_factory.mktemp("memory-bounds")
+    seed = 0
+    for width, height in SIZES:
+        for mode, extension in _FORMATS.items():
+            seed += 1
+            name = f"{seed:02d}_{mode.replace(';', '')}_{width}x{height}.{extension}"
+            _make_image(mode, width, height, seed).save(folder / name)
+    return folder
+
+
+def _wait_displayed(app, window) -> None:
+    deadline = time.monotonic() + STEP_TIMEOUT_S
+    target = window.images[window.current_index]
+    while window.current_path != target:
+        if time.monotonic() > deadline:
+            pytest.fail(f"{target}이(가) {STEP_TIMEOUT_S}초 안에 표시되지 않음")
+        app.processEvents()
+        time.sleep(0.002)
+
+
+def test_navigation_memory_stays_within_tier_budgets(qapp, image_folder, monkeypatch):
+    if resident_bytes() is None:
+        pytest.skip("이 플랫폼에서는 RSS를 측정할 수 없음")
+    import image_viewer_window
+
+    errors = []
+    monkeypatch.setattr(image_viewer_window.QMessageBox, "critical", staticmethod(lambda *args: errors.append(args[2])))
+    window = image_viewer_window.ImageViewerWindow()
+    window.resize(1000, 700)
+    window.show()
+    qapp.processEvents()
+    try:
+        audit = MemoryAudit()  # 창과 Qt가 준비된 뒤의 RSS가 기준
+        tracemalloc.start()
+        traced_before = tracemalloc.take_snapshot()
+
+        first = sorted(image_folder.iterdir())[0]
+        window.open_file(str(first))
+        _wait_displayed(qapp, window)
+        rng = random.Random(0)
+        for _ in range(NAVIGATION_STEPS):
+            at_end = window.current_index == len(window.images) - 1
+            if window.current_index == 0 or (not at_end and rng.random() < 0.7):
+                window.show_next_image()
+            else:
+                window.show_previous_image()
+            _wait_displayed(qapp, window)
+        # 남은 프리페치가 끝나 캐시가 가장 찬 상태에서 잰다
+        end = time.monotonic() + 2
+        while time.monotonic() < end:
+            qapp.processEvents()
+            time.sleep(0.01)
+
+        traced_after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        tiers = window._memory_tiers()
+        within = audit.sample(tiers)
+        for line in audit.report():
+            print(line)
+        assert not errors, errors
+        assert within, (
+            f"RSS 증가 {(audit.last_rss - audit.baseline) / _MB:.1f}MB > "
+            f"예산 합 + {MEMORY_AUDIT_OVERHEAD_MB}MB = {audit.allowed_bytes() / _MB:.1f}MB"
+        )
+
+        growth = traced_after.compare_to(traced_before, "lineno")
+        for stat in growth[:5]:
+            print(f"파이썬 할당 증가: {stat}")
+        python_growth = sum(stat.size_diff for stat in growth if stat.size_diff > 0)
+        bytes_used, _ = tiers["파일 바이트 캐시"]
+        limit = bytes_used + PYTHON_GROWTH_OVERHEAD_MB * _MB
+        assert python_growth <= limit, f"파이썬 할당 증가 {python_growth / _MB:.1f}MB > {limit / _MB:.1f}MB"
+    finally:
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        window.close()
+        qapp.processEvents()
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import gc
+
+import pytest
+from PIL import Image
+from PySide6.QtGui import QImage
+
+from process_decoder import ProcessDecoder
+
+_FORMATS = {"RGB": QImage.Format.Format_RGB888, "RGBA": QImage.Format.Format_RGBA8888, "L": QImage.Format.Format_Grayscale8}
+
+
+@pytest.fixture(scope="module")
+def decoder():
+    decoder = ProcessDecoder(max_workers=1)
+    yield decoder
+    decoder.shutdown()
+
+
+def _wrap(rendition) -> QImage:
+    # _ImageLoadTask._render_in_process와 같은 방식: 공유 메모리를 복사 없이 감싼다
+    return QImage(rendition.buffer, rendition.width, rendition.height, rendition.bytes_per_line, _FORMATS[rendition.mode])
+
+
+def test_shared_block_closes_only_after_wrapping_qimage_is_gone(tmp_path, decoder):
+    path = tmp_path / "red.png"
+    Image.new("RGB", (64, 48), (255, 0, 0)).save(path)
+
+    rendition = decoder.render(str(path), (32, 32))
+    qimage = _wrap(rendition)
+    decoder.retire(rendition)
+    decoder.release_unused()
+    assert decoder.holds_shared_memory()
+    assert qimage.pixelColor(0, 0).red() == 255
+
+    # 캐시가 복사본만 남기면 (프로세스 디코딩을 끌 때처럼) 블록을 닫을 수 있다
+    copied = qimage.copy()
+    del qimage, rendition
+    gc.collect()
+    decoder.release_unused()
+    assert not decoder.holds_shared_memory()
+    assert copied.pixelColor(0, 0).red() == 255
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+import signature_cache
+from constants import SIGNATURE_TTL_S
+from signature_cache import SignatureCache
+
+NOTIFY_TIMEOUT_S = SIGNATURE_TTL_S / 2  # 유효 시간이 지나 다시 stat한 덕분에 통과하지 않도록
+
+
+def _overwrite_in_place(path, data: bytes) -> None:
+    with open(path, "r+b") as f:
+        f.write(data)
+
+
+def _truncate_and_rewrite(path, data: bytes) -> None:
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+@pytest.mark.parametrize("edit", [_overwrite_in_place, _truncate_and_rewrite])
+def test_in_place_edit_of_watched_file_invalidates_signature(qapp, tmp_path, edit):
+    path = tmp_path / "photo.png"
+    path.write_bytes(b"a" * 100)
+    cache = SignatureCache()
+    cache.watch([str(tmp_path)])
+    cache.watch_files([str(path)])
+    old = cache.get(str(path))
+    assert cache.get(str(path)) == old and cache.stat_calls == 1
+
+    edit(path, b"b" * 120)  # 폴더 변경 알림은 오지 않는 저장 방식
+    signature = old
+    deadline = time.monotonic() + NOTIFY_TIMEOUT_S
+    while signature == old and time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.01)
+        signature = cache.get(str(path))
+    assert signature != old
+
+
+def test_unwatched_file_signature_expires_quickly(qapp, tmp_path, monkeypatch):
+    path = tmp_path / "photo.png"
+    path.write_bytes(b"a" * 100)
+    cache = SignatureCache()
+    cache.watch([str(tmp_path)])  # 폴더만 감시: 제자리 수정은 알림이 오지 않는다
+    now = [1000.0]
+    monkeypatch.setattr(signature_cache.time, "monotonic", lambda: now[0])
+    cache.get(str(path))
+    now[0] += SIGNATURE_TTL_S + 0.1
+    cache.get(str(path))
+    assert cache.stat_calls == 2
+
+
+def test_file_leaving_watch_window_falls_back_to_short_ttl(qapp, tmp_path, monkeypatch):
+    path = tmp_path / "photo.png"
+    path.write_bytes(b"a" * 100)
+    cache = SignatureCache()
+    cache.watch([str(tmp_path)])
+    cache.watch_files([str(path)])
+    now = [1000.0]
+    monkeypatch.setattr(signature_cache.time, "monotonic", lambda: now[0])
+    cache.get(str(path))
+    cache.watch_files([])
+    now[0] += SIGNATURE_TTL_S + 0.1
+    cache.get(str(path))
+    assert cache.stat_calls == 2
@@ -0,0 +1,182 @@
+"""같은 키의 동시 요청이 디코딩/렌더링을 한 번만 하는지 (single-flight).
+
+- PillowEngine: 같은 원본을 여러 스레드가 요청해도 decode_image는 한 번이고, 기다린
+  스레드도 모두 결과를 받는다. 디코드가 실패하면 맡았던 표시를 풀어 다음 요청이 다시 시도한다.
+- 창: 진행 중인 렌디션을 다시 요청하면 새 작업을 만들지 않고 그 결과를 기다리며, 실패한
+  작업은 키를 놓아 다음 요청이 새로 렌더링한다. 작업은 실행하지 않고 결과를 직접 전달한다.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+from PIL import Image
+from PySide6.QtGui import QImage
+
+import decoder_engines
+from decoder_engines import PillowEngine, RenderJob
+from image_cache import BytesCache, ImageCache
+from resample_policy import ResamplePolicy
+
+THREADS = 8
+JOIN_TIMEOUT_S = 10
+
+
+@pytest.fixture
+def image_path(tmp_path):
+    path = tmp_path / "photo.png"
+    Image.new("RGB", (800, 600), (10, 200, 30)).save(path)
+    return str(path)
+
+
+@pytest.fixture
+def gated_decode(monkeypatch):
+    """decode_image를 세면서, gate가 열릴 때까지 첫 디코드를 붙잡아 둔다."""
+    calls = []
+    gate = threading.Event()
+    original = decoder_engines.decode_image
+
+    def decode_image(*args, **kwargs):
+        calls.append(args[0])
+        gate.wait(JOIN_TIMEOUT_S)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(decoder_engines, "decode_image", decode_image)
+    return calls, gate
+
+
+def _render_concurrently(engine, jobs):
+    results, errors = [None] * len(jobs), []
+
+    def run(slot, job):
+        try:
+            results[slot] = engine.render(job)
+        except Exception as e:  # noqa: BLE001 - 스레드 안의 예외를 테스트로 넘긴다
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(slot, job)) for slot, job in enumerate(jobs)]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+
+def _join(threads):
+    for thread in threads:
+        thread.join(JOIN_TIMEOUT_S)
+        assert not thread.is_alive(), "기다리던 스레드가 깨어나지 않음"
+
+
+def test_concurrent_renders_decode_the_source_once(qapp, image_path, gated_decode):
+    calls, gate = gated_decode
+    engine = PillowEngine(ImageCache(max_size=4, max_memory_mb=64), ResamplePolicy())
+    bytes_cache = BytesCache()
+    signature = (1.0, 1)
+    # 로드 중 창 크기가 바뀐 것처럼 같은 원본의 서로 다른 크기 렌디션을 함께 요청한다
+    sizes = [(200 + 20 * slot, 150 + 15 * slot) for slot in range(THREADS)]
+    jobs = [RenderJob(image_path, signature, size, bytes_cache) for size in sizes]
+
+    threads, results, errors = _render_concurrently(engine, jobs)
+    time.sleep(0.2)  # 모두 원본 캐시를 놓치고 첫 디코드를 기다리게 한다
+    gate.set()
+    _join(threads)
+
+    assert not errors, errors
+    assert calls == [image_path]
+    for (width, _), result in zip(sizes, results):
+        assert result is not None and result.qimage.width() == width
+    assert sum(result.decoded for result in results) == 1
+    assert not engine._decoding
+
+
+def test_failed_decode_releases_the_claim(qapp, image_path, monkeypatch):
+    original = decoder_engines.decode_image
+    calls = []
+
+    def decode_image(*args, **kwargs):
+        calls.append(args[0])
+        if len(calls) == 1:
+            raise OSError("디스크 읽기 실패")
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(decoder_engines, "decode_image", decode_image)
+    engine = PillowEngine(ImageCache(max_size=4, max_memory_mb=64), ResamplePolicy())
+    job = RenderJob(image_path, (1.0, 1), (200, 150), BytesCache())
+
+    with pytest.raises(OSError):
+        engine.render(job)
+    assert not engine._decoding
+    assert not engine.is_cached(job)
+
+    result = engine.render(RenderJob(image_path, (1.0, 1), (200, 150), BytesCache()))
+    assert result.decoded and result.qimage.width() == 200
+    assert len(calls) == 2
+
+
+def test_waiters_of_a_failed_decode_do_not_hang(qapp, image_path, monkeypatch):
+    gate = threading.Event()
+    original = decoder_engines.decode_image
+    failed = []
+
+    def decode_image(*args, **kwargs):
+        if not failed:
+            failed.append(args[0])
+            gate.wait(JOIN_TIMEOUT_S)
+            raise OSError("디스크 읽기 실패")
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(decoder_engines, "decode_image", decode_image)
+    engine = PillowEngine(ImageCache(max_size=4, max_memory_mb=64), ResamplePolicy())
+    bytes_cache = BytesCache()
+    jobs = [RenderJob(image_path, (1.0, 1), (200, 150), bytes_cache) for _ in range(THREADS)]
+
+    threads, results, errors = _render_concurrently(engine, jobs)
+    time.sleep(0.2)
+    gate.set()
+    _join(threads)
+
+    # 실패는 맡았던 스레드 하나에만 돌아가고, 기다리던 스레드는 다시 디코딩해 결과를 받는다
+    assert len(errors) == 1 and isinstance(errors[0], OSError)
+    assert sum(result is not None for result in results) == THREADS - 1
+    assert not engine._decoding
+
+
+def _tasks_for(window, cache_key):
+    return {id(task) for task, _ in window.thread_pool.started if task._request_key == cache_key}
+
+
+def test_window_attaches_repeat_requests_to_the_pending_render(recording_window):
+    window = recording_window
+    from image_viewer_window import PREFETCH_PRIORITY
+
+    # 프리페치가 아직 큐에 있는 이미지로 이동하고, 다른 곳에 들렀다가 다시 돌아온다
+    window.prefetch_index(4)
+    cache_key = window._rendition_key_for(4)
+    window.show_image(4)
+    window.show_image(5)
+    window.show_image(4)
+
+    assert len(_tasks_for(window, cache_key)) == 1
+    # 표시 요청이 붙으면서 큐의 프리페치를 표시 우선순위로 다시 넣는다
+    priorities = [priority for task, priority in window.thread_pool.started if task._request_key == cache_key]
+    assert priorities == [PREFETCH_PRIORITY, 0]
+    waiters = window._in_flight[cache_key].waiters
+    assert len(waiters) == 2 and window._load_seq in waiters
+
+    path = window.images[4]
+    window._on_render_loaded(cache_key, path, QImage(800, 600, QImage.Format.Format_RGB888), True)
+    assert window.current_path == path
+    assert cache_key in window.resize_cache and cache_key not in window._in_flight
+
+
+def test_window_failed_render_releases_the_key(recording_window):
+    window = recording_window
+    window.prefetch_index(3)
+    cache_key = window._rendition_key_for(3)
+    window._on_render_error(cache_key, "이미지를 열 수 없습니다")
+    assert cache_key not in window._in_flight
+
+    window.show_image(3)
+    assert len(_tasks_for(window, cache_key)) == 2  # 실패한 작업에 붙지 않고 새로 렌더링한다
+    assert window._load_seq in window._in_flight[cache_key].waiters
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import time
+
+from PIL import Image
+from PySide6.QtGui import QImage
+
+from signature_cache import SignatureCache
+from thumbnail_grid import ThumbnailProvider
+
+READY_TIMEOUT_S = 10
+
+
+def _wait_for(qapp, provider: ThumbnailProvider, path: str):
+    deadline = time.monotonic() + READY_TIMEOUT_S
+    while time.monotonic() < deadline:
+        qapp.processEvents()
+        pixmap = provider.get(path)
+        if pixmap is not None:
+            return pixmap
+        time.sleep(0.01)
+    return None
+
+
+def _settle(qapp, provider: ThumbnailProvider) -> None:
+    provider._pool.waitForDone()
+    qapp.processEvents()
+
+
+def test_thumbnail_is_rebuilt_when_file_changes(qapp, tmp_path):
+    path = tmp_path / "photo.png"
+    Image.new("RGB", (300, 200), (255, 0, 0)).save(path)
+    signatures = SignatureCache()
+    provider = ThumbnailProvider(signatures, size=64)
+
+    provider.request([str(path)])
+    assert _wait_for(qapp, provider, str(path)).toImage().pixelColor(32, 20).red() == 255
+
+    Image.new("RGB", (200, 300), (0, 0, 255)).save(path)  # 밖에서 다른 내용으로 다시 저장
+    signatures.invalidate(str(path))  # 감시 알림/유효 시간 만료와 같은 효과
+    assert provider.get(str(path)) is None
+    provider.request([str(path)])
+    pixmap = _wait_for(qapp, provider, str(path))
+    assert pixmap is not None and pixmap.height() > pixmap.width()
+    assert pixmap.toImage().pixelColor(20, 32).blue() == 255
+
+
+def test_failed_thumbnail_is_retried_after_file_changes(qapp, tmp_path):
+    path = tmp_path / "copying.png"
+    path.write_bytes(b"\x89PNG\r\n\x1a\n")  # 아직 복사 중인 파일처럼 잘린 PNG
+    signatures = SignatureCache()
+    provider = ThumbnailProvider(signatures, size=64)
+
+    provider.request([str(path)])
+    _settle(qapp, provider)
+    assert provider.get(str(path)) is None and str(path) in provider._failed
+
+    assert not provider._needs(str(path), signatures.get(str(path)))  # 같은 서명이면 다시 시도하지 않는다
+
+    Image.new("RGB", (300, 200), (0, 255, 0)).save(path)
+    signatures.invalidate(str(path))
+    provider.request([str(path)])
+    assert _wait_for(qapp, provider, str(path)) is not None
+    assert str(path) not in provider._failed
+
+
+def test_thumbnail_follows_view_orientation(qapp, tmp_path):
+    path = tmp_path / "landscape.png"
+    Image.new("RGB", (300, 200), (255, 0, 0)).save(path)
+    signatures = SignatureCache()
+    provider = ThumbnailProvider(signatures, size=64)
+    signature = signatures.get(str(path))
+
+    provider.set_view_orientation(str(path), 6)  # 화면에서 시계 방향으로 돌린 상태
+    provider.request([str(path)])
+    pixmap = _wait_for(qapp, provider, str(path))
+    assert pixmap is not None and pixmap.height() > pixmap.width()
+
+    # 돌리기 전 방향으로 만든 결과가 늦게 도착하면 버린다
+    provider.invalidate(str(path))
+    provider.set_view_orientation(str(path), 6)
+    stale = QImage(64, 42, QImage.Format.Format_RGB888)
+    provider._on_ready(provider._generation[0], str(path), signature, 1, stale)
+    assert provider.get(str(path)) is None
@@ -0,0 +1,77 @@
+"""JPEG가 아닌 파일을 화면에서만 돌릴 때 이전 방향의 렌더링 결과가 새 방향을 덮지 않는지."""
+
+from __future__ import annotations
+
+from PySide6.QtGui import QImage, QPixmap
+
+from rendering import fit_size
+
+
+def _rendition(task, width: int, height: int) -> QImage:
+    """task가 요청한 칸에 맞춘 (width x height 비율) 렌디션."""
+    fit_width, fit_height = fit_size(width, height, *task._target_size)
+    qimage = QImage(fit_width, fit_height, QImage.Format.Format_RGB888)
+    qimage.fill(0)
+    return qimage
+
+
+def _last_task(window, cache_key):
+    return next(task for task, _ in reversed(window.thread_pool.started) if task._request_key == cache_key)
+
+
+def test_stale_refine_result_does_not_replace_rotated_view(recording_window, monkeypatch):
+    window = recording_window
+    path = window.images[0]
+    monkeypatch.setattr(window.navigation, "idle_ms", lambda: 60_000.0)
+
+    # 빠른 필터 결과로 먼저 표시되고, 머무는 동안 원본 품질로 다시 렌더링을 건다
+    cache_key = window._rendition_key_for(0)
+    window._on_render_loaded(cache_key, path, _rendition(_last_task(window, cache_key), 640, 480), False)
+    assert window.current_path == path
+    window._refine_current()
+    refine_task = _last_task(window, cache_key)
+
+    window.transform_current_image("rotate_cw")
+    rotated_key = window._rendition_key_for(0)
+    assert rotated_key != cache_key
+    rotated_task = _last_task(window, rotated_key)
+    assert rotated_task._orientation == 6
+
+    # 회전 전에 걸린 렌더링이 늦게 도착해도 버린다
+    window._on_render_loaded(cache_key, path, _rendition(refine_task, 640, 480), True)
+    assert window.current_pixmap.height() > window.current_pixmap.width()
+    assert cache_key not in window.resize_cache
+    assert rotated_key in window._in_flight
+
+    window._on_render_loaded(rotated_key, path, _rendition(rotated_task, 480, 640), True)
+    assert window.current_pixmap.height() > window.current_pixmap.width()
+    assert rotated_key in window.resize_cache and rotated_key not in window._in_flight
+
+
+def test_rotating_back_returns_to_the_plain_key(recording_window):
+    window = recording_window
+    path = window.images[0]
+    cache_key = window._rendition_key_for(0)
+    window._on_render_loaded(cache_key, path, _rendition(_last_task(window, cache_key), 640, 480), True)
+
+    window.transform_current_image("flip_horizontal")
+    assert window._rendition_key_for(0) != cache_key
+    window.transform_current_image("flip_horizontal")
+    assert path not in window._view_orientations
+    assert window._rendition_key_for(0) == cache_key
+    assert cache_key in window.resize_cache  # 두 번 뒤집은 렌디션이 원래 키로 돌아온다
+
+
+def test_rotation_turns_the_cached_thumbnail(recording_window):
+    window = recording_window
+    path = window.images[0]
+    cache_key = window._rendition_key_for(0)
+    window._on_render_loaded(cache_key, path, _rendition(_last_task(window, cache_key), 640, 480), True)
+    thumbnail = QImage(64, 48, QImage.Format.Format_RGB888)
+    thumbnail.fill(0)
+    window.thumbnails._cache[path] = (window.signatures.get(path), 1, QPixmap.fromImage(thumbnail))
+
+    window.transform_current_image("rotate_cw")
+    pixmap = window.thumbnails.get(path)
+    assert pixmap is not None and (pixmap.width(), pixmap.height()) == (48, 64)
+    assert window.thumbnails._view_orientations[path] == window._view_orientations[path] == 6
@@ -0,0 +1,342 @@
+from __future__ import annotations
+
+import math
+import os
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from PIL.ImageQt import ImageQt
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QObject, QRunnable, QSize, Qt, QThreadPool, QTimer, Signal
+from PySide6.QtGui import QColor, QImage, QPixmap, QTransform
+from PySide6.QtWidgets import QAbstractItemView, QListView
+
+from constants import (
+    THUMBNAIL_BATCH_SIZE,
+    THUMBNAIL_CACHE_MIN,
+    THUMBNAIL_CACHE_PAGES,
+    THUMBNAIL_CELL_PADDING,
+    THUMBNAIL_SIZE,
+    THUMBNAIL_WORKERS,
+)
+from orientation import apply_orientation
+from signature_cache import Signature, SignatureCache
+from thumbnails import load_thumbnail
+
+GRID_STYLE = (
+    "QListView { background-color: #000000; color: #aaa; border: none; font-size: 11px; }"
+    "QListView::item:selected { background-color: rgba(53, 120, 229, 0.35); }"
+    "QListView::item:hover { background-color: rgba(255, 255, 255, 0.08); }"
+)
+
+
+class _ThumbnailSignals(QObject):
+    ready = Signal(int, str, object, int, QImage)  # (세대, 경로, 만들 때의 서명, 적용한 화면 방향, 썸네일)
+    failed = Signal(int, str, object)
+
+
+class _ThumbnailBatchTask(QRunnable):
+    """썸네일 여러 장을 한 작업으로 묶어 만든다.
+
+    스크롤로 우선순위가 바뀌면 generation이 올라가고, 이 배치는 남은 항목을
+    건너뛰고 끝난다. generation은 [int] 한 칸짜리 리스트로 공유해 GUI 스레드가
+    바꾼 값을 워커가 락 없이 읽는다(CPython에서 원자적).
+    """
+
+    def __init__(
+        self, generation: int, current_generation: List[int], paths: List[Tuple[str, Signature, int]], size: int
+    ):
+        super().__init__()
+        self.signals = _ThumbnailSignals()
+        self._generation = generation
+        self._current_generation = current_generation
+        self._paths = paths
+        self._size = size
+
+    def run(self) -> None:
+        for file_path, signature, orientation in self._paths:
+            if self._current_generation[0] != self._generation:
+                return
+            try:
+                qimage = ImageQt(apply_orientation(load_thumbnail(file_path, self._size), orientation)).copy()
+            except Exception:
+                self.signals.failed.emit(self._generation, file_path, signature)
+                continue
+            self.signals.ready.emit(self._generation, file_path, signature, orientation, qimage)
+
+
+class ThumbnailProvider(QObject):
+    """썸네일 전용 캐시 + 배치 생성기 (격자 보기와 스크러버가 공유).
+
+    원본/리사이즈 캐시와 섞이지 않도록 별도 LRU를 쓰고, 메인 디코드와 경쟁하지
+    않게 작은 전용 스레드 풀에서 만든다. 캐시 크기는 화면에 보이는 셀 수에 맞춰
+    조정되므로 폴더 크기와 무관하게 메모리가 제한된다. 다른 캐시 계층처럼 항목은
+    만들 때의 파일 서명과 함께 두어, 밖에서 파일이 바뀌면 다시 만들고 실패했던 파일도
+    서명이 바뀌면(예: 복사가 끝나면) 다시 시도한다. 화면에서만 돌린 방향(JPEG가 아닌
+    파일의 회전/뒤집기)은 set_view_orientation으로 받아 새로 만드는 썸네일에도 적용한다.
+    """
+
+    thumbnail_ready = Signal(str)
+
+    def __init__(self, signatures: SignatureCache, parent: Optional[QObject] = None, size: int = THUMBNAIL_SIZE):
+        super().__init__(parent)
+        self.size = size
+        self._signatures = signatures
+        # 경로 → (만들 때의 서명, 적용한 화면 방향, 썸네일)
+        self._cache: "OrderedDict[str, Tuple[Signature, int, QPixmap]]" = OrderedDict()
+        self._capacity = THUMBNAIL_CACHE_MIN
+        self._failed: Dict[str, Signature] = {}  # 경로 → 실패했을 때의 서명
+        self._view_orientations: Dict[str, int] = {}  # 폴더를 옮겨도 유지 (창의 _view_orientations와 같다)
+        self._generation = [0]
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(THUMBNAIL_WORKERS)
+
+    def get(self, file_path: str) -> Optional[QPixmap]:
+        entry = self._cache.get(file_path)
+        if entry is None:
+            return None
+        if entry[0] != self._signatures.get(file_path) or entry[1] != self._view_orientations.get(file_path, 1):
+            # 외부에서 파일이 수정/교체됐거나 다른 방향으로 만든 것: 다음 request에서 다시 만든다
+            del self._cache[file_path]
+            return None
+        self._cache.move_to_end(file_path)
+        return entry[2]
+
+    def _needs(self, file_path: str, signature: Signature) -> bool:
+        entry = self._cache.get(file_path)
+        if entry is not None and entry[0] == signature and entry[1] == self._view_orientations.get(file_path, 1):
+            return False
+        return self._failed.get(file_path, object()) != signature
+
+    def set_capacity(self, capacity: int) -> None:
+        self._capacity = max(THUMBNAIL_CACHE_MIN, capacity)
+        self._evict()
+
+    def _evict(self) -> None:
+        while len(self._cache) > self._capacity:
+            self._cache.popitem(last=False)
+
+    def request(self, paths: Iterable[str]) -> None:
+        """우선순위 순서대로 받은 경로의 썸네일을 배치로 생성.
+
+        호출할 때마다 이전 요청은 무효화되므로, 스크롤 중에는 가장 최근 화면
+        기준의 순서만 살아남는다.
+        """
+        self._generation[0] += 1
+        generation = self._generation[0]
+        pending = []
+        for file_path in dict.fromkeys(paths):
+            signature = self._signatures.get(file_path)
+            if self._needs(file_path, signature):
+                pending.append((file_path, signature, self._view_orientations.get(file_path, 1)))
+        for start in range(0, len(pending), THUMBNAIL_BATCH_SIZE):
+            batch = pending[start:start + THUMBNAIL_BATCH_SIZE]
+            task = _ThumbnailBatchTask(generation, self._generation, batch, self.size)
+            task.signals.ready.connect(self._on_ready)
+            task.signals.failed.connect(self._on_failed)
+            self._pool.start(task)
+
+    def cancel(self) -> None:
+        self._generation[0] += 1
+
+    def _on_ready(
+        self, generation: int, file_path: str, signature: Signature, orientation: int, qimage: QImage
+    ) -> None:
+        if orientation != self._view_orientations.get(file_path, 1):
+            return  # 만드는 사이에 화면 방향이 바뀌었다
+        self._cache[file_path] = (signature, orientation, QPixmap.fromImage(qimage))
+        self._cache.move_to_end(file_path)
+        self._failed.pop(file_path, None)
+        self._evict()
+        self.thumbnail_ready.emit(file_path)
+
+    def _on_failed(self, generation: int, file_path: str, signature: Signature) -> None:
+        self._failed[file_path] = signature
+
+    def transform(self, file_path: str, transform: QTransform, signature: Signature = None) -> None:
+        """캐시된 썸네일을 다시 만들지 않고 회전/뒤집기만 적용 (정사각형 칸이라 크기는 그대로 맞는다).
+
+        방향 태그를 고쳐 파일 서명이 바뀌었으면 새 서명(signature)으로 옮긴다.
+        """
+        entry = self._cache.get(file_path)
+        if entry is not None:
+            self._cache[file_path] = (
+                entry[0] if signature is None else signature,
+                self._view_orientations.get(file_path, 1),
+                entry[2].transformed(transform),
+            )
+            self.thumbnail_ready.emit(file_path)
+
+    def set_view_orientation(self, file_path: str, orientation: int) -> None:
+        """파일은 그대로 두고 화면에서만 돌린 방향. 캐시된 썸네일은 transform으로 함께 돌린다."""
+        if orientation == 1:
+            self._view_orientations.pop(file_path, None)
+        else:
+            self._view_orientations[file_path] = orientation
+
+    def invalidate(self, file_path: str) -> None:
+        self._cache.pop(file_path, None)
+        self._failed.pop(file_path, None)
+        self._view_orientations.pop(file_path, None)
+
+    def clear(self) -> None:
+        self.cancel()
+        self._cache.clear()
+        self._failed.clear()
+
+    def memory_usage(self) -> int:
+        return sum(
+            pixmap.width() * pixmap.height() * max(1, pixmap.depth() // 8) for _, _, pixmap in self._cache.values()
+        )
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+class ThumbnailModel(QAbstractListModel):
+    """self.images를 그대로 보여주는 모델. 썸네일은 데이터 요청 시점에 캐시에서만 읽는다."""
+
+    def __init__(self, provider: ThumbnailProvider, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._provider = provider
+        self._paths: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._placeholder = QPixmap(provider.size, provider.size)
+        self._placeholder.fill(QColor("#1e1e1e"))
+        provider.thumbnail_ready.connect(self._on_thumbnail_ready)
+
+    def set_paths(self, paths: List[str]) -> None:
+        self.beginResetModel()
+        self._paths = list(paths)
+        self._rows = {file_path: row for row, file_path in enumerate(self._paths)}
+        self.endResetModel()
+
+    def path_at(self, row: int) -> str:
+        return self._paths[row]
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._paths)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        file_path = self._paths[index.row()]
+        if role == Qt.ItemDataRole.DecorationRole:
+            return self._provider.get(file_path) or self._placeholder
+        if role == Qt.ItemDataRole.DisplayRole:
+            return os.path.basename(file_path)
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return file_path
+        return None
+
+    def _on_thumbnail_ready(self, file_path: str) -> None:
+        row = self._rows.get(file_path)
+        if row is not None:
+            model_index = self.index(row)
+            self.dataChanged.emit(model_index, model_index, [Qt.ItemDataRole.DecorationRole])
+
+
+class ThumbnailGrid(QListView):
+    """가상화된 썸네일 격자.
+
+    QListView(균일 크기 아이콘 모드)는 보이는 셀만 그리므로 5만 장 폴더에서도
+    위젯은 한 개뿐이다. 썸네일 생성은 스크롤이 잠깐 멈출 때마다 보이는 셀을
+    스크롤 방향 순서로 먼저, 그다음 진행 방향의 한 화면을 요청한다.
+    """
+
+    image_activated = Signal(int)
+
+    def __init__(self, provider: ThumbnailProvider, parent=None):
+        super().__init__(parent)
+        self._provider = provider
+        self._model = ThumbnailModel(provider, self)
+        self.setModel(self._model)
+        self.setStyleSheet(GRID_STYLE)
+
+        cell = provider.size + THUMBNAIL_CELL_PADDING
+        self.setViewMode(QListView.ViewMode.IconMode)
+        self.setIconSize(QSize(provider.size, provider.size))
+        self.setGridSize(QSize(cell, cell + 18))
+        self.setUniformItemSizes(True)
+        self.setMovement(QListView.Movement.Static)
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+        self.setWrapping(True)
+        self.setSpacing(0)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.setTextElideMode(Qt.TextElideMode.ElideMiddle)
+
+        self._last_scroll_value = 0
+        self._scroll_direction = 1
+        self._schedule_timer = QTimer(self)
+        self._schedule_timer.setSingleShot(True)
+        self._schedule_timer.setInterval(40)
+        self._schedule_timer.timeout.connect(self._request_visible)
+
+        self.verticalScrollBar().valueChanged.connect(self._on_scrolled)
+        self.activated.connect(lambda model_index: self.image_activated.emit(model_index.row()))
+
+    def set_images(self, images: List[str], current_index: int) -> None:
+        self._model.set_paths(images)
+        if images:
+            model_index = self._model.index(min(current_index, len(images) - 1))
+            self.setCurrentIndex(model_index)
+            self.scrollTo(model_index, QAbstractItemView.ScrollHint.PositionAtCenter)
+        self._schedule_timer.start()
+
+    def _on_scrolled(self, value: int) -> None:
+        if value != self._last_scroll_value:
+            self._scroll_direction = 1 if value > self._last_scroll_value else -1
+            self._last_scroll_value = value
+        self._schedule_timer.start()
+
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        self._schedule_timer.start()
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self._schedule_timer.start()
+
+    def hideEvent(self, event) -> None:
+        super().hideEvent(event)
+        self._provider.cancel()
+
+    def _layout_metrics(self):
+        grid = self.gridSize()
+        columns = max(1, self.viewport().width() // max(1, grid.width()))
+        visible_lines = math.ceil(self.viewport().height() / max(1, grid.height())) + 1
+        first_line = self.verticalScrollBar().value() // max(1, grid.height())
+        return columns, visible_lines, first_line
+
+    def _request_visible(self) -> None:
+        count = self._model.rowCount()
+        if not count or not self.isVisible():
+            return
+        columns, visible_lines, first_line = self._layout_metrics()
+        page = columns * visible_lines
+        first = first_line * columns
+        last = min(count, first + page)
+
+        visible = list(range(first, last))
+        if self._scroll_direction > 0:
+            ahead = range(last, min(count, last + page))
+            behind = range(first - 1, max(-1, first - columns - 1), -1)
+        else:
+            visible.reverse()
+            ahead = range(first - 1, max(-1, first - page - 1), -1)
+            behind = range(last, min(count, last + columns))
+
+        # 보이는 화면 + 앞쪽 한 화면 + 뒤쪽 한 줄을 담을 만큼만 캐시를 유지
+        self._provider.set_capacity(page * THUMBNAIL_CACHE_PAGES)
+        rows = visible + list(ahead) + list(behind)
+        self._provider.request(self._model.path_at(row) for row in rows)
+
+    def keyPressEvent(self, event) -> None:
+        if event.key() in (Qt.Key.Key_G, Qt.Key.Key_Escape):
+            # 격자 닫기는 창이 처리하도록 넘긴다 (G가 키보드 검색으로 소비되지 않게)
+            event.ignore()
+            return
+        if event.key() in (Qt.Key.Key_Return, Qt.Key.Key_Enter) and self.currentIndex().isValid():
+            self.image_activated.emit(self.currentIndex().row())
+            return
+        super().keyPressEvent(event)
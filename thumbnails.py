@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import io
+from typing import Optional
+
+from PIL import ExifTags, Image
+
+from archive import open_image_source
+from color_management import to_display_colors
+from constants import MAX_MEMORY_MB
+from orientation import apply_orientation, exif_orientation
+from rendering import prepare_for_resize, to_display_mode
+from streaming_decode import decode_downscaled
+
+_JPEG_INTERCHANGE_FORMAT = 0x0201
+_JPEG_INTERCHANGE_FORMAT_LENGTH = 0x0202
+_EXIF_HEADER_LENGTH = 6  # APP1 페이로드 앞의 b"Exif\0\0"; IFD 오프셋은 그 뒤 TIFF 헤더 기준
+
+# 임베디드 썸네일이 요청 크기보다 이 비율 이상 작으면 흐릿하게 확대되므로 쓰지 않는다
+_MIN_EMBEDDED_RATIO = 0.75
+
+
+def _embedded_thumbnail(opened: Image.Image, size: int) -> Optional[Image.Image]:
+    """EXIF IFD1에 들어 있는 JPEG 썸네일을 꺼낸다 (픽셀 디코딩 없이 헤더만 읽음)."""
+    raw_exif = opened.info.get("exif")
+    if not raw_exif:
+        return None
+    try:
+        ifd1 = opened.getexif().get_ifd(ExifTags.IFD.IFD1)
+    except Exception:
+        return None
+    offset = ifd1.get(_JPEG_INTERCHANGE_FORMAT)
+    length = ifd1.get(_JPEG_INTERCHANGE_FORMAT_LENGTH)
+    if not offset or not length:
+        return None
+    start = _EXIF_HEADER_LENGTH + offset
+    data = raw_exif[start:start + length]
+    try:
+        with Image.open(io.BytesIO(data)) as embedded:
+            if max(embedded.size) < size * _MIN_EMBEDDED_RATIO:
+                return None
+            embedded.load()
+            return embedded.copy()
+    except Exception:
+        return None
+
+
+def load_thumbnail(file_path: str, size: int) -> Image.Image:
+    """size x size 안에 들어가는 썸네일을 가능한 한 싸게 만든다.
+
+    1) EXIF 임베디드 썸네일이 충분히 크면 그대로 쓰고, 2) 아니면 JPEG는 DCT
+    단계 축소 디코딩(draft)으로 원본 해상도 디코딩 자체를 피한다. 3) 원본 캐시
+    예산을 넘는 거대 PNG/TIFF/BMP는 띠 단위로 줄이며 디코딩한다.
+    """
+    source = open_image_source(file_path)
+    reduced = decode_downscaled(source, (size, size), MAX_MEMORY_MB * 1024 * 1024)
+    if reduced is not None:
+        image = prepare_for_resize(reduced)
+        image.thumbnail((size, size), Image.Resampling.BILINEAR)
+        return to_display_mode(to_display_colors(image, reduced.info.get("icc_profile")))
+    if not isinstance(source, str):
+        source.seek(0)
+    with Image.open(source) as opened:
+        # 임베디드 썸네일에는 프로파일/방향 정보가 없으므로 원본의 것으로 맞춘다
+        icc_profile = opened.info.get("icc_profile")
+        orientation = exif_orientation(opened)
+        image = _embedded_thumbnail(opened, size)
+        if image is None:
+            opened.draft(None, (size, size))
+            image = prepare_for_resize(opened.copy())
+    image.thumbnail((size, size), Image.Resampling.BILINEAR)
+    return to_display_mode(to_display_colors(apply_orientation(image, orientation), icc_profile))
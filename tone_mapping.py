@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Tuple
+
+import numpy as np
+from PIL import Image
+
+from constants import TONE_MAP_HIGH_PERCENTILE, TONE_MAP_LOW_PERCENTILE, TONE_MAP_MODE
+
+# 고비트 심도(16비트 정수, 32비트 정수/실수) 단일 채널 모드.
+# Pillow의 convert("L"/"RGBA")는 이 값들을 0~255로 잘라 버려 대부분 하얗게 날아가거나
+# 새까맣게 보이므로, 실제 값 분포에 맞춰 8비트로 늘려(stretch) 표시한다.
+HIGH_BIT_DEPTH_MODES = ("I;16", "I;16L", "I;16B", "I;16N", "I", "F")
+
+_UINT16_MODES = ("I;16", "I;16L", "I;16B", "I;16N")
+
+
+def _stretch_bounds(values: np.ndarray) -> Tuple[float, float]:
+    """표시 범위로 늘릴 [low, high] 구간을 계산.
+
+    "auto_levels"는 최솟값~최댓값을 그대로 쓰고, "percentile"은 양 끝의
+    소수 이상치(핫 픽셀, 포화 영역)를 잘라 대비를 확보한다.
+    """
+    finite = values[np.isfinite(values)] if values.dtype.kind == "f" else values.ravel()
+    if finite.size == 0:
+        return 0.0, 1.0
+    if TONE_MAP_MODE == "auto_levels":
+        low, high = float(finite.min()), float(finite.max())
+    else:
+        low, high = (float(v) for v in np.percentile(finite, (TONE_MAP_LOW_PERCENTILE, TONE_MAP_HIGH_PERCENTILE)))
+    if high <= low:
+        high = low + 1.0
+    return low, high
+
+
+@lru_cache(maxsize=32)
+def _uint16_lut(low: int, high: int) -> np.ndarray:
+    """16비트 값 → 8비트 표시값 룩업 테이블 (같은 구간이 반복되는 폴더에서 재사용)."""
+    levels = np.arange(65536, dtype=np.float32)
+    scaled = (levels - low) * (255.0 / (high - low))
+    return np.clip(scaled, 0, 255).astype(np.uint8)
+
+
+def tone_map_to_l(image: Image.Image) -> Image.Image:
+    """고비트 심도 단일 채널 이미지를 8비트 그레이스케일로 정규화.
+
+    축소가 끝난 렌디션에 적용하므로 비용은 원본이 아닌 화면 픽셀 수에 비례한다.
+    """
+    values = np.asarray(image)
+    low, high = _stretch_bounds(values)
+    if image.mode in _UINT16_MODES:
+        lut = _uint16_lut(int(low), int(np.ceil(high)))
+        return Image.fromarray(lut[values.astype(np.uint16, copy=False)])
+
+    values = np.nan_to_num(values.astype(np.float32, copy=False), nan=low, posinf=high, neginf=low)
+    scaled = (values - low) * (255.0 / (high - low))
+    return Image.fromarray(np.clip(scaled, 0, 255).astype(np.uint8))
+
+
+@lru_cache(maxsize=1)
+def _cmyk_lut() -> np.ndarray:
+    """(잉크 양, K 양) → 채널 값 테이블: 255 * (1 - ink) * (1 - k)."""
+    ink = np.arange(256, dtype=np.uint32)
+    return ((255 - ink[:, None]) * (255 - ink[None, :]) // 255).astype(np.uint8)
+
+
+def cmyk_to_rgb(image: Image.Image) -> Image.Image:
+    """CMYK를 곱셈 모델로 RGB 변환.
+
+    Pillow의 기본 변환은 K를 채널 값에서 빼기만 해 어두운 영역이 뭉개지므로,
+    잉크 흡수를 곱으로 합성하는 256x256 테이블 조회로 대체한다.
+    """
+    cmyk = np.asarray(image)
+    lut = _cmyk_lut()
+    key = cmyk[..., 3]
+    rgb = np.stack([lut[cmyk[..., channel], key] for channel in range(3)], axis=-1)
+    return Image.fromarray(rgb)
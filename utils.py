@@ -8,6 +8,7 @@ from typing import Any, List, Optional, Tuple
 from constants import SUPPORTED_EXTENSIONS
 
 _NATURAL_CHUNK_RE = re.compile(r"(\d+)")
+_PATH_SEPARATOR_RE = re.compile(r"[\\/]")
 
 
 def resource_path(relative_path: str) -> str:
@@ -33,12 +34,31 @@ def natural_sort_key(path: str) -> tuple:
     return (tuple(key), name)
 
 
+def natural_path_key(path: str, root: str) -> tuple:
+    """root 기준 상대 경로를 폴더 단위로 자연 정렬하기 위한 키 (하위 폴더 포함 모드).
+
+    각 경로 구성 요소를 natural_sort_key로 비교하므로 "2024/9/..."가
+    "2024/10/..."보다 앞에 온다.
+    """
+    prefix = root if root.endswith(("/", os.sep)) else os.path.join(root, "")
+    # 스캐너/압축 파일 목록의 경로는 항상 root로 시작하므로 relpath(정규화 비용)를 피한다
+    relative = path[len(prefix):] if path.startswith(prefix) else os.path.relpath(path, root)
+    return tuple(natural_sort_key(part) for part in _PATH_SEPARATOR_RE.split(relative))
+
+
 def file_signature(path: str) -> Optional[Tuple[int, int]]:
     """파일의 mtime+size로 캐시 무효화 판단용 서명을 생성.
 
     캐시 키에 이 서명을 포함시키면, 외부에서 같은 경로의 파일이 교체/수정돼도
     자동으로 캐시 미스가 나 예전 내용을 계속 보여주는 문제를 막는다.
+    압축 파일 멤버("archive.zip!/a.jpg")는 압축 파일 mtime + 멤버 크기를 쓴다.
     """
+    if "!/" in path:
+        from archive import archive_pool, split_member_path  # archive가 utils를 임포트하므로 지연 임포트
+
+        member = split_member_path(path)
+        if member is not None:
+            return archive_pool.member_signature(*member)
     try:
         st = os.stat(path)
         return (st.st_mtime_ns, st.st_size)